@@ -0,0 +1,506 @@
+"""
+bench.py
+Benchmark every registered sorting algorithm across sizes and distributions
+Writes JSON and CSV results to the reports folder
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from array import array
+from datetime import datetime, timezone
+from src.sorting_factory import AUTO, SortingFactory
+from src.distributions import DISTRIBUTIONS, generate
+from src.adversarial import ADVERSARIES
+from src.complexity import (DEFAULT_TOLERANCE, METRICS, expected_exponent, geometric_sizes,
+                            profile_complexity)
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000, 200000]
+# Size ladder of --complexity as (start, factor, steps): 256 to 8192
+DEFAULT_LADDER = [256, 2, 6]
+# Cold-start scenarios timed by --import-time, each in a fresh interpreter
+IMPORT_SCENARIOS = {
+    'interpreter': "pass",
+    'import src': "import src",
+    'factory': "from src.sorting_factory import SortingFactory; SortingFactory()",
+    'first sort': "from src.sorting_factory import SortingFactory; "
+                  "SortingFactory().sort('tim', [3, 1, 2])",
+}
+# Child process run by --rss: loads a packed int32 input file, sorts it
+# once and prints the growth of its peak RSS (bytes) over the baseline
+# after imports and a warm-up sort
+RSS_SCRIPT = """
+import sys
+from array import array
+from src.sorting_factory import SortingFactory
+path, algorithm, backend = sys.argv[1:4]
+def peak_rss():
+    # VmHWM belongs to this process image; ru_maxrss can carry over the
+    # parent's peak across fork and exec on Linux
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+factory = SortingFactory()
+factory.sort(algorithm, [3, 1, 2], backend=backend)
+base = peak_rss()
+values = array('i')
+with open(path, 'rb') as f:
+    values.frombytes(f.read())
+if backend == 'python':
+    values = values.tolist()
+factory.sort(algorithm, values, backend=backend, trusted=True)
+print(peak_rss() - base)
+"""
+CSV_FIELDS = ['algorithm', 'distribution', 'size', 'ascending', 'runs',
+              'median_s', 'p95_s', 'min_s', 'elements_per_s', 'peak_bytes', 'error']
+
+
+def percentile(values, fraction):
+    """
+    Nearest-rank percentile
+
+    Args:
+        values: Non-empty list of numbers
+        fraction: Percentile as a fraction in [0, 1]
+
+    Returns:
+        The smallest value with at least fraction of values at or below it
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(len(ordered) * fraction))
+    return ordered[rank - 1]
+
+
+def projected_time(measured, size, complexity=None):
+    """
+    Project the run time at size from the previous measurements
+
+    Uses the growth exponent between the last two measurements, clamped to
+    [1, 2]. A single measurement is extrapolated with the algorithm's
+    advertised complexity class (quadratically for O(n^2) sorts), or
+    linearly when it advertises none.
+
+    Args:
+        measured: List of (size, median seconds) in increasing size order
+        size: Size to project to
+        complexity: Advertised class (SortingAlgorithm.complexity), or None
+
+    Returns:
+        Projected seconds (0 when nothing has been measured yet)
+    """
+    if not measured:
+        return 0.0
+    last_size, last_time = measured[-1]
+    exponent = 1.0
+    if complexity is not None and size > last_size:
+        exponent = expected_exponent(complexity, [last_size, size])
+    if len(measured) > 1:
+        prev_size, prev_time = measured[-2]
+        if 0 < prev_time < last_time < float('inf'):
+            exponent = math.log(last_time / prev_time) / math.log(last_size / prev_size)
+        exponent = min(2.0, max(1.0, exponent))
+    return last_time * (size / last_size) ** exponent
+
+
+def measure_peak(factory, algorithm, values, ascending, backend='python'):
+    """
+    Sort once under tracemalloc and return the peak memory allocated
+
+    The copy of the input made by the sort is included, so the result is
+    the auxiliary memory of the algorithm plus n list slots.
+
+    Args:
+        factory: SortingFactory instance
+        algorithm: Algorithm name
+        values: Input list
+        ascending: Sort order
+        backend: SortingFactory backend
+
+    Returns:
+        Peak bytes allocated during the sort
+    """
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        factory.sort(algorithm, values, ascending, backend=backend, trusted=True)
+        return tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+
+def time_sort(factory, algorithm, values, ascending, repeat, warmup, backend='python'):
+    """
+    Time repeated sorts of the same input
+
+    Args:
+        factory: SortingFactory instance
+        algorithm: Algorithm name
+        values: Input list
+        ascending: Sort order
+        repeat: Number of timed runs
+        warmup: Number of untimed runs before timing
+        backend: SortingFactory backend
+
+    Returns:
+        List of run times in seconds
+    """
+    for _ in range(warmup):
+        factory.sort(algorithm, values, ascending, backend=backend, trusted=True)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        factory.sort(algorithm, values, ascending, backend=backend, trusted=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run_benchmarks(algorithms, distributions, sizes, repeat=5, warmup=1,
+                   ascending=True, time_limit=2.0, seed=0, backend='python'):
+    """
+    Benchmark each algorithm on each distribution at increasing sizes
+
+    An algorithm stops growing on a distribution once its projected run
+    time at the next size exceeds time_limit (see projected_time), so
+    quadratic sorts do not stall the suite at 2x10^5 elements. A run
+    that fails (e.g. RecursionError) is recorded with its error and ends
+    the series.
+
+    Args:
+        algorithms: Algorithm names to benchmark
+        distributions: Distribution names from src.distributions
+        sizes: Input sizes in increasing order
+        repeat: Timed runs per measurement
+        warmup: Untimed runs per measurement
+        ascending: Sort order
+        time_limit: Projected seconds per run above which sizes are skipped
+        seed: Random seed for input generation
+        backend: SortingFactory backend ('python' or 'array')
+
+    Returns:
+        List of result dictionaries (see CSV_FIELDS)
+    """
+    factory = SortingFactory()
+    results = []
+    for algorithm in algorithms:
+        # 'auto' picks per input, so it has no class of its own
+        complexity = None if algorithm == AUTO else factory.algorithms[algorithm].complexity
+        for distribution in distributions:
+            measured = []
+            for size in sizes:
+                if projected_time(measured, size, complexity) > time_limit:
+                    print(f"  {algorithm:<15} {distribution:<14} {size:>7}  skipped")
+                    continue
+                values = generate(distribution, size, seed)
+                try:
+                    timings = time_sort(factory, algorithm, values, ascending, repeat, warmup,
+                                        backend)
+                    # Measured apart from the timed runs, which tracing slows
+                    peak = measure_peak(factory, algorithm, values, ascending, backend)
+                except (RecursionError, MemoryError) as e:
+                    # Record the failure and stop growing this series
+                    results.append({'algorithm': algorithm, 'distribution': distribution,
+                                    'size': size, 'ascending': ascending, 'runs': 0,
+                                    'error': type(e).__name__})
+                    print(f"  {algorithm:<15} {distribution:<14} {size:>7}  "
+                          f"failed: {type(e).__name__}")
+                    measured.append((size, float('inf')))
+                    continue
+                median = percentile(timings, 0.5)
+                result = {
+                    'algorithm': algorithm,
+                    'distribution': distribution,
+                    'size': size,
+                    'ascending': ascending,
+                    'runs': repeat,
+                    'median_s': median,
+                    'p95_s': percentile(timings, 0.95),
+                    'min_s': min(timings),
+                    'elements_per_s': size / median if median > 0 else 0.0,
+                    'peak_bytes': peak,
+                    'error': '',
+                }
+                results.append(result)
+                measured.append((size, median))
+                print(f"  {algorithm:<15} {distribution:<14} {size:>7}  "
+                      f"median {median * 1000:10.3f} ms  "
+                      f"p95 {result['p95_s'] * 1000:10.3f} ms  "
+                      f"{result['elements_per_s']:14,.0f} elem/s  "
+                      f"peak {peak / 1024:9.1f} KiB")
+    return results
+
+
+def measure_import_time(repeat=20):
+    """
+    Time cold starts of the package in fresh interpreters
+
+    Each scenario is run repeat times as "python -c"; the interpreter's
+    own start-up is included, so compare against the 'interpreter' row.
+
+    Args:
+        repeat: Interpreter launches per scenario
+
+    Returns:
+        Dictionary mapping scenario name to (median, min) seconds
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    timings = {}
+    for name, code in IMPORT_SCENARIOS.items():
+        runs = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, '-c', code], cwd=here, check=True)
+            runs.append(time.perf_counter() - start)
+        timings[name] = (percentile(runs, 0.5), min(runs))
+        print(f"  {name:<15} median {timings[name][0] * 1000:8.1f} ms  "
+              f"min {timings[name][1] * 1000:8.1f} ms")
+    return timings
+
+
+def measure_peak_rss(algorithms, distribution, size, seed=0):
+    """
+    Compare the peak RSS of one sort on the 'python' and 'array' backends
+
+    Each sort runs in a fresh interpreter reading the input from a packed
+    int32 file, so the figure covers the list or array built from it and
+    everything the sort allocates.
+
+    Args:
+        algorithms: Algorithm names
+        distribution: Distribution name from src.distributions
+        size: Input size
+        seed: Random seed for input generation
+
+    Returns:
+        Dictionary mapping (algorithm, backend) to peak RSS growth in bytes
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.NamedTemporaryFile(suffix='.bin', delete=False) as f:
+        f.write(array('i', generate(distribution, size, seed)).tobytes())
+    peaks = {}
+    try:
+        for algorithm in algorithms:
+            for backend in ('python', 'array'):
+                output = subprocess.run([sys.executable, '-c', RSS_SCRIPT, f.name, algorithm,
+                                         backend], cwd=here, check=True, capture_output=True,
+                                        text=True).stdout
+                peaks[algorithm, backend] = int(output)
+            python, compact = peaks[algorithm, 'python'], peaks[algorithm, 'array']
+            ratio = f"{python / compact:5.1f}x" if compact > 0 else "    -"
+            print(f"  {algorithm:<15} python {python / 2 ** 20:8.1f} MiB  "
+                  f"array {compact / 2 ** 20:8.1f} MiB  {ratio}")
+    finally:
+        os.unlink(f.name)
+    return peaks
+
+
+def report_complexity(algorithms, inputs, sizes, ascending=True, metric='time', repeat=3,
+                      time_limit=2.0, tolerance=DEFAULT_TOLERANCE, seed=0):
+    """
+    Fit growth exponents over a size ladder and print them against the
+    exponent of each algorithm's advertised class
+
+    Args:
+        algorithms: Algorithm names ('auto' is skipped)
+        inputs: Distribution and adversary names
+        sizes: Size ladder
+        ascending: Sort order
+        metric: 'time' or 'comparisons'
+        repeat: Timed runs per size
+        time_limit: Seconds per size above which a ladder stops
+        tolerance: Exponent excess over the advertised class that is flagged
+        seed: Random seed for input generation
+
+    Returns:
+        List of result dictionaries from src.complexity.profile_complexity
+    """
+    results = profile_complexity([name for name in algorithms if name != AUTO], inputs, sizes,
+                                 ascending, metric, repeat, time_limit, tolerance, seed)
+    for result in results:
+        exponent, expected = result['exponent'], result['expected_exponent']
+        fitted = f"n^{exponent:.2f}" if exponent is not None else "-"
+        advertised = f"{result['complexity']} (n^{expected:.2f})" if expected is not None \
+            else str(result['complexity'] or '-')
+        largest = result['sizes'][-1] if result['sizes'] else '-'
+        note = "FLAGGED" if result['flagged'] else ""
+        if result['error']:
+            note = f"{note} {result['error']}".strip()
+        print(f"  {result['name']:<15} {result['input']:<14} up to {largest:>6}  "
+              f"fitted {fitted:<8} advertised {advertised:<22} {note}")
+    return results
+
+
+def write_results(results, output_prefix, settings):
+    """
+    Write results to <output_prefix>.json and <output_prefix>.csv
+
+    Args:
+        results: List of result dictionaries
+        output_prefix: Output path without extension
+        settings: Benchmark settings recorded in the JSON metadata
+    """
+    directory = os.path.dirname(output_prefix)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    metadata = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'settings': settings,
+    }
+    with open(output_prefix + '.json', 'w', encoding='utf-8') as f:
+        json.dump({'metadata': metadata, 'results': results}, f, indent=2)
+        f.write('\n')
+    with open(output_prefix + '.csv', 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def compare_with_baseline(results, baseline_file, tolerance):
+    """
+    Report measurements whose median regressed against a previous run
+
+    Args:
+        results: Current result dictionaries
+        baseline_file: JSON file written by a previous run
+        tolerance: Allowed slowdown as a fraction (0.1 = 10%)
+
+    Returns:
+        Number of regressions found
+    """
+    with open(baseline_file, 'r', encoding='utf-8') as f:
+        baseline = {
+            (r['algorithm'], r['distribution'], r['size'], r['ascending']): r['median_s']
+            for r in json.load(f)['results'] if not r['error']
+        }
+    regressions = 0
+    print(f"\nComparison with {baseline_file} (tolerance {tolerance:.0%}):")
+    for result in results:
+        key = (result['algorithm'], result['distribution'], result['size'], result['ascending'])
+        if result['error'] or key not in baseline or baseline[key] <= 0:
+            continue
+        change = result['median_s'] / baseline[key] - 1
+        if change > tolerance:
+            regressions += 1
+            print(f"  REGRESSION {key[0]:<15} {key[1]:<14} {key[2]:>7}  {change:+.1%}")
+        elif change < -tolerance:
+            print(f"  improved   {key[0]:<15} {key[1]:<14} {key[2]:>7}  {change:+.1%}")
+    print(f"  {regressions} regression(s)")
+    return regressions
+
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments
+
+    Args:
+        argv: Argument list (default: sys.argv[1:])
+
+    Returns:
+        Parsed argparse namespace
+    """
+    available = SortingFactory().get_available_algorithms()
+    parser = argparse.ArgumentParser(description="Benchmark sorting algorithms")
+    parser.add_argument('--algorithms', nargs='+', default=available, choices=available)
+    parser.add_argument('--distributions', nargs='+', default=list(DISTRIBUTIONS),
+                        choices=list(DISTRIBUTIONS))
+    parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES)
+    parser.add_argument('--repeat', type=int, default=5, help="timed runs per measurement")
+    parser.add_argument('--warmup', type=int, default=1, help="untimed runs per measurement")
+    parser.add_argument('--descending', action='store_true')
+    parser.add_argument('--time-limit', type=float, default=2.0,
+                        help="skip sizes projected to take longer than this many seconds")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=os.path.join('reports', 'benchmark'),
+                        help="output path prefix for the .json and .csv files")
+    parser.add_argument('--baseline', help="previous JSON results to check for regressions")
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help="slowdown fraction reported as a regression")
+    parser.add_argument('--backend', default='python', choices=['python', 'array'],
+                        help="SortingFactory backend used for the timed sorts")
+    parser.add_argument('--rss', action='store_true',
+                        help="only compare peak RSS of the 'python' and 'array' backends "
+                             "at the largest size")
+    parser.add_argument('--complexity', action='store_true',
+                        help="only fit growth exponents over the --ladder sizes and flag "
+                             "algorithms growing faster than their advertised class")
+    parser.add_argument('--inputs', nargs='+', default=['random', 'sorted', 'antiqsort'],
+                        choices=list(DISTRIBUTIONS) + list(ADVERSARIES),
+                        help="distributions and adversaries profiled by --complexity")
+    parser.add_argument('--ladder', nargs=3, type=float, default=DEFAULT_LADDER,
+                        metavar=('START', 'FACTOR', 'STEPS'),
+                        help="geometric size ladder of --complexity")
+    parser.add_argument('--metric', default='time', choices=METRICS,
+                        help="cost fitted by --complexity")
+    parser.add_argument('--exponent-tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="fitted exponent excess over the advertised class that "
+                             "--complexity flags")
+    parser.add_argument('--import-time', action='store_true',
+                        help="only time cold-start imports (see IMPORT_SCENARIOS)")
+    return parser.parse_args(argv)
+
+
+def main():
+    """Main function"""
+    args = parse_args()
+    if args.import_time:
+        print(" COLD-START IMPORT TIME")
+        measure_import_time(args.repeat * 4)
+        return
+    if args.complexity:
+        start, factor, steps = args.ladder
+        sizes = geometric_sizes(int(start), factor, int(steps))
+        print(f" GROWTH EXPONENTS ({args.metric}), sizes {sizes[0]} to {sizes[-1]}")
+        results = report_complexity(args.algorithms, args.inputs, sizes, not args.descending,
+                                    args.metric, args.repeat, args.time_limit,
+                                    args.exponent_tolerance, args.seed)
+        if any(result['flagged'] for result in results):
+            sys.exit(1)
+        return
+    if args.rss:
+        print(f" PEAK RSS, {args.distributions[0]} input of {max(args.sizes)} elements")
+        measure_peak_rss(args.algorithms, args.distributions[0], max(args.sizes), args.seed)
+        return
+    sizes = sorted(args.sizes)
+    settings = {
+        'algorithms': args.algorithms,
+        'distributions': args.distributions,
+        'sizes': sizes,
+        'repeat': args.repeat,
+        'warmup': args.warmup,
+        'ascending': not args.descending,
+        'time_limit': args.time_limit,
+        'seed': args.seed,
+        'backend': args.backend,
+    }
+
+    print("=" * 70)
+    print(" SORTING ALGORITHMS BENCHMARK")
+    print("=" * 70)
+    results = run_benchmarks(args.algorithms, args.distributions, sizes, args.repeat,
+                             args.warmup, not args.descending, args.time_limit, args.seed,
+                             args.backend)
+    write_results(results, args.output, settings)
+    print(f"\nResults written to {args.output}.json and {args.output}.csv")
+
+    if args.baseline:
+        if compare_with_baseline(results, args.baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
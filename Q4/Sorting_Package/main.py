@@ -3,105 +3,152 @@ main.py
 Main file to demonstrate sorting algorithms
 Reads from .txt file and outputs to reports folder
 """
+import argparse
+import logging
 import sys
+import time
+from src.batch_io import ReportWriter, iter_test_cases
 from src.sorting_factory import SortingFactory
+from src.external_sort import DEFAULT_FAN_IN, DEFAULT_MEMORY_BUDGET, external_sort
 
 
-def read_input(filename):
+def non_negative_int(text: str) -> int:
     """
-    Read input from text file
-    
-    Format:
-    algorithm_name
-    ascending/descending
-    comma,separated,numbers
+    argparse type accepting integers of 0 or more
+
+    Raises:
+        argparse.ArgumentTypeError: If text is not such an integer
+    """
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {text!r}") from None
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {value}")
+    return value
+
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments
     
     Args:
-        filename: Path to input file
+        argv: Argument list (default: sys.argv[1:])
         
     Returns:
-        List of test cases
+        Parsed argparse namespace
     """
-    test_cases = []
+    parser = argparse.ArgumentParser(description="Sorting algorithms demonstration")
+    parser.add_argument('input_file', help="test case file, or integer file with --external")
+    parser.add_argument('--stats', action='store_true',
+                        help="count comparisons, moves, allocations and recursion depth")
+    parser.add_argument('--jobs', type=non_negative_int, default=1,
+                        help="worker processes sorting test cases in parallel (0: one per CPU)")
+    parser.add_argument('--reports-dir', default='reports',
+                        help="folder receiving one report file per test case")
+    parser.add_argument('--cache-mb', type=int, default=0,
+                        help="cache results of repeated inputs in up to this many MiB "
+                             "(used with --jobs 1)")
+    parser.add_argument('--verbose', action='store_true',
+                        help="log decisions such as the algorithm chosen by 'auto'")
+    parser.add_argument('--external', metavar='OUTPUT_FILE',
+                        help="externally sort the integers in input_file into OUTPUT_FILE")
+    parser.add_argument('--descending', action='store_true',
+                        help="sort in descending order (--external only)")
+    parser.add_argument('--memory-mb', type=int, default=DEFAULT_MEMORY_BUDGET // (1024 * 1024),
+                        help="memory budget in MiB (--external only)")
+    parser.add_argument('--fan-in', type=int, default=DEFAULT_FAN_IN,
+                        help="maximum runs merged at once (--external only)")
+    parser.add_argument('--algorithm', default='radix',
+                        help="algorithm used to sort each run (--external only)")
+    args = parser.parse_args(argv)
+    if args.stats and args.cache_mb:
+        # Instrumented sorts always run the algorithm, so a cache would
+        # never be consulted
+        parser.error("--stats and --cache-mb cannot be combined")
+    return args
+
+
+def run_external(args):
+    """
+    Sort a file larger than memory
     
+    Args:
+        args: Parsed command line arguments
+    """
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            lines = [line.strip() for line in f.readlines() if line.strip()]
-            
-            i = 0
-            while i < len(lines):
-                if i + 2 >= len(lines):
-                    break
-                    
-                algorithm = lines[i].lower()
-                order = lines[i + 1].lower()
-                ascending = order == 'ascending'
-                
-                # Parse numbers
-                numbers_str = lines[i + 2]
-                if numbers_str:
-                    input_list = [int(x.strip()) for x in numbers_str.split(',')]
-                else:
-                    input_list = []
-                
-                test_cases.append({
-                    'algorithm': algorithm,
-                    'ascending': ascending,
-                    'input_list': input_list
-                })
-                
-                i += 3
-                
-        return test_cases
-        
+        count = external_sort(args.input_file, args.external, not args.descending,
+                              args.memory_mb * 1024 * 1024, args.fan_in, args.algorithm)
     except FileNotFoundError:
-        print(f"Error: File {filename} not found")
+        print(f"Error: File {args.input_file} not found")
         sys.exit(1)
     except ValueError as e:
-        print(f"Error: Invalid number format - {e}")
+        print(f"Error: {e}")
         sys.exit(1)
+    print(f"Sorted {count} integers from {args.input_file} into {args.external}")
 
 
 def main():
     """Main function"""
-    if len(sys.argv) != 2:
-        print("Usage: python main.py <input_file.txt>")
-        sys.exit(1)
-    
-    input_file = sys.argv[1]
-    
-    # Read input
-    test_cases = read_input(input_file)
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format="  %(message)s")
+    if args.external:
+        run_external(args)
+        return
     
-    # Initialize factory
-    factory = SortingFactory()
+    factory = SortingFactory(cache_bytes=args.cache_mb * 1024 * 1024)
+    writer = ReportWriter(args.reports_dir)
     
     print("=" * 70)
     print(" SORTING ALGORITHMS DEMONSTRATION")
     print("=" * 70)
     
-    # Process each test case
-    for i, test_case in enumerate(test_cases, 1):
-        algorithm = test_case['algorithm']
-        input_list = test_case['input_list']
-        ascending = test_case['ascending']
-        
-        print(f"\nTest Case {i}:")
-        print(f"  Algorithm: {algorithm}")
-        print(f"  Order: {'Ascending' if ascending else 'Descending'}")
-        print(f"  Input Size: {len(input_list)}")
-        print(f"  Input: {input_list}")
-        
-        try:
-            result = factory.sort(algorithm, input_list, ascending)
-            print(f"  Output: {result}")
-            print(f"  Status: ✓ SUCCESS")
-        except Exception as e:
-            print(f"  Error: {e}")
-            print(f"  Status: ✗ FAILED")
+    # Cases are read, sorted and written as a stream; inputs and outputs
+    # go to the report files and only a summary line to the console
+    succeeded = failed = elements = 0
+    sort_seconds = 0.0
+    start = time.perf_counter()
+    try:
+        test_cases = iter_test_cases(args.input_file)
+        if args.stats:
+            test_cases = (dict(test_case, stats=True) for test_case in test_cases)
+        results = factory.iter_sort_many(test_cases, workers=args.jobs or None)
+        for i, outcome in enumerate(results, 1):
+            test_case = outcome['job']
+            algorithm = test_case['algorithm']
+            input_list = test_case['input_list']
+            ascending = test_case['ascending']
+            error = outcome['error']
+            
+            path = writer.write_case(i, algorithm, ascending, input_list, outcome['result'],
+                                     error, outcome['stats'])
+            order = 'ascending' if ascending else 'descending'
+            status = "✓ SUCCESS" if error is None else "✗ FAILED"
+            print(f"  Case {i:>4}: {algorithm:<15} {order:<10} n={len(input_list):<7} "
+                  f"{outcome['seconds'] * 1000:9.2f} ms  {status}  -> {path}")
+            if error is None:
+                succeeded += 1
+                elements += len(input_list)
+                sort_seconds += outcome['seconds']
+            else:
+                failed += 1
+    except FileNotFoundError:
+        print(f"Error: File {args.input_file} not found")
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: Invalid number format - {e}")
+        sys.exit(1)
     
     print("\n" + "=" * 70)
-    print(" DEMONSTRATION COMPLETED")
+    print(f" DEMONSTRATION COMPLETED: {succeeded} succeeded, {failed} failed, "
+          f"{elements} elements sorted in {sort_seconds:.3f} s of sorting, "
+          f"{time.perf_counter() - start:.3f} s wall time")
+    cache_info = factory.cache_info()
+    if cache_info is not None:
+        print(f" Result cache: {cache_info['hits']} hits, {cache_info['misses']} misses, "
+              f"{cache_info['entries']} entries ({cache_info['bytes']} bytes)")
+    print(f" Reports written to {args.reports_dir}/")
     print("=" * 70)
 
 
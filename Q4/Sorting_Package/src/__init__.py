@@ -1,23 +1,49 @@
 """
 src/__init__.py
 Package initialization for sorting algorithms
+
+Public names are imported on first access, so importing the package does
+not load every algorithm module.
 """
-from .sorting_base import SortingAlgorithm
-from .bubble_sort import BubbleSort
-from .selection_sort import SelectionSort
-from .quick_sort import QuickSort
-from .merge_sort import MergeSort
-from .sorting_factory import SortingFactory
-from .shell_sort import ShellSort 
-
-__all__ = [
-    'SortingAlgorithm',
-    'BubbleSort',
-    'SelectionSort',
-    'QuickSort',
-    'MergeSort',
-    'SortingFactory'
-    'Shellsort'
-]
+from importlib import import_module
+
+# Public name -> module defining it
+_EXPORTS = {
+    'SortingAlgorithm': '.sorting_base',
+    'BubbleSort': '.bubble_sort',
+    'SelectionSort': '.selection_sort',
+    'QuickSort': '.quick_sort',
+    'MergeSort': '.merge_sort',
+    'BottomUpMergeSort': '.bottom_up_merge_sort',
+    'BlockMergeSort': '.block_merge_sort',
+    'IntroSort': '.intro_sort',
+    'TimSort': '.tim_sort',
+    'RadixSort': '.radix_sort',
+    'ParallelMergeSort': '.parallel_merge_sort',
+    'SortingFactory': '.sorting_factory',
+    'ShellSort': '.shell_sort',
+    'SortedContainer': '.sorted_container',
+    'register_algorithm': '.registry',
+    'apply_permutation': '.permutation',
+    'merge_sorted': '.kway_merge',
+    'antiqsort': '.adversarial',
+    'profile_complexity': '.complexity',
+}
+
+__all__ = list(_EXPORTS)
 
 __version__ = '1.0.0'
+
+
+def __getattr__(name):
+    """Import a public name from its module on first access"""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
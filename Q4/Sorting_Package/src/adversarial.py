@@ -0,0 +1,115 @@
+"""
+src/adversarial.py
+Adaptive adversaries that build worst-case inputs for comparison sorts
+"""
+from typing import Callable, Dict, List
+from .sorting_base import SortingAlgorithm
+
+
+class _Antiqsort:
+    """
+    McIlroy's adversary ("A Killer Adversary for Quicksort", 1999)
+
+    Every item starts as "gas", worth more than any value assigned so
+    far. When two gas items are compared one of them is frozen to the
+    next solid value, preferring the pivot candidate (the gas item that
+    survived the previous comparison): a pivot is compared with
+    everything in its range, so it is frozen low while the rest stays
+    gas above it, and each partition splits off as little as possible.
+    """
+    def __init__(self, n: int):
+        """
+        Initialize the adversary
+
+        Args:
+            n: Number of items; also the value of gas, above every solid value
+        """
+        self.gas = n
+        self.values = [n] * n
+        self.solid = 0
+        self.candidate = 0
+    def freeze(self, index: int) -> None:
+        """Give a gas item the next solid value"""
+        self.values[index] = self.solid
+        self.solid += 1
+    def compare(self, x: int, y: int) -> int:
+        """Compare items x and y, deciding gas items as late as possible"""
+        values, gas = self.values, self.gas
+        if values[x] == gas and values[y] == gas:
+            self.freeze(x if x == self.candidate else y)
+        if values[x] == gas:
+            self.candidate = x
+        elif values[y] == gas:
+            self.candidate = y
+        return values[x] - values[y]
+
+
+class _Probe:
+    """Item whose comparisons are decided by an _Antiqsort adversary"""
+    __slots__ = ('index', 'adversary')
+    __hash__ = None
+    def __init__(self, index: int, adversary: _Antiqsort):
+        self.index = index
+        self.adversary = adversary
+    def _compare(self, other) -> int:
+        if not isinstance(other, _Probe):
+            raise TypeError(f"Cannot compare an adversary probe with {type(other).__name__}")
+        return self.adversary.compare(self.index, other.index)
+    def __lt__(self, other):
+        return self._compare(other) < 0
+    def __le__(self, other):
+        return self._compare(other) <= 0
+    def __gt__(self, other):
+        return self._compare(other) > 0
+    def __ge__(self, other):
+        return self._compare(other) >= 0
+    def __eq__(self, other):
+        return self._compare(other) == 0
+    def __ne__(self, other):
+        return self._compare(other) != 0
+    def __reduce__(self):
+        # Comparisons made in another process would never reach the adversary
+        raise TypeError("Adversary probes cannot be sent to another process")
+
+
+def antiqsort(algorithm: SortingAlgorithm, n: int, ascending: bool = True) -> List[int]:
+    """
+    Build an input that drives algorithm towards its worst case
+
+    The algorithm sorts n probes whose order is decided only as it
+    compares them (see _Antiqsort). The values decided are returned as
+    an ordinary input, which a deterministic algorithm sorts by making
+    the same comparisons again: Lomuto quicksort and other fixed-pivot
+    schemes go quadratic, while merge-based or introspective sorts are
+    unaffected.
+
+    Args:
+        algorithm: Comparison sort to attack
+        n: Input size
+        ascending: Sort direction the input is built for
+
+    Returns:
+        A permutation of range(n)
+
+    Raises:
+        TypeError: If the algorithm does not sort by comparisons alone
+                  (e.g. radix sort's arithmetic on values)
+    """
+    adversary = _Antiqsort(n)
+    probes = [_Probe(i, adversary) for i in range(n)]
+    try:
+        algorithm.sort(probes, ascending)
+    except (TypeError, AttributeError) as e:
+        raise TypeError(f"{algorithm.get_name()} does not sort by comparisons alone") from e
+    # Items left as gas were never compared with each other; any order of
+    # them keeps every comparison made above
+    for index, value in enumerate(adversary.values):
+        if value == adversary.gas:
+            adversary.freeze(index)
+    return adversary.values
+
+
+# Adversarial input generators, called as generator(algorithm, n, ascending)
+ADVERSARIES: Dict[str, Callable[[SortingAlgorithm, int, bool], List[int]]] = {
+    'antiqsort': antiqsort,
+}
@@ -0,0 +1,173 @@
+"""
+src/auto_select.py
+Automatic algorithm selection from a cheap profile of the input
+"""
+import logging
+from itertools import islice
+from operator import gt, ne
+from typing import List, Optional, Tuple
+from .radix_sort import COUNTING_SPAN_RATIO
+
+logger = logging.getLogger(__name__)
+
+# Contiguous windows scanned for run boundaries: 64 windows of 64 elements
+# find a boundary every ~sqrt(n) elements with near certainty at 2x10^5
+RUN_WINDOWS = 64
+RUN_WINDOW_SIZE = 64
+# Evenly spaced elements used to estimate the inversion and duplicate
+# ratios
+SAMPLE_SIZE = 1024
+# Timsort beats radix sort while merging takes only a few levels...
+PRESORTED_MAX_RUNS = 16
+# ...or when nearly every pair is already in (or exactly out of) order
+NEARLY_SORTED_INVERSIONS = 0.02
+# Three-way partitioning beats radix sort for this few distinct values
+FEW_UNIQUE_MAX_DISTINCT = 32
+# Below this size introsort beats radix sort's per-pass overhead
+RADIX_MIN_SIZE = 1024
+
+
+class InputProfile:
+    """Presortedness and value statistics estimated from a sample of the input"""
+    def __init__(self, size: int, runs: float, inversion_ratio: float, span: int,
+                 duplicate_ratio: float, sample_distinct: int):
+        """
+        Initialize the profile
+
+        Args:
+            size: Number of elements
+            runs: Estimated number of ascending / descending runs
+            inversion_ratio: Estimated fraction of pairs out of order
+            span: max - min of the values
+            duplicate_ratio: Fraction of sampled values that repeat another
+            sample_distinct: Distinct values in the duplicate sample
+        """
+        self.size = size
+        self.runs = runs
+        self.inversion_ratio = inversion_ratio
+        self.span = span
+        self.duplicate_ratio = duplicate_ratio
+        self.sample_distinct = sample_distinct
+    def as_dict(self) -> dict:
+        """Return the statistics as a dictionary"""
+        return {
+            'size': self.size,
+            'runs': round(self.runs, 1),
+            'inversion_ratio': round(self.inversion_ratio, 3),
+            'span': self.span,
+            'duplicate_ratio': round(self.duplicate_ratio, 3),
+            'sample_distinct': self.sample_distinct,
+        }
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{name}={value}" for name, value in self.as_dict().items())
+        return f"InputProfile({fields})"
+
+
+def _estimate_runs(values: List[int]) -> float:
+    """
+    Estimate the number of monotonic runs from evenly spaced windows
+
+    A run boundary shows up as a change between ascending and descending
+    steps; the change rate within the windows is extrapolated to the
+    whole input. Inputs no larger than the windows are scanned entirely.
+
+    Args:
+        values: Input sequence
+
+    Returns:
+        Estimated run count (at least 1)
+    """
+    n = len(values)
+    if n <= RUN_WINDOWS * RUN_WINDOW_SIZE:
+        starts = [0]
+        size = n
+    else:
+        step = (n - RUN_WINDOW_SIZE) // (RUN_WINDOWS - 1)
+        starts = range(0, RUN_WINDOWS * step, step)
+        size = RUN_WINDOW_SIZE
+    changes = 0
+    steps = 0
+    for start in starts:
+        window = values[start:start + size]
+        descending = list(map(gt, window, islice(window, 1, None)))
+        changes += sum(map(ne, descending, islice(descending, 1, None)))
+        steps += max(0, len(descending) - 1)
+    if steps == 0:
+        return 1.0
+    # Each boundary between two runs flips the step direction twice
+    return 1.0 + changes / 2 * (n - 2) / steps
+
+
+def profile_input(values: List[int], bounds: Optional[Tuple[int, int]] = None) -> InputProfile:
+    """
+    Profile an input from samples of at most a few thousand elements
+
+    Only min/max, when bounds are not supplied, take a full pass.
+
+    Args:
+        values: List of integers or integer buffer
+        bounds: Optional (min, max) found during validation
+
+    Returns:
+        InputProfile of the input
+    """
+    n = len(values)
+    if n < 2:
+        return InputProfile(n, 1.0, 0.0, 0, 0.0, n)
+    low, high = bounds if bounds is not None else (min(values), max(values))
+
+    sample = values[::max(1, n // SAMPLE_SIZE)]
+    # Each sampled element is compared with the one half a sample later
+    half = len(sample) // 2
+    inversions = sum(map(gt, sample, islice(sample, half, None)))
+    distinct = len(set(sample))
+    return InputProfile(n, _estimate_runs(values), inversions / (len(sample) - half),
+                        high - low, 1 - distinct / len(sample), distinct)
+
+
+def choose_algorithm(profile: InputProfile) -> Tuple[str, str]:
+    """
+    Pick the registered algorithm expected to be fastest for a profile
+
+    The thresholds come from bench.py measurements: timsort wins on
+    inputs made of a few runs or with very few inversions, counting sort
+    (radix sort's narrow-range path) on narrow value ranges, introsort's
+    three-way partitioning on few distinct values and on small inputs,
+    and radix sort otherwise.
+
+    Args:
+        profile: InputProfile of the input
+
+    Returns:
+        Tuple (algorithm name, reason)
+    """
+    if profile.size < 2:
+        return 'tim', "trivial input"
+    if profile.runs <= PRESORTED_MAX_RUNS:
+        return 'tim', f"about {profile.runs:.0f} run(s)"
+    if min(profile.inversion_ratio, 1 - profile.inversion_ratio) <= NEARLY_SORTED_INVERSIONS:
+        return 'tim', f"nearly sorted ({profile.inversion_ratio:.1%} of pairs inverted)"
+    if profile.span < COUNTING_SPAN_RATIO * profile.size:
+        return 'radix', f"narrow value range ({profile.span}) suits counting sort"
+    if profile.sample_distinct <= FEW_UNIQUE_MAX_DISTINCT:
+        return 'intro', f"few distinct values ({profile.sample_distinct} in sample)"
+    if profile.size < RADIX_MIN_SIZE:
+        return 'intro', "small input"
+    return 'radix', "large input without exploitable order"
+
+
+def select_algorithm(values: List[int], bounds: Optional[Tuple[int, int]] = None) -> str:
+    """
+    Profile values, choose an algorithm and log the decision
+
+    Args:
+        values: List of integers or integer buffer
+        bounds: Optional (min, max) found during validation
+
+    Returns:
+        Name of the chosen algorithm
+    """
+    profile = profile_input(values, bounds)
+    name, reason = choose_algorithm(profile)
+    logger.info("auto: chose %s (%s); %r", name, reason, profile)
+    return name
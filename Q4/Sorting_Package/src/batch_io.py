@@ -0,0 +1,143 @@
+"""
+src/batch_io.py
+Streaming test case reader and per-case report writer for main.py
+"""
+import os
+from typing import Iterator, List, Optional
+
+# Numbers formatted per write() call when a list is written to a report
+WRITE_CHUNK = 4096
+# Buffer size of report files
+WRITE_BUFFER = 1 << 16
+
+
+def parse_int_list(text: str) -> List[int]:
+    """
+    Parse a comma separated line of integers
+
+    int() ignores surrounding whitespace, so the tokens are converted by a
+    single map over split() with no per-token Python code.
+
+    Args:
+        text: Line such as "3, -1,2"
+
+    Returns:
+        List of integers (empty for a blank line)
+
+    Raises:
+        ValueError: If a token is not an integer
+    """
+    if not text.strip():
+        return []
+    return list(map(int, text.split(',')))
+
+
+def iter_test_cases(filename: str) -> Iterator[dict]:
+    """
+    Lazily read test cases from a text file
+
+    Format (blank lines are ignored):
+    algorithm_name
+    ascending/descending
+    comma,separated,numbers
+
+    Only the current case is held in memory; a trailing incomplete case
+    is ignored.
+
+    Args:
+        filename: Path to input file
+
+    Yields:
+        Dictionaries with 'algorithm', 'ascending' and 'input_list'
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If a number line contains a non-integer
+    """
+    with open(filename, 'r', encoding='utf-8') as f:
+        fields = []
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            fields.append(line)
+            if len(fields) == 3:
+                algorithm, order, numbers = fields
+                fields = []
+                yield {
+                    'algorithm': algorithm.lower(),
+                    'ascending': order.lower() == 'ascending',
+                    'input_list': parse_int_list(numbers),
+                }
+
+
+class ReportWriter:
+    """Writes one report file per test case into a reports directory"""
+    def __init__(self, directory: str = 'reports', prefix: str = 'case'):
+        """
+        Initialize the writer
+
+        Args:
+            directory: Folder receiving the reports (created if missing)
+            prefix: File name prefix; reports are named <prefix>_0001.txt
+        """
+        self.directory = directory
+        self.prefix = prefix
+        os.makedirs(directory, exist_ok=True)
+    def path_for(self, index: int) -> str:
+        """Return the report path of the test case with the given number"""
+        return os.path.join(self.directory, f"{self.prefix}_{index:04d}.txt")
+    def write_case(self, index: int, algorithm: str, ascending: bool, input_list: List[int],
+                   output: Optional[List[int]] = None, error: Optional[str] = None,
+                   stats: Optional[dict] = None) -> str:
+        """
+        Write the report of one test case
+
+        Args:
+            index: Test case number
+            algorithm: Algorithm name
+            ascending: Sort order
+            input_list: Input values
+            output: Sorted values, if the sort succeeded
+            error: Error message, if the sort failed
+            stats: Optional operation counts
+
+        Returns:
+            Path of the report file
+        """
+        path = self.path_for(index)
+        with open(path, 'w', encoding='utf-8', buffering=WRITE_BUFFER) as f:
+            f.write(f"Test Case {index}:\n")
+            f.write(f"  Algorithm: {algorithm}\n")
+            f.write(f"  Order: {'Ascending' if ascending else 'Descending'}\n")
+            f.write(f"  Input Size: {len(input_list)}\n")
+            f.write("  Input: ")
+            write_int_list(f, input_list)
+            if error is None:
+                f.write("\n  Output: ")
+                write_int_list(f, output)
+                if stats:
+                    f.write("\n  Stats: " + ", ".join(f"{name}={value}"
+                                                      for name, value in stats.items()))
+                f.write("\n  Status: ✓ SUCCESS\n")
+            else:
+                f.write(f"\n  Error: {error}\n  Status: ✗ FAILED\n")
+        return path
+
+
+def write_int_list(f, values) -> None:
+    """
+    Write values as "[a, b, c]", formatting WRITE_CHUNK numbers per write
+
+    Each chunk is formatted by list repr, which runs entirely in C.
+
+    Args:
+        f: Text file open for writing
+        values: List of integers
+    """
+    f.write('[')
+    for start in range(0, len(values), WRITE_CHUNK):
+        if start:
+            f.write(', ')
+        f.write(repr(values[start:start + WRITE_CHUNK])[1:-1])
+    f.write(']')
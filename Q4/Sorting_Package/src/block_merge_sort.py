@@ -0,0 +1,220 @@
+"""
+src/block_merge_sort.py
+Stable in-place Block Merge Sort with constant auxiliary memory
+"""
+from typing import List
+from .sorting_base import SortingAlgorithm, copy_range, working_copy
+
+# Elements held in the fixed-size cache: merges whose shorter side fits
+# are buffered, and rotations and reversals move data in chunks of this
+# size, so temporary storage never exceeds it whatever n is
+CACHE_SIZE = 512
+# Length of the runs sorted by insertion sort before merging
+RUN_LENGTH = 32
+
+
+class BlockMergeSort(SortingAlgorithm):
+    """
+    Block Merge Sort implementation
+
+    A bottom-up merge sort whose merges run in place, in the spirit of
+    WikiSort: like WikiSort it keeps a fixed cache of CACHE_SIZE elements
+    and merges through it whenever one side fits. Larger merges are split
+    with SymMerge (Kim & Kutzner): a binary search finds the cut that
+    lets one rotation swap the middle blocks, after which the two halves
+    are merged independently, until one side fits in the cache. Rotations
+    use block swaps in cache-sized chunks. Stable.
+    """
+    # Each SymMerge level rotates O(n) elements, O(log n) levels per merge
+    complexity = 'n log^2 n'
+    def sort(self, arr: List[int], ascending: bool = True, inplace: bool = False) -> List[int]:
+        """
+        Sort array using block merge sort
+
+        Descending order reverses the input, sorts it ascending and
+        reverses the result, which keeps equal values in their original
+        order.
+
+        Auxiliary memory: O(1): temporaries of at most CACHE_SIZE
+        elements, plus an O(log n) stack for the SymMerge splits. Unless
+        inplace is set, the input is first copied (O(n)).
+
+        Args:
+            arr: List of integers to sort
+            ascending: If True, sort in ascending order, else descending
+            inplace: If True, sort arr (a list or writable buffer) itself
+                    and return it
+
+        Returns:
+            Sorted list of integers
+        """
+        result = working_copy(arr, inplace)
+        n = len(result)
+        if n < 2:
+            return result
+        if not ascending:
+            self._reverse(result)
+        for low in range(0, n, RUN_LENGTH):
+            self._insertion_sort(result, low, min(low + RUN_LENGTH, n))
+        width = RUN_LENGTH
+        while width < n:
+            for low in range(0, n - width, 2 * width):
+                self._merge(result, low, low + width, min(low + 2 * width, n))
+            width *= 2
+        if not ascending:
+            self._reverse(result)
+        return result
+    @staticmethod
+    def _insertion_sort(arr: List[int], low: int, high: int) -> None:
+        """Insertion sort arr[low:high] in place"""
+        for i in range(low + 1, high):
+            key = arr[i]
+            j = i - 1
+            while j >= low and arr[j] > key:
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = key
+    def _merge(self, arr: List[int], low: int, mid: int, high: int) -> None:
+        """
+        Stably merge the sorted ranges arr[low:mid] and arr[mid:high]
+
+        Args:
+            arr: Sequence holding both ranges
+            low: Start of the left range
+            mid: End of the left range, start of the right range
+            high: End of the right range
+        """
+        while True:
+            if low == mid or mid == high or arr[mid - 1] <= arr[mid]:
+                return
+            if mid - low <= CACHE_SIZE:
+                self._merge_left_cached(arr, low, mid, high)
+                return
+            if high - mid <= CACHE_SIZE:
+                self._merge_right_cached(arr, low, mid, high)
+                return
+            # SymMerge: find start so that arr[start:mid] and
+            # arr[mid:end] swap places, symmetric around the midpoint
+            half = (low + high) // 2
+            total = half + mid
+            if mid > half:
+                start, stop = total - high, half
+            else:
+                start, stop = low, mid
+            last = total - 1
+            while start < stop:
+                c = (start + stop) // 2
+                if arr[last - c] < arr[c]:
+                    stop = c
+                else:
+                    start = c + 1
+            end = total - start
+            self._rotate(arr, start, mid, end)
+            # Recurse into the smaller half and loop on the larger one to
+            # keep the stack O(log n)
+            if half - low < high - half:
+                self._merge(arr, low, start, half)
+                low, mid = half, end
+            else:
+                self._merge(arr, half, end, high)
+                mid, high = start, half
+    @staticmethod
+    def _merge_left_cached(arr: List[int], low: int, mid: int, high: int) -> None:
+        """Merge through a copy of the left range, which fits in the cache"""
+        cache = copy_range(arr, low, mid, same_type=True)
+        size = len(cache)
+        i, j, k = 0, mid, low
+        while i < size and j < high:
+            if cache[i] <= arr[j]:
+                arr[k] = cache[i]
+                i += 1
+            else:
+                arr[k] = arr[j]
+                j += 1
+            k += 1
+        # Leftovers of the right range are already in place
+        while i < size:
+            arr[k] = cache[i]
+            i += 1
+            k += 1
+    @staticmethod
+    def _merge_right_cached(arr: List[int], low: int, mid: int, high: int) -> None:
+        """Merge backwards through a copy of the right range, which fits in the cache"""
+        cache = copy_range(arr, mid, high, same_type=True)
+        i, j, k = len(cache) - 1, mid - 1, high - 1
+        while i >= 0 and j >= low:
+            # Ties take the right value first, as it goes last
+            if arr[j] > cache[i]:
+                arr[k] = arr[j]
+                j -= 1
+            else:
+                arr[k] = cache[i]
+                i -= 1
+            k -= 1
+        # Leftovers of the left range are already in place
+        while i >= 0:
+            arr[k] = cache[i]
+            i -= 1
+            k -= 1
+    @staticmethod
+    def _rotate(arr: List[int], low: int, mid: int, high: int) -> None:
+        """
+        Exchange arr[low:mid] and arr[mid:high] in place
+
+        While both parts exceed the cache, the shorter part is swapped
+        with the far end of the longer one (Gries-Mills block swap),
+        putting it in its final place. Once one part fits in the cache it
+        is copied aside, the other is shifted in cache-sized chunks and
+        the copy is written back.
+        """
+        while low < mid < high:
+            left, right = mid - low, high - mid
+            if left <= CACHE_SIZE:
+                saved = copy_range(arr, low, mid, same_type=True)
+                for src in range(mid, high, CACHE_SIZE):
+                    stop = min(src + CACHE_SIZE, high)
+                    arr[src - left:stop - left] = copy_range(arr, src, stop, same_type=True)
+                arr[high - left:high] = saved
+                return
+            if right <= CACHE_SIZE:
+                saved = copy_range(arr, mid, high, same_type=True)
+                for stop in range(mid, low, -CACHE_SIZE):
+                    src = max(stop - CACHE_SIZE, low)
+                    arr[src + right:stop + right] = copy_range(arr, src, stop, same_type=True)
+                arr[low:low + right] = saved
+                return
+            if left <= right:
+                BlockMergeSort._swap_ranges(arr, low, high - left, left)
+                high -= left
+            else:
+                BlockMergeSort._swap_ranges(arr, low, mid, right)
+                low += right
+    @staticmethod
+    def _swap_ranges(arr: List[int], first: int, second: int, size: int) -> None:
+        """Swap the non-overlapping ranges of size elements at first and second"""
+        for offset in range(0, size, CACHE_SIZE):
+            step = min(CACHE_SIZE, size - offset)
+            a, b = first + offset, second + offset
+            saved = copy_range(arr, a, a + step, same_type=True)
+            arr[a:a + step] = copy_range(arr, b, b + step, same_type=True)
+            arr[b:b + step] = saved
+    @staticmethod
+    def _reverse(arr: List[int]) -> None:
+        """Reverse arr in place; memoryviews a cache-sized chunk at a time"""
+        if hasattr(arr, 'reverse'):
+            arr.reverse()
+            return
+        low, high = 0, len(arr)
+        while high - low > 1:
+            step = min(CACHE_SIZE, (high - low) // 2)
+            left = copy_range(arr, low, low + step, same_type=True)
+            right = copy_range(arr, high - step, high, same_type=True)
+            left.reverse()
+            right.reverse()
+            arr[low:low + step] = right
+            arr[high - step:high] = left
+            low += step
+            high -= step
+    def get_name(self) -> str:
+        """Return the name of the sorting algorithm"""
+        return "Block Merge Sort"
@@ -0,0 +1,166 @@
+"""
+src/bottom_up_merge_sort.py
+Bottom-up (iterative) Merge Sort with a single ping-pong buffer
+"""
+from typing import List
+from .sorting_base import SortingAlgorithm, new_buffer_like, working_copy
+
+# Length of the runs sorted by insertion sort before the merge passes;
+# doubled when that makes the number of passes even
+RUN_LENGTH = 16
+
+
+class BottomUpMergeSort(SortingAlgorithm):
+    """Bottom-up Merge Sort implementation"""
+    complexity = 'n log n'
+    def sort(self, arr: List[int], ascending: bool = True, inplace: bool = False) -> List[int]:
+        """
+        Sort array using bottom-up merge sort
+
+        Runs of RUN_LENGTH elements are insertion sorted in place, then
+        merge passes of doubling width alternate between the array and one
+        auxiliary buffer allocated up front: each pass reads one and
+        writes the other, so merges allocate nothing and nothing recurses.
+        Stable.
+
+        Auxiliary memory: O(n) for the single buffer, of the same element
+        type as arr. Unless inplace is set, the input is first copied
+        (O(n)).
+
+        Args:
+            arr: List of integers to sort
+            ascending: If True, sort in ascending order, else descending
+            inplace: If True, sort arr (a list or writable buffer) itself
+                    and return it
+
+        Returns:
+            Sorted list of integers
+        """
+        result = working_copy(arr, inplace)
+        n = len(result)
+        if n < 2:
+            return result
+        if ascending:
+            insertion_sort, merge_pass = self._insertion_sort_ascending, self._merge_pass_ascending
+        else:
+            insertion_sort, merge_pass = self._insertion_sort_descending, self._merge_pass_descending
+        # An even number of passes ends in result, so no copy-back is needed
+        run = RUN_LENGTH
+        if ((n - 1) // run).bit_length() % 2:
+            run *= 2
+        for low in range(0, n, run):
+            insertion_sort(result, low, min(low + run, n))
+        if n <= run:
+            return result
+        source, target = result, new_buffer_like(result, n)
+        width = run
+        while width < n:
+            merge_pass(source, target, width, n)
+            source, target = target, source
+            width *= 2
+        return result
+    @staticmethod
+    def _insertion_sort_ascending(arr: List[int], low: int, high: int) -> None:
+        """Insertion sort arr[low:high] ascending in place"""
+        for i in range(low + 1, high):
+            key = arr[i]
+            j = i - 1
+            while j >= low and arr[j] > key:
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = key
+    @staticmethod
+    def _insertion_sort_descending(arr: List[int], low: int, high: int) -> None:
+        """Insertion sort arr[low:high] descending in place"""
+        for i in range(low + 1, high):
+            key = arr[i]
+            j = i - 1
+            while j >= low and arr[j] < key:
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = key
+    @staticmethod
+    def _merge_pass_ascending(source: List[int], target: List[int], width: int, n: int) -> None:
+        """
+        Merge each pair of adjacent ascending runs of source into target
+
+        Args:
+            source: Sequence holding sorted runs of length width
+            target: Sequence of the same length receiving the merged runs
+            width: Run length
+            n: Number of elements
+        """
+        for left in range(0, n, 2 * width):
+            mid = min(left + width, n)
+            right = min(left + 2 * width, n)
+            i, j, k = left, mid, left
+            if mid < right:
+                a, b = source[i], source[j]
+                while True:
+                    if a <= b:
+                        target[k] = a
+                        k += 1
+                        i += 1
+                        if i == mid:
+                            break
+                        a = source[i]
+                    else:
+                        target[k] = b
+                        k += 1
+                        j += 1
+                        if j == right:
+                            break
+                        b = source[j]
+            # At most one run has leftovers; copy them across
+            while i < mid:
+                target[k] = source[i]
+                i += 1
+                k += 1
+            while j < right:
+                target[k] = source[j]
+                j += 1
+                k += 1
+    @staticmethod
+    def _merge_pass_descending(source: List[int], target: List[int], width: int, n: int) -> None:
+        """
+        Merge each pair of adjacent descending runs of source into target
+
+        Args:
+            source: Sequence holding sorted runs of length width
+            target: Sequence of the same length receiving the merged runs
+            width: Run length
+            n: Number of elements
+        """
+        for left in range(0, n, 2 * width):
+            mid = min(left + width, n)
+            right = min(left + 2 * width, n)
+            i, j, k = left, mid, left
+            if mid < right:
+                a, b = source[i], source[j]
+                while True:
+                    if a >= b:
+                        target[k] = a
+                        k += 1
+                        i += 1
+                        if i == mid:
+                            break
+                        a = source[i]
+                    else:
+                        target[k] = b
+                        k += 1
+                        j += 1
+                        if j == right:
+                            break
+                        b = source[j]
+            # At most one run has leftovers; copy them across
+            while i < mid:
+                target[k] = source[i]
+                i += 1
+                k += 1
+            while j < right:
+                target[k] = source[j]
+                j += 1
+                k += 1
+    def get_name(self) -> str:
+        """Return the name of the sorting algorithm"""
+        return "Bottom-up Merge Sort"
@@ -3,37 +3,56 @@ src/bubble_sort.py
 Bubble Sort implementation
 """
 from typing import List
-from .sorting_base import SortingAlgorithm
+from .sorting_base import SortingAlgorithm, working_copy
 
 
 class BubbleSort(SortingAlgorithm):
     """Bubble Sort implementation"""
-    def sort(self, arr: List[int], ascending: bool = True) -> List[int]:
+    complexity = 'n^2'
+    def sort(self, arr: List[int], ascending: bool = True, inplace: bool = False) -> List[int]:
         """
         Sort array using bubble sort algorithm
         
+        Auxiliary memory: O(1); swaps happen within the array being
+        sorted. Unless inplace is set, the input is first copied (O(n)).
+        
         Args:
             arr: List of integers to sort
             ascending: If True, sort in ascending order, else descending
+            inplace: If True, sort arr (a list or writable buffer) itself
+                    and return it
             
         Returns:
             Sorted list of integers
         """
-        result = arr.copy()
+        result = working_copy(arr, inplace)
         n = len(result)
-        for i in range(n):
-            swapped = False
-            for j in range(0, n - i - 1):
-                if ascending:
-                    if result[j] > result[j + 1]:
-                        result[j], result[j + 1] = result[j + 1], result[j]
+        # The direction is resolved once, so each inner loop makes a single
+        # comparison per step
+        if ascending:
+            for i in range(n):
+                swapped = False
+                for j in range(n - i - 1):
+                    a = result[j]
+                    b = result[j + 1]
+                    if a > b:
+                        result[j] = b
+                        result[j + 1] = a
                         swapped = True
-                else:
-                    if result[j] < result[j + 1]:
-                        result[j], result[j + 1] = result[j + 1], result[j]
+                if not swapped:
+                    break
+        else:
+            for i in range(n):
+                swapped = False
+                for j in range(n - i - 1):
+                    a = result[j]
+                    b = result[j + 1]
+                    if a < b:
+                        result[j] = b
+                        result[j + 1] = a
                         swapped = True
-            if not swapped:
-                break
+                if not swapped:
+                    break
         return result
     
     def get_name(self) -> str:
@@ -0,0 +1,276 @@
+"""
+src/complexity.py
+Empirical complexity profiling: growth exponents fitted over size ladders
+"""
+import math
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+from .adversarial import ADVERSARIES
+from .distributions import DISTRIBUTIONS, generate
+from .instrumentation import instrumented_sort
+from .sorting_base import SortingAlgorithm
+
+# Advertised complexity classes, as cost functions of n
+COMPLEXITY_CLASSES: Dict[str, Callable[[int], float]] = {
+    'n': lambda n: n,
+    'n log n': lambda n: n * math.log(n),
+    'n log^2 n': lambda n: n * math.log(n) ** 2,
+    'n^1.5': lambda n: n ** 1.5,
+    'n^2': lambda n: n * n,
+}
+# Cost measured per size: wall time of the sort (best of repeat runs),
+# or element comparisons counted by src.instrumentation (deterministic,
+# but zero for algorithms that do not compare, such as radix sort)
+METRICS = ['time', 'comparisons']
+# Fitted exponent above the advertised class's by more than this is flagged
+DEFAULT_TOLERANCE = 0.25
+
+
+def geometric_sizes(start: int, factor: float, steps: int) -> List[int]:
+    """
+    Build a geometric ladder of input sizes
+
+    Args:
+        start: First size
+        factor: Ratio between consecutive sizes
+        steps: Number of sizes
+
+    Returns:
+        List of increasing sizes start, start * factor, ...
+
+    Raises:
+        ValueError: If start < 2, factor <= 1 or steps < 2
+    """
+    if start < 2 or factor <= 1 or steps < 2:
+        raise ValueError("A size ladder needs start >= 2, factor > 1 and at least 2 steps")
+    return [round(start * factor ** i) for i in range(steps)]
+
+
+def fit_exponent(sizes: Sequence[int], costs: Sequence[float]) -> float:
+    """
+    Fit cost ~ c * n^k by least squares on log cost against log n
+
+    Args:
+        sizes: Input sizes
+        costs: Positive cost measured at each size
+
+    Returns:
+        The exponent k
+
+    Raises:
+        ValueError: If fewer than two sizes are given or a cost is not
+                   positive
+    """
+    if len(sizes) < 2 or len(sizes) != len(costs):
+        raise ValueError("Fitting an exponent needs at least two (size, cost) pairs")
+    if min(costs) <= 0:
+        raise ValueError("Costs must be positive to fit an exponent")
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(cost) for cost in costs]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+
+def expected_exponent(complexity: str, sizes: Sequence[int]) -> float:
+    """
+    Exponent that a cost growing exactly like complexity fits over sizes
+
+    Log factors have no fixed exponent, so the class is fitted over the
+    same ladder as the measurements (n log n fits about 1.1 over 10^2 to
+    10^4) and the two are directly comparable.
+
+    Args:
+        complexity: Key of COMPLEXITY_CLASSES
+        sizes: Input sizes
+
+    Returns:
+        The fitted exponent
+
+    Raises:
+        ValueError: If complexity is not a known class
+    """
+    if complexity not in COMPLEXITY_CLASSES:
+        raise ValueError(f"Unknown complexity class: {complexity}. "
+                         f"Available: {list(COMPLEXITY_CLASSES.keys())}")
+    cost = COMPLEXITY_CLASSES[complexity]
+    return fit_exponent(sizes, [cost(n) for n in sizes])
+
+
+def make_input(input_name: str, algorithm: SortingAlgorithm, n: int,
+               ascending: bool = True, seed: int = 0) -> List[int]:
+    """
+    Build an input for one rung of the ladder
+
+    Args:
+        input_name: Distribution from src.distributions, or adversary
+                   from src.adversarial (built against algorithm)
+        algorithm: Algorithm the input is for
+        n: Input size
+        ascending: Sort direction
+        seed: Random seed for distributions
+
+    Returns:
+        List of n integers
+
+    Raises:
+        ValueError: If input_name is neither a distribution nor an adversary
+        TypeError: If the adversary cannot attack the algorithm
+    """
+    if input_name in ADVERSARIES:
+        return ADVERSARIES[input_name](algorithm, n, ascending)
+    if input_name not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown input: {input_name}. "
+                         f"Available: {list(DISTRIBUTIONS) + list(ADVERSARIES)}")
+    return generate(input_name, n, seed)
+
+
+def measure_cost(algorithm: SortingAlgorithm, values: List[int], ascending: bool = True,
+                 metric: str = 'time', repeat: int = 3) -> float:
+    """
+    Measure the cost of sorting values
+
+    Args:
+        algorithm: SortingAlgorithm instance
+        values: Input list (not modified)
+        ascending: Sort direction
+        metric: 'time' (best of repeat runs, in seconds) or 'comparisons'
+        repeat: Timed runs for the 'time' metric
+
+    Returns:
+        The cost
+
+    Raises:
+        ValueError: If metric is not in METRICS
+    """
+    if metric == 'comparisons':
+        return instrumented_sort(algorithm, values, ascending)[1].comparisons
+    if metric != 'time':
+        raise ValueError(f"Unknown metric: {metric}. Available: {METRICS}")
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        algorithm.sort(values, ascending)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def profile_algorithm(algorithm: SortingAlgorithm, input_name: str, sizes: Sequence[int],
+                      ascending: bool = True, metric: str = 'time', repeat: int = 3,
+                      time_limit: float = 1.0, tolerance: float = DEFAULT_TOLERANCE,
+                      seed: int = 0) -> dict:
+    """
+    Measure one algorithm over a size ladder and compare its growth with
+    the class it advertises (SortingAlgorithm.complexity)
+
+    The ladder stops early once the next size is projected, quadratically,
+    to take longer than time_limit. A RecursionError or MemoryError ends
+    the ladder and flags the algorithm: the input drove it past what its
+    advertised class allows for.
+
+    Args:
+        algorithm: SortingAlgorithm instance
+        input_name: Distribution or adversary name (see make_input)
+        sizes: Increasing input sizes, e.g. from geometric_sizes
+        ascending: Sort direction
+        metric: Cost metric from METRICS
+        repeat: Timed runs per size for the 'time' metric
+        time_limit: Seconds per size above which the ladder stops
+        tolerance: Exponent excess over the advertised class that is flagged
+        seed: Random seed for distributions
+
+    Returns:
+        Dictionary with the algorithm and input names, the advertised
+        'complexity', measured 'sizes' and 'costs', the fitted 'exponent'
+        and 'expected_exponent' (None when they cannot be fitted),
+        'flagged', and 'error' (the exception name that ended the ladder,
+        'not applicable' when the adversary cannot attack the algorithm)
+    """
+    measured_sizes: List[int] = []
+    costs: List[float] = []
+    error = ''
+    elapsed = 0.0
+    for n in sizes:
+        if measured_sizes and elapsed * (n / measured_sizes[-1]) ** 2 > time_limit:
+            break
+        start = time.perf_counter()
+        try:
+            values = make_input(input_name, algorithm, n, ascending, seed)
+            cost = measure_cost(algorithm, values, ascending, metric, repeat)
+        except TypeError:
+            if input_name not in ADVERSARIES:
+                raise
+            error = 'not applicable'
+            break
+        except (RecursionError, MemoryError) as e:
+            error = type(e).__name__
+            break
+        elapsed = (time.perf_counter() - start) / (repeat if metric == 'time' else 1)
+        measured_sizes.append(n)
+        costs.append(cost)
+
+    complexity = algorithm.complexity
+    exponent: Optional[float] = None
+    expected: Optional[float] = None
+    if len(measured_sizes) >= 2 and min(costs) > 0:
+        exponent = fit_exponent(measured_sizes, costs)
+        if complexity is not None:
+            expected = expected_exponent(complexity, measured_sizes)
+    flagged = error in ('RecursionError', 'MemoryError') or (
+        exponent is not None and expected is not None and exponent > expected + tolerance)
+    return {
+        'algorithm': algorithm.get_name(),
+        'input': input_name,
+        'complexity': complexity,
+        'sizes': measured_sizes,
+        'costs': costs,
+        'exponent': exponent,
+        'expected_exponent': expected,
+        'flagged': flagged,
+        'error': error,
+    }
+
+
+def profile_complexity(algorithms: Sequence[str], inputs: Sequence[str], sizes: Sequence[int],
+                       ascending: bool = True, metric: str = 'time', repeat: int = 3,
+                       time_limit: float = 1.0, tolerance: float = DEFAULT_TOLERANCE,
+                       seed: int = 0, factory=None) -> List[dict]:
+    """
+    Profile every named algorithm on every input over a size ladder
+
+    Args:
+        algorithms: Algorithm names known to the factory ('auto' is not an
+                   algorithm of its own and cannot be profiled)
+        inputs: Distribution and adversary names
+        sizes: Increasing input sizes
+        ascending: Sort direction
+        metric: Cost metric from METRICS
+        repeat: Timed runs per size for the 'time' metric
+        time_limit: Seconds per size above which a ladder stops
+        tolerance: Exponent excess over the advertised class that is flagged
+        seed: Random seed for distributions
+        factory: SortingFactory whose algorithms are used (default: a new one)
+
+    Returns:
+        List of profile_algorithm results, each with 'name' set to the
+        algorithm name
+
+    Raises:
+        ValueError: If an algorithm name is unknown
+    """
+    if factory is None:
+        # Imported here: the factory imports most of the package
+        from .sorting_factory import SortingFactory
+        factory = SortingFactory()
+    results = []
+    for name in algorithms:
+        if name not in factory.algorithms:
+            raise ValueError(f"Unknown algorithm: {name}. "
+                             f"Available: {factory.algorithms.names()}")
+        for input_name in inputs:
+            result = profile_algorithm(factory.algorithms[name], input_name, sizes, ascending,
+                                       metric, repeat, time_limit, tolerance, seed)
+            result['name'] = name
+            results.append(result)
+    return results
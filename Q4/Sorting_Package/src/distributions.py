@@ -0,0 +1,82 @@
+"""
+src/distributions.py
+Input generators for benchmarking and profiling sorting algorithms
+"""
+import random
+from typing import Callable, Dict, List
+from .validation import INT32_MAX, INT32_MIN
+
+
+def random_values(n: int, rng: random.Random) -> List[int]:
+    """Uniformly random INT32 values"""
+    return [rng.randint(INT32_MIN, INT32_MAX) for _ in range(n)]
+
+
+def sorted_values(n: int, rng: random.Random) -> List[int]:
+    """Random values in ascending order"""
+    return sorted(random_values(n, rng))
+
+
+def reversed_values(n: int, rng: random.Random) -> List[int]:
+    """Random values in descending order"""
+    return sorted(random_values(n, rng), reverse=True)
+
+
+def few_unique_values(n: int, rng: random.Random) -> List[int]:
+    """Values drawn from a pool of 8 distinct keys"""
+    pool = [rng.randint(INT32_MIN, INT32_MAX) for _ in range(8)]
+    return [rng.choice(pool) for _ in range(n)]
+
+
+def organ_pipe_values(n: int, rng: random.Random) -> List[int]:
+    """Ascending first half followed by its mirror image"""
+    half = sorted_values((n + 1) // 2, rng)
+    return half + half[n // 2 - 1::-1] if n > 1 else half
+
+
+def sawtooth_values(n: int, rng: random.Random) -> List[int]:
+    """Repeated ascending ramps, about sqrt(n) elements each"""
+    tooth = max(1, int(n ** 0.5))
+    values = random_values(n, rng)
+    return [x for start in range(0, n, tooth) for x in sorted(values[start:start + tooth])]
+
+
+def nearly_sorted_values(n: int, rng: random.Random) -> List[int]:
+    """Sorted values with about 1% of positions swapped at random"""
+    values = sorted_values(n, rng)
+    for _ in range(max(1, n // 100) if n > 1 else 0):
+        i, j = rng.randrange(n), rng.randrange(n)
+        values[i], values[j] = values[j], values[i]
+    return values
+
+
+DISTRIBUTIONS: Dict[str, Callable[[int, random.Random], List[int]]] = {
+    'random': random_values,
+    'sorted': sorted_values,
+    'reversed': reversed_values,
+    'few_unique': few_unique_values,
+    'organ_pipe': organ_pipe_values,
+    'sawtooth': sawtooth_values,
+    'nearly_sorted': nearly_sorted_values,
+}
+
+
+def generate(distribution: str, n: int, seed: int = 0) -> List[int]:
+    """
+    Generate an input list
+
+    Args:
+        distribution: Name of a distribution in DISTRIBUTIONS
+        n: Number of elements
+        seed: Random seed, so every algorithm sees the same input
+
+    Returns:
+        List of n INT32 values
+
+    Raises:
+        ValueError: If distribution name is invalid
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution: {distribution}. "
+                         f"Available: {list(DISTRIBUTIONS.keys())}")
+    return DISTRIBUTIONS[distribution](n, random.Random(seed))
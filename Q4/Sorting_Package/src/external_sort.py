@@ -0,0 +1,274 @@
+"""
+src/external_sort.py
+External-memory sort for integer files larger than RAM
+"""
+import os
+import sys
+import tempfile
+from array import array
+from itertools import islice
+from typing import Iterator, List, Optional
+from .kway_merge import merge_sorted
+from .sorting_factory import SortingFactory
+from .validation import MAX_INPUT_SIZE
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+DEFAULT_FAN_IN = 16
+# Bytes per value held in a list: the 8-byte slot and a 32-byte int object
+LIST_VALUE_BYTES = 8 + sys.getsizeof(-2 ** 31)
+# Estimated bytes per element while a run is sorted in memory: the
+# pending list, the slice taken of it, the algorithm's working storage
+# (about 20 bytes for radix, tim and merge sort) and the packed run
+SORT_BYTES_PER_ELEMENT = LIST_VALUE_BYTES + 8 + 24 + 4
+# Estimated bytes per input character while a block is parsed: the text,
+# its comma-free copy, the token strings (about 60 bytes each) and the
+# parsed int list, measured at 17-23 bytes
+READ_BYTES_PER_CHAR = 24
+# Bytes kept out of the budget's split for what every phase holds: the
+# buffers of the open text files, the run list and the merge heap
+FIXED_BYTES = 64 * 1024
+# Share of the budget (1/READ_BUDGET_DIVISOR) given to parsing the input;
+# the rest holds the run being sorted
+READ_BUDGET_DIVISOR = 8
+# Upper bound on the characters read from the text input per block
+READ_BLOCK_CHARS = 1 << 20
+# Estimated bytes per value while output text is formatted: the value in a
+# list, its string (about 60 bytes) held by join, and the joined text
+TEXT_BYTES_PER_VALUE = LIST_VALUE_BYTES + 8 + 60 + 12
+
+
+def iter_int_blocks(filename: str, block_chars: int = READ_BLOCK_CHARS) -> Iterator[List[int]]:
+    """
+    Stream integers from a text file separated by commas and/or whitespace
+
+    Args:
+        filename: Path to the input file
+        block_chars: Number of characters read per block
+
+    Yields:
+        Lists of the integers parsed from each block
+
+    Raises:
+        ValueError: If the file contains a token that is not an integer
+    """
+    with open(filename, 'r', encoding='utf-8') as f:
+        tail = ''
+        while True:
+            block = f.read(block_chars)
+            if not block:
+                break
+            tokens = (tail + block).replace(',', ' ').split()
+            # A token touching the end of the block may continue in the next
+            tail = tokens.pop() if tokens and not (block[-1].isspace() or block[-1] == ',') else ''
+            yield list(map(int, tokens))
+        if tail:
+            yield [int(tail)]
+
+
+def _read_run(filename: str, block_elements: int) -> Iterator[int]:
+    """
+    Stream the values of a binary run file one block at a time
+
+    Args:
+        filename: Path to a run written with array('i').tofile
+        block_elements: Number of values buffered per read
+
+    Yields:
+        The run's values in file order
+    """
+    # Unbuffered: fromfile reads whole blocks, so a buffer per open run
+    # would only add to the merge's memory
+    with open(filename, 'rb', buffering=0) as f:
+        while True:
+            block = array('i')
+            try:
+                block.fromfile(f, block_elements)
+            except EOFError:
+                # fromfile keeps the items read before hitting end of file
+                pass
+            if not block:
+                return
+            yield from block
+
+
+class ExternalSorter:
+    """
+    External merge sort
+
+    Streams the input, sorts it in memory-budget-sized chunks with a
+    registered algorithm, spills each sorted run to a temporary file as
+    packed int32 values and k-way merges the runs with bounded memory,
+    merging in several passes when there are more runs than the fan-in.
+
+    Block sizes come from the estimated cost of each phase (the *_BYTES_*
+    constants). After FIXED_BYTES, 1/READ_BUDGET_DIVISOR of the budget
+    parses the input and the rest holds the run being sorted; while
+    merging, each input run, the output and one read in flight get an
+    equal share.
+    """
+    def __init__(self, memory_budget: int = DEFAULT_MEMORY_BUDGET, fan_in: int = DEFAULT_FAN_IN,
+                 algorithm_name: str = 'radix', temp_dir: Optional[str] = None):
+        """
+        Initialize the sorter
+
+        Args:
+            memory_budget: Approximate memory limit in bytes
+            fan_in: Maximum number of runs merged at once (at least 2)
+            algorithm_name: Factory algorithm used to sort each run
+            temp_dir: Directory for run files (default: system temp dir)
+
+        Raises:
+            ValueError: If fan_in is below 2 or memory_budget is too small
+        """
+        if fan_in < 2:
+            raise ValueError("Fan-in must be at least 2")
+        memory_budget -= FIXED_BYTES
+        read_budget = memory_budget // READ_BUDGET_DIVISOR
+        self.read_chars = min(read_budget // READ_BYTES_PER_CHAR, READ_BLOCK_CHARS)
+        self.run_size = min((memory_budget - read_budget) // SORT_BYTES_PER_ELEMENT,
+                            MAX_INPUT_SIZE)
+        # Each merge input and the output keep one block: int32 values for
+        # runs, formatted values for the text output. One more share covers
+        # the bytes that array.fromfile reads before copying them in, and
+        # blocks are cut by 1/16, what arrays over-allocate when they grow
+        share = memory_budget * 15 // (16 * (fan_in + 2))
+        self.block_elements = share // array('i').itemsize
+        self.text_block_elements = share // TEXT_BYTES_PER_VALUE
+        if min(self.read_chars, self.run_size, self.text_block_elements) < 1:
+            raise ValueError(f"Memory budget of {memory_budget + FIXED_BYTES} bytes is too small")
+        self.fan_in = fan_in
+        self.algorithm_name = algorithm_name
+        self.temp_dir = temp_dir
+        self.factory = SortingFactory()
+    def sort_file(self, input_file: str, output_file: str, ascending: bool = True) -> int:
+        """
+        Sort the integers in input_file, writing one per line to output_file
+
+        Args:
+            input_file: Text file of integers separated by commas/whitespace
+            output_file: Path of the sorted output file
+            ascending: If True, sort ascending, else descending
+
+        Returns:
+            Number of integers sorted
+
+        Raises:
+            ValueError: If the input holds non-integers or values outside
+                       INT32 range
+        """
+        with tempfile.TemporaryDirectory(dir=self.temp_dir) as work_dir:
+            runs, count = self._make_runs(input_file, work_dir, ascending)
+            pass_number = 0
+            while len(runs) > self.fan_in:
+                merged_runs = []
+                for i in range(0, len(runs), self.fan_in):
+                    run_file = os.path.join(work_dir, f"pass{pass_number}_{i}.bin")
+                    self._merge_to_run(runs[i:i + self.fan_in], run_file, ascending)
+                    merged_runs.append(run_file)
+                runs = merged_runs
+                pass_number += 1
+            self._merge_to_text(runs, output_file, ascending)
+        return count
+    def _make_runs(self, input_file: str, work_dir: str, ascending: bool):
+        """
+        Split the input into sorted run files
+
+        Args:
+            input_file: Text input file
+            work_dir: Directory for run files
+            ascending: Sort order of each run
+
+        Returns:
+            Tuple (list of run file paths, number of values read)
+        """
+        runs = []
+        count = 0
+        pending = []
+        for values in iter_int_blocks(input_file, self.read_chars):
+            pending.extend(values)
+            while len(pending) >= self.run_size:
+                runs.append(self._spill(pending[:self.run_size], work_dir, len(runs), ascending))
+                count += self.run_size
+                del pending[:self.run_size]
+        if pending or not runs:
+            runs.append(self._spill(pending, work_dir, len(runs), ascending))
+            count += len(pending)
+        return runs, count
+    def _spill(self, values: List[int], work_dir: str, index: int, ascending: bool) -> str:
+        """
+        Sort values and write them to a binary run file
+
+        Args:
+            values: Values of one run
+            work_dir: Directory for run files
+            index: Run number, used for the file name
+            ascending: Sort order
+
+        Returns:
+            Path of the run file
+        """
+        run_file = os.path.join(work_dir, f"run{index}.bin")
+        result = self.factory.sort(self.algorithm_name, values, ascending)
+        with open(run_file, 'wb') as f:
+            array('i', result).tofile(f)
+        return run_file
+    def _merge(self, runs: List[str], ascending: bool) -> Iterator[int]:
+        """Lazily k-way merge the given run files"""
+        readers = [_read_run(run, self.block_elements) for run in runs]
+        return merge_sorted(*readers, ascending=ascending)
+    def _merge_to_run(self, runs: List[str], run_file: str, ascending: bool) -> None:
+        """
+        Merge run files into a single binary run file, deleting the inputs
+
+        Args:
+            runs: Paths of the runs to merge
+            run_file: Path of the merged run
+            ascending: Sort order of the runs
+        """
+        merged = self._merge(runs, ascending)
+        with open(run_file, 'wb') as f:
+            while True:
+                block = array('i', islice(merged, self.block_elements))
+                if not block:
+                    break
+                block.tofile(f)
+        for run in runs:
+            os.remove(run)
+    def _merge_to_text(self, runs: List[str], output_file: str, ascending: bool) -> None:
+        """
+        Merge run files into the text output file
+
+        Args:
+            runs: Paths of the runs to merge
+            output_file: Path of the output file
+            ascending: Sort order of the runs
+        """
+        merged = self._merge(runs, ascending)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            while True:
+                block = list(islice(merged, self.text_block_elements))
+                if not block:
+                    break
+                f.write('\n'.join(map(str, block)))
+                f.write('\n')
+
+
+def external_sort(input_file: str, output_file: str, ascending: bool = True,
+                  memory_budget: int = DEFAULT_MEMORY_BUDGET, fan_in: int = DEFAULT_FAN_IN,
+                  algorithm_name: str = 'radix') -> int:
+    """
+    Sort an integer file of any size with bounded memory
+
+    Args:
+        input_file: Text file of integers separated by commas/whitespace
+        output_file: Path of the sorted output file (one integer per line)
+        ascending: If True, sort ascending, else descending
+        memory_budget: Approximate memory limit in bytes
+        fan_in: Maximum number of runs merged at once
+        algorithm_name: Factory algorithm used to sort each run
+
+    Returns:
+        Number of integers sorted
+    """
+    sorter = ExternalSorter(memory_budget, fan_in, algorithm_name)
+    return sorter.sort_file(input_file, output_file, ascending)
@@ -0,0 +1,158 @@
+"""
+src/instrumentation.py
+Operation counting for sorting algorithms
+"""
+import sys
+from typing import List, Tuple
+
+
+class SortStats:
+    """Operation counters collected during one instrumented sort"""
+    def __init__(self):
+        """Initialize all counters to zero"""
+        self.comparisons = 0
+        self.moves = 0
+        self.allocations = 0
+        self.max_depth = 0
+        self.peak_bytes = 0
+    def as_dict(self) -> dict:
+        """Return the counters as a dictionary"""
+        return {
+            'comparisons': self.comparisons,
+            'moves': self.moves,
+            'allocations': self.allocations,
+            'max_depth': self.max_depth,
+            'peak_bytes': self.peak_bytes,
+        }
+    def __repr__(self) -> str:
+        counters = ', '.join(f"{name}={value}" for name, value in self.as_dict().items())
+        return f"SortStats({counters})"
+
+
+# Counters of the instrumented sort in progress
+_current = SortStats()
+
+
+class CountingInt(int):
+    """int whose rich comparisons are counted"""
+    __slots__ = ()
+    __hash__ = int.__hash__
+    def __lt__(self, other):
+        _current.comparisons += 1
+        return int.__lt__(self, other)
+    def __le__(self, other):
+        _current.comparisons += 1
+        return int.__le__(self, other)
+    def __gt__(self, other):
+        _current.comparisons += 1
+        return int.__gt__(self, other)
+    def __ge__(self, other):
+        _current.comparisons += 1
+        return int.__ge__(self, other)
+    def __eq__(self, other):
+        _current.comparisons += 1
+        return int.__eq__(self, other)
+    def __ne__(self, other):
+        _current.comparisons += 1
+        return int.__ne__(self, other)
+
+
+class CountingList(list):
+    """list that counts element writes and the copies taken of it"""
+    __slots__ = ()
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            _current.moves += len(value)
+        else:
+            _current.moves += 1
+        list.__setitem__(self, index, value)
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            _current.allocations += 1
+        return list.__getitem__(self, index)
+    def copy(self):
+        _current.allocations += 1
+        return CountingList(self)
+    def reverse(self):
+        _current.moves += len(self)
+        list.reverse(self)
+
+
+def _depth_profiler(filename: str, stats: SortStats):
+    """
+    Build a sys.setprofile hook tracking nested calls into one source file
+
+    Args:
+        filename: Source file of the algorithm being measured
+        stats: Counters receiving the maximum depth
+
+    Returns:
+        Profile function
+    """
+    depth = 0
+
+    def profile(frame, event, _arg):
+        nonlocal depth
+        if frame.f_code.co_filename != filename:
+            return
+        if event == 'call':
+            depth += 1
+            stats.max_depth = max(stats.max_depth, depth)
+        elif event == 'return':
+            depth -= 1
+    return profile
+
+
+def instrumented_sort(algorithm, arr: List[int], ascending: bool = True) -> Tuple[List[int], SortStats]:
+    """
+    Run algorithm.sort on instrumented data and collect operation counts
+
+    Nothing in the algorithms changes: the input is wrapped in a
+    CountingList of CountingInt values, so comparisons and writes are
+    counted by the data itself, and uninstrumented sorts run at full speed.
+
+    Counters:
+        comparisons: Element comparisons (including those made by bisect
+                     and heapq on the algorithm's behalf)
+        moves: Element writes into lists derived from the input; algorithms
+               that build their output in fresh lists (e.g. radix
+               buckets) and work done in child processes are not counted
+        allocations: Copies and slices taken of the input list
+        max_depth: Deepest nesting of Python calls in the algorithm's module
+        peak_bytes: Peak memory allocated during the sort (tracemalloc)
+
+    Args:
+        algorithm: SortingAlgorithm instance
+        arr: List of integers to sort
+        ascending: If True, sort in ascending order, else descending
+
+    Returns:
+        Tuple (sorted list of plain ints, SortStats)
+    """
+    global _current
+    # Imported here: every algorithm module imports this one, and
+    # tracemalloc is only needed for instrumented runs
+    import tracemalloc
+    stats = SortStats()
+    data = CountingList(CountingInt(x) for x in arr)
+    filename = sys.modules[type(algorithm).__module__].__file__
+
+    previous_stats = _current
+    previous_profile = sys.getprofile()
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    base_bytes = tracemalloc.get_traced_memory()[0]
+    _current = stats
+    sys.setprofile(_depth_profiler(filename, stats))
+    try:
+        result = algorithm.sort(data, ascending)
+    finally:
+        sys.setprofile(previous_profile)
+        _current = previous_stats
+        stats.peak_bytes = max(0, tracemalloc.get_traced_memory()[1] - base_bytes)
+        if started_tracing:
+            tracemalloc.stop()
+    return [int(x) for x in result], stats
@@ -0,0 +1,186 @@
+"""
+src/intro_sort.py
+Introsort implementation (production quick sort)
+"""
+from typing import List
+from .sorting_base import SortingAlgorithm, reverse_in_place, working_copy
+
+# Ranges at or below this size are finished with insertion sort
+INSERTION_CUTOFF = 16
+# Ranges above this size use Tukey's ninther instead of median-of-three
+NINTHER_THRESHOLD = 128
+
+
+class IntroSort(SortingAlgorithm):
+    """
+    Introsort implementation
+
+    Quick sort hardened against its worst cases: median-of-three / ninther
+    pivots, three-way partitioning for duplicate-heavy input, an insertion
+    sort cutoff for small ranges, recursion on the smaller side only and a
+    heap sort fallback once the depth exceeds 2*log2(n).
+    """
+    complexity = 'n log n'
+    def sort(self, arr: List[int], ascending: bool = True, inplace: bool = False) -> List[int]:
+        """
+        Sort array using introsort
+
+        Auxiliary memory: O(1) beyond an O(log n) recursion stack; the
+        heap sort fallback also works within the array. Unless inplace is
+        set, the input is first copied (O(n)).
+
+        Args:
+            arr: List of integers to sort
+            ascending: If True, sort in ascending order, else descending
+            inplace: If True, sort arr (a list or writable buffer) itself
+                    and return it
+
+        Returns:
+            Sorted list of integers
+        """
+        result = working_copy(arr, inplace)
+        n = len(result)
+        if n > 1:
+            self._intro_sort(result, 0, n - 1, 2 * n.bit_length())
+        if not ascending:
+            reverse_in_place(result)
+        return result
+    def _intro_sort(self, arr: List[int], low: int, high: int, depth_limit: int) -> None:
+        """
+        Sort arr[low..high] in ascending order
+
+        Only the smaller partition is sorted recursively; the larger one is
+        handled by the loop, so the call stack never exceeds log2(n) frames.
+
+        Args:
+            arr: List to sort in-place
+            low: Starting index
+            high: Ending index
+            depth_limit: Remaining partitioning levels before heap sort
+        """
+        while high - low >= INSERTION_CUTOFF:
+            if depth_limit == 0:
+                self._heap_sort(arr, low, high)
+                return
+            depth_limit -= 1
+            pivot = self._choose_pivot(arr, low, high)
+            lt, gt = self._partition(arr, low, high, pivot)
+            if lt - low < high - gt:
+                self._intro_sort(arr, low, lt - 1, depth_limit)
+                low = gt + 1
+            else:
+                self._intro_sort(arr, gt + 1, high, depth_limit)
+                high = lt - 1
+        self._insertion_sort(arr, low, high)
+    @staticmethod
+    def _median_of_three(a: int, b: int, c: int) -> int:
+        """Return the median of three values"""
+        if a < b:
+            if b < c:
+                return b
+            return c if a < c else a
+        if a < c:
+            return a
+        return c if b < c else b
+    def _choose_pivot(self, arr: List[int], low: int, high: int) -> int:
+        """
+        Choose a pivot value for arr[low..high]
+
+        Args:
+            arr: List being sorted
+            low: Starting index
+            high: Ending index
+
+        Returns:
+            Median of three samples, or Tukey's ninther for large ranges
+        """
+        mid = (low + high) // 2
+        if high - low < NINTHER_THRESHOLD:
+            return self._median_of_three(arr[low], arr[mid], arr[high])
+        step = (high - low) // 8
+        med3 = self._median_of_three
+        return med3(
+            med3(arr[low], arr[low + step], arr[low + 2 * step]),
+            med3(arr[mid - step], arr[mid], arr[mid + step]),
+            med3(arr[high - 2 * step], arr[high - step], arr[high]),
+        )
+    @staticmethod
+    def _partition(arr: List[int], low: int, high: int, pivot: int):
+        """
+        Three-way (Dutch national flag) partition of arr[low..high]
+
+        Args:
+            arr: List to partition
+            low: Starting index
+            high: Ending index
+            pivot: Pivot value
+
+        Returns:
+            Tuple (lt, gt) such that arr[low..lt-1] < pivot,
+            arr[lt..gt] == pivot and arr[gt+1..high] > pivot
+        """
+        lt = i = low
+        gt = high
+        while i <= gt:
+            value = arr[i]
+            if value < pivot:
+                arr[i] = arr[lt]
+                arr[lt] = value
+                lt += 1
+                i += 1
+            elif value > pivot:
+                arr[i] = arr[gt]
+                arr[gt] = value
+                gt -= 1
+            else:
+                i += 1
+        return lt, gt
+    @staticmethod
+    def _insertion_sort(arr: List[int], low: int, high: int) -> None:
+        """
+        Insertion sort for arr[low..high]
+
+        Args:
+            arr: List to sort in-place
+            low: Starting index
+            high: Ending index
+        """
+        for i in range(low + 1, high + 1):
+            value = arr[i]
+            j = i - 1
+            while j >= low and arr[j] > value:
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = value
+    @staticmethod
+    def _heap_sort(arr: List[int], low: int, high: int) -> None:
+        """
+        Heap sort for arr[low..high], used when partitioning degenerates
+
+        Args:
+            arr: List to sort in-place
+            low: Starting index
+            high: Ending index
+        """
+        def sift_down(root: int, size: int) -> None:
+            value = arr[low + root]
+            child = 2 * root + 1
+            while child < size:
+                if child + 1 < size and arr[low + child] < arr[low + child + 1]:
+                    child += 1
+                if arr[low + child] <= value:
+                    break
+                arr[low + root] = arr[low + child]
+                root = child
+                child = 2 * root + 1
+            arr[low + root] = value
+
+        size = high - low + 1
+        for start in range(size // 2 - 1, -1, -1):
+            sift_down(start, size)
+        for end in range(size - 1, 0, -1):
+            arr[low], arr[low + end] = arr[low + end], arr[low]
+            sift_down(0, end)
+    def get_name(self) -> str:
+        """Return the name of the sorting algorithm"""
+        return "Intro Sort"
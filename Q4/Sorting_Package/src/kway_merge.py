@@ -0,0 +1,165 @@
+"""
+src/kway_merge.py
+K-way merge of already sorted inputs
+"""
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from operator import itemgetter, neg
+from typing import Iterable, Iterator, List
+
+# Sequence types merged by the galloping bulk path
+SEQUENCE_TYPES = (list, tuple, array)
+# Consecutive values from one input after which its run is galloped
+MIN_GALLOP = 7
+# Heap operations after which a merge averaging fewer than
+# PROBE_MIN_RUN values per operation hands over to heapq.merge, whose
+# tighter per-value loop wins when the inputs interleave finely
+PROBE_OPERATIONS = 1024
+PROBE_MIN_RUN = 2
+
+
+def merge_sorted(*iterables: Iterable[int], ascending: bool = True) -> Iterator[int]:
+    """
+    Lazily merge inputs that are each sorted in the given direction
+
+    Memory is O(k) for k inputs: a heap holds the current head of every
+    input. When every input is an in-memory list, tuple or array, the
+    merge also gallops: once one input has supplied MIN_GALLOP values in
+    a row, the rest of its run (everything preceding the next head of the
+    other inputs) is located by exponential search plus bisection and
+    copied as one slice, so long runs cost O(log run) comparisons instead
+    of a heap operation per element. Equal values come out in input order
+    (the merge is stable).
+
+    Args:
+        *iterables: Sorted iterables of integers (ascending, or
+                   descending when ascending is False)
+        ascending: Direction the inputs are sorted in, and of the output
+
+    Yields:
+        The merged values
+    """
+    if all(isinstance(iterable, SEQUENCE_TYPES) for iterable in iterables):
+        return _merge_sequences(iterables, ascending)
+    return heapq.merge(*iterables, reverse=not ascending)
+
+
+def merge_sorted_list(*iterables: Iterable[int], ascending: bool = True) -> List[int]:
+    """
+    Merge sorted inputs into a new list (see merge_sorted)
+
+    Args:
+        *iterables: Sorted iterables of integers
+        ascending: Direction the inputs are sorted in, and of the output
+
+    Returns:
+        List of the merged values
+    """
+    return list(merge_sorted(*iterables, ascending=ascending))
+
+
+def _gallop(seq, pos: int, bound: int, strict: bool, sign: int, key) -> int:
+    """
+    Return the end of the run of seq starting at pos that precedes bound
+
+    Probes pos+1, pos+2, pos+4, ... until a value is past the run, then
+    bisects (in C) between the last two probes.
+
+    Args:
+        seq: Sorted sequence; seq[pos] belongs to the run
+        pos: Start of the run
+        bound: Head of the next input, as a heap key (sign * value)
+        strict: If True, values equal to bound end the run
+        sign: 1 for ascending inputs, -1 for descending ones
+        key: Bisection key turning values into heap keys (None or neg)
+
+    Returns:
+        Index of the first value of seq after the run
+    """
+    n = len(seq)
+    lo = pos
+    hi = pos + 1
+    step = 1
+    while hi < n:
+        value = sign * seq[hi]
+        if value > bound or (strict and value == bound):
+            break
+        lo = hi
+        step *= 2
+        hi = pos + step
+    search = bisect_left if strict else bisect_right
+    return search(seq, bound, lo + 1, min(hi, n), key=key)
+
+
+def _merge_sequences(sequences, ascending: bool) -> Iterator[int]:
+    """
+    Merge sorted sequences, galloping through long runs
+
+    The heap holds [key, input number] with key = value (or -value for
+    descending inputs), so ties go to the earlier input. Values are
+    taken one at a time while the winning input keeps changing; after
+    MIN_GALLOP consecutive wins the current input's run is copied as a
+    slice in one step.
+
+    Args:
+        sequences: Sorted lists, tuples or arrays
+        ascending: Sort direction of the inputs
+
+    Yields:
+        The merged values
+    """
+    sign = 1 if ascending else -1
+    key = None if ascending else neg
+    # Entries are [key, input number, position, sequence]; input numbers
+    # are unique, so the sequences themselves are never compared
+    heap = [[sign * seq[0], i, 0, seq] for i, seq in enumerate(sequences) if len(seq)]
+    heapq.heapify(heap)
+    heappop, heapreplace = heapq.heappop, heapq.heapreplace
+    last = -1
+    wins = 0
+    operations = 0
+    start = sum(len(seq) for seq in sequences)
+    while len(heap) > 1:
+        operations += 1
+        if operations == PROBE_OPERATIONS:
+            remaining = sum(len(entry[3]) - entry[2] for entry in heap)
+            if start - remaining < PROBE_MIN_RUN * PROBE_OPERATIONS:
+                # Input numbers order the iterators so ties still go to
+                # the earlier input
+                heap.sort(key=itemgetter(1))
+                yield from heapq.merge(*(islice(seq, pos, None) for _, _, pos, seq in heap),
+                                       reverse=not ascending)
+                return
+        entry = heap[0]
+        if entry[1] != last:
+            last = entry[1]
+            wins = 1
+            pos = entry[2]
+            seq = entry[3]
+            yield seq[pos]
+            pos += 1
+        elif wins < MIN_GALLOP - 1:
+            wins += 1
+            yield seq[pos]
+            pos += 1
+        else:
+            # The runner-up is the smaller child of the root
+            bound, j = (heap[1] if len(heap) == 2 else min(heap[1], heap[2]))[:2]
+            end = _gallop(seq, pos, bound, last > j, sign, key)
+            yield from seq[pos:end]
+            pos = end
+            wins = 0
+        try:
+            entry[0] = sign * seq[pos]
+        except IndexError:
+            heappop(heap)
+            # Another input wins next, so the cached seq/pos are reloaded
+            last = -1
+            continue
+        entry[2] = pos
+        heapreplace(heap, entry)
+    if heap:
+        _, _, pos, seq = heap[0]
+        yield from seq[pos:]
@@ -2,27 +2,37 @@
 src/merge_sort.py
 Merge Sort implementation
 """
-from typing import List
-from .sorting_base import SortingAlgorithm
+from typing import Callable, List
+from .sorting_base import SortingAlgorithm, copy_range, working_copy
 
 
 class MergeSort(SortingAlgorithm):
     """Merge Sort implementation"""
-    def sort(self, arr: List[int], ascending: bool = True) -> List[int]:
+    complexity = 'n log n'
+    def sort(self, arr: List[int], ascending: bool = True, inplace: bool = False) -> List[int]:
         """
         Sort array using merge sort algorithm
         
+        Auxiliary memory: O(n); each merge copies both halves into
+        temporary lists, plus an O(log n) recursion stack. Unless inplace
+        is set, the input is first copied (O(n)).
+        
         Args:
             arr: List of integers to sort
             ascending: If True, sort in ascending order, else descending
+            inplace: If True, sort arr (a list or writable buffer) itself
+                    and return it
             
         Returns:
             Sorted list of integers
         """
-        result = arr.copy()
-        self._merge_sort_helper(result, 0, len(result) - 1, ascending)
+        result = working_copy(arr, inplace)
+        # The direction is resolved once by picking the merge function
+        merge = self._merge_ascending if ascending else self._merge_descending
+        self._merge_sort_helper(result, 0, len(result) - 1, merge)
         return result
-    def _merge_sort_helper(self, arr: List[int], left: int, right: int, ascending: bool) -> None:
+    def _merge_sort_helper(self, arr: List[int], left: int, right: int,
+                           merge: Callable[[List[int], int, int, int], None]) -> None:
         """
         Helper function for merge sort
         
@@ -30,54 +40,78 @@ class MergeSort(SortingAlgorithm):
             arr: List to sort in-place
             left: Starting index
             right: Ending index
-            ascending: Sort order
+            merge: Merge function for the sort order
         """
         if left < right:
             mid = (left + right) // 2
-            self._merge_sort_helper(arr, left, mid, ascending)
-            self._merge_sort_helper(arr, mid + 1, right, ascending)
-            self._merge(arr, left, mid, right, ascending)
-    def _merge(self, arr: List[int], left: int, mid: int, right: int, ascending: bool) -> None:
+            self._merge_sort_helper(arr, left, mid, merge)
+            self._merge_sort_helper(arr, mid + 1, right, merge)
+            merge(arr, left, mid, right)
+    @staticmethod
+    def _merge_ascending(arr: List[int], left: int, mid: int, right: int) -> None:
         """
-        Merge two sorted subarrays
+        Merge two subarrays sorted in ascending order
+        
         Args:
             arr: List containing subarrays
             left: Starting index of left subarray
             mid: Ending index of left subarray
             right: Ending index of right subarray
-            ascending: Sort order
         """
-        left_part = arr[left:mid + 1]
-        right_part = arr[mid + 1:right + 1]
+        left_part = copy_range(arr, left, mid + 1)
+        right_part = copy_range(arr, mid + 1, right + 1)
+        left_len = len(left_part)
+        right_len = len(right_part)
         
         i = j = 0
         k = left
         
-        while i < len(left_part) and j < len(right_part):
-            if ascending:
-                if left_part[i] <= right_part[j]:
-                    arr[k] = left_part[i]
-                    i += 1
-                else:
-                    arr[k] = right_part[j]
-                    j += 1
+        while i < left_len and j < right_len:
+            if left_part[i] <= right_part[j]:
+                arr[k] = left_part[i]
+                i += 1
             else:
-                if left_part[i] >= right_part[j]:
-                    arr[k] = left_part[i]
-                    i += 1
-                else:
-                    arr[k] = right_part[j]
-                    j += 1
+                arr[k] = right_part[j]
+                j += 1
             k += 1
         
-        while i < len(left_part):
+        # Leftovers of the right part are already in place
+        while i < left_len:
             arr[k] = left_part[i]
             i += 1
             k += 1
+    @staticmethod
+    def _merge_descending(arr: List[int], left: int, mid: int, right: int) -> None:
+        """
+        Merge two subarrays sorted in descending order
+        
+        Args:
+            arr: List containing subarrays
+            left: Starting index of left subarray
+            mid: Ending index of left subarray
+            right: Ending index of right subarray
+        """
+        left_part = copy_range(arr, left, mid + 1)
+        right_part = copy_range(arr, mid + 1, right + 1)
+        left_len = len(left_part)
+        right_len = len(right_part)
+        
+        i = j = 0
+        k = left
+        
+        while i < left_len and j < right_len:
+            if left_part[i] >= right_part[j]:
+                arr[k] = left_part[i]
+                i += 1
+            else:
+                arr[k] = right_part[j]
+                j += 1
+            k += 1
         
-        while j < len(right_part):
-            arr[k] = right_part[j]
-            j += 1
+        # Leftovers of the right part are already in place
+        while i < left_len:
+            arr[k] = left_part[i]
+            i += 1
             k += 1
     def get_name(self) -> str:
         """Return the name of the sorting algorithm"""
@@ -0,0 +1,78 @@
+"""
+src/numpy_backend.py
+NumPy-backed vectorized sorting backend
+"""
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Factory algorithm names that map onto a non-default np.sort kind; all
+# other algorithms use the stable kind (radix sort / timsort for integers)
+NUMPY_SORT_KINDS = {
+    'quick': 'quicksort',
+    'intro': 'quicksort',
+}
+
+
+def _require_numpy() -> None:
+    """Raise ImportError if NumPy is not available"""
+    if np is None:
+        raise ImportError("The 'numpy' backend requires NumPy to be installed")
+
+
+def as_int32_array(values):
+    """
+    View values as a one-dimensional int32 ndarray
+
+    ndarrays, array.array('i') objects and memoryviews with an int32 item
+    format are wrapped without copying. Lists, and buffers of any other
+    integer type, are converted once after a vectorized min/max range check.
+
+    Args:
+        values: List, array.array, memoryview or ndarray of integers
+
+    Returns:
+        One-dimensional numpy.ndarray of dtype int32
+
+    Raises:
+        ImportError: If NumPy is not installed
+        TypeError: If values is not one-dimensional
+        ValueError: If values are not integers or fall outside INT32 range
+    """
+    _require_numpy()
+    arr = np.asarray(values)
+    if arr.ndim != 1:
+        raise TypeError("Input must be a one-dimensional sequence of integers")
+    if arr.size == 0:
+        return arr.astype(np.int32, copy=False)
+    if arr.dtype.kind not in 'biu':
+        raise ValueError("All elements must be integers")
+    if arr.dtype != np.int32:
+        info = np.iinfo(np.int32)
+        low, high = arr.min(), arr.max()
+        if low < info.min:
+            raise ValueError(f"Element {low} outside INT32 range")
+        if high > info.max:
+            raise ValueError(f"Element {high} outside INT32 range")
+        arr = arr.astype(np.int32)
+    return arr
+
+
+def sort_array(values, algorithm_name: str, ascending: bool = True):
+    """
+    Sort values with np.sort
+
+    Args:
+        values: List, array.array, memoryview or ndarray of integers
+        algorithm_name: Factory algorithm name, used to pick the np.sort kind
+        ascending: If True, sort ascending, else descending
+
+    Returns:
+        Sorted int32 ndarray (descending results are a reversed view)
+    """
+    arr = as_int32_array(values)
+    result = np.sort(arr, kind=NUMPY_SORT_KINDS.get(algorithm_name, 'stable'))
+    if not ascending:
+        result = result[::-1]
+    return result
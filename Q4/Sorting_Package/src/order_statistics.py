@@ -0,0 +1,140 @@
+"""
+src/order_statistics.py
+Selection, top-k and partial sort without a full sort
+"""
+import heapq
+from typing import List
+from .intro_sort import INSERTION_CUTOFF, IntroSort
+
+# Supplies the pivot choice, partitioning and small sorts shared with
+# introsort
+_intro = IntroSort()
+
+
+def _median_of_medians(arr: List[int], low: int, high: int) -> int:
+    """
+    Return a pivot guaranteed to lie between the 30th and 70th percentile
+    of arr[low..high]
+
+    Sorts each group of five in place, then selects the median of the
+    group medians recursively.
+
+    Args:
+        arr: List being selected in
+        low: Starting index
+        high: Ending index
+
+    Returns:
+        Pivot value
+    """
+    medians = []
+    for start in range(low, high + 1, 5):
+        end = min(start + 4, high)
+        _intro._insertion_sort(arr, start, end)
+        medians.append(arr[(start + end) // 2])
+    mid = (len(medians) - 1) // 2
+    introselect(medians, mid, 0, len(medians) - 1)
+    return medians[mid]
+
+
+def introselect(arr: List[int], k: int, low: int, high: int) -> None:
+    """
+    Rearrange arr[low..high] in place so that arr[k] holds the value it
+    would have if the range were sorted ascending, with no greater value
+    before it and no smaller one after it
+
+    Quickselect with introsort's median-of-three / ninther pivots and
+    three-way partitioning. After 2*log2(n) partitions that fail to halve
+    the range, pivots come from median of medians instead, bounding the
+    worst case at O(n).
+
+    Args:
+        arr: List to rearrange
+        k: Target index, low <= k <= high
+        low: Starting index
+        high: Ending index
+    """
+    budget = 2 * (high - low + 1).bit_length()
+    while high - low >= INSERTION_CUTOFF:
+        size = high - low + 1
+        if budget > 0:
+            pivot = _intro._choose_pivot(arr, low, high)
+        else:
+            pivot = _median_of_medians(arr, low, high)
+        lt, gt = _intro._partition(arr, low, high, pivot)
+        if k < lt:
+            high = lt - 1
+        elif k > gt:
+            low = gt + 1
+        else:
+            return
+        # Only partitions that leave more than half the range are charged
+        if 2 * (high - low + 1) > size:
+            budget -= 1
+    _intro._insertion_sort(arr, low, high)
+
+
+def select_kth(values: List[int], k: int, ascending: bool = True) -> int:
+    """
+    Return the value at index k of the sorted values in O(n)
+
+    Args:
+        values: List of integers (not modified)
+        k: Index in sorted order, 0 <= k < len(values)
+        ascending: If False, index into descending order (k = 0 is the
+                  maximum)
+
+    Returns:
+        The k-th smallest (or largest) value
+    """
+    arr = list(values)
+    if not ascending:
+        k = len(arr) - 1 - k
+    introselect(arr, k, 0, len(arr) - 1)
+    return arr[k]
+
+
+def top_k(values: List[int], k: int, ascending: bool = True) -> List[int]:
+    """
+    Return the k smallest (or largest) values in order, in O(n log k)
+
+    A heap bounded to k entries is kept while scanning the values once.
+
+    Args:
+        values: List of integers (not modified)
+        k: Number of values, 0 <= k <= len(values)
+        ascending: If True, the k smallest in ascending order, else the
+                  k largest in descending order
+
+    Returns:
+        List of k integers
+    """
+    return heapq.nsmallest(k, values) if ascending else heapq.nlargest(k, values)
+
+
+def partial_sort(values: List[int], k: int, ascending: bool = True) -> List[int]:
+    """
+    Return a copy of values whose first k entries are the k smallest (or
+    largest) in order, in O(n + k log k)
+
+    The remaining entries follow in unspecified order.
+
+    Args:
+        values: List of integers (not modified)
+        k: Number of leading values to sort, 0 <= k <= len(values)
+        ascending: Sort order of the leading values
+
+    Returns:
+        Partially sorted list of integers
+    """
+    arr = list(values)
+    n = len(arr)
+    if k == 0:
+        return arr
+    if ascending:
+        if k < n:
+            introselect(arr, k - 1, 0, n - 1)
+        return _intro.sort(arr[:k], True, inplace=True) + arr[k:]
+    if k < n:
+        introselect(arr, n - k, 0, n - 1)
+    return _intro.sort(arr[n - k:], False, inplace=True) + arr[:n - k]
@@ -0,0 +1,126 @@
+"""
+src/parallel_merge_sort.py
+Parallel multi-process merge sort over shared memory
+"""
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional
+from .kway_merge import merge_sorted
+from .sorting_base import SortingAlgorithm, write_back
+from .validation import is_int32_buffer
+from .tim_sort import TimSort
+
+# Below this many elements process start-up costs more than it saves
+PARALLEL_THRESHOLD = 50000
+
+
+def _sort_chunk(shm_name: str, start: int, stop: int) -> None:
+    """
+    Worker entry point: sort one slice of a shared int32 buffer in place
+
+    Args:
+        shm_name: Name of the shared memory block holding the input
+        start: First index of the chunk
+        stop: End index of the chunk (exclusive)
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    view = shm.buf.cast('i')
+    try:
+        view[start:stop] = array('i', TimSort().sort(view[start:stop].tolist()))
+    finally:
+        view.release()
+        shm.close()
+
+
+class ParallelMergeSort(SortingAlgorithm):
+    """
+    Parallel Merge Sort implementation
+
+    Copies the input once into a multiprocessing.shared_memory int32
+    buffer, sorts one chunk per worker in a ProcessPoolExecutor (workers
+    receive only the block name and their bounds, never the data) and
+    combines the sorted chunks with a heap-based k-way merge. Inputs below
+    the threshold, or machines with a single core, are sorted in-process.
+    """
+    complexity = 'n log n'
+    def __init__(self, workers: Optional[int] = None, threshold: int = PARALLEL_THRESHOLD):
+        """
+        Initialize the algorithm
+
+        Args:
+            workers: Number of worker processes (default: CPU count)
+            threshold: Minimum input size for which workers are used
+        """
+        self.workers = workers
+        self.threshold = threshold
+        self._fallback = TimSort()
+    def sort(self, arr: List[int], ascending: bool = True, inplace: bool = False) -> List[int]:
+        """
+        Sort array using parallel merge sort
+
+        Auxiliary memory: a 4n-byte shared int32 block, the sorted chunks
+        read back from it (O(n)) and the merged output (O(n)), which is
+        written back into arr when inplace is set. Workers each hold one
+        chunk. Below the threshold TimSort's memory use applies.
+
+        Args:
+            arr: List of integers to sort
+            ascending: If True, sort in ascending order, else descending
+            inplace: If True, store the result in arr (a list or writable
+                    buffer) and return it
+
+        Returns:
+            Sorted list of integers
+        """
+        n = len(arr)
+        workers = min(self.workers or os.cpu_count() or 1, n)
+        if n < self.threshold or workers < 2:
+            return self._fallback.sort(arr, ascending, inplace)
+
+        bounds = [(n * i // workers, n * (i + 1) // workers) for i in range(workers)]
+        shm = shared_memory.SharedMemory(create=True, size=n * array('i').itemsize)
+        view = shm.buf.cast('i')
+        try:
+            # array() would read a bytes-like initializer as packed int32
+            # data, so other buffers are copied one value per element
+            values = arr if isinstance(arr, list) or is_int32_buffer(arr) else list(arr)
+            view[:] = array('i', values)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                starts, stops = zip(*bounds)
+                list(pool.map(_sort_chunk, [shm.name] * workers, starts, stops))
+            if isinstance(arr, array):
+                # Compact input stays compact: chunks are copied as int32
+                chunks = []
+                for start, stop in bounds:
+                    chunk = array('i')
+                    chunk.frombytes(view[start:stop].cast('B'))
+                    chunks.append(chunk)
+            else:
+                chunks = [view[start:stop].tolist() for start, stop in bounds]
+        finally:
+            view.release()
+            shm.close()
+            shm.unlink()
+
+        # Chunks of presorted input barely overlap and merge by galloping
+        merged = merge_sorted(*chunks)
+        result = array('i', merged) if isinstance(arr, array) else list(merged)
+        if not ascending:
+            result.reverse()
+        return write_back(arr, result) if inplace else result
+    def _sort_indices(self, keys: List, ascending: bool) -> List[int]:
+        """
+        Sort key permutations in-process: arbitrary keys cannot be placed
+        in the shared int32 buffer
+        """
+        return self._fallback._sort_indices(keys, ascending)
+    def argsort(self, arr: List[int], ascending: bool = True) -> List[int]:
+        """
+        Argsort in-process: packed value/index pairs exceed int32
+        """
+        return self._fallback.argsort(arr, ascending)
+    def get_name(self) -> str:
+        """Return the name of the sorting algorithm"""
+        return "Parallel Merge Sort"
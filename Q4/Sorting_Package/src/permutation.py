@@ -0,0 +1,45 @@
+"""
+src/permutation.py
+Reordering parallel columns by a sorting permutation
+"""
+from array import array
+from operator import itemgetter
+from typing import List, Sequence
+
+
+def apply_permutation(order: Sequence[int], *columns) -> List:
+    """
+    Reorder several columns by the same permutation
+
+    The permutation is compiled once into an itemgetter, which then
+    gathers each column in C; no records are built and no column is
+    sorted again.
+
+    Example:
+        order = factory.argsort('tim', ages)
+        ages, names, ids = apply_permutation(order, ages, names, ids)
+
+    Args:
+        order: Permutation of range(n), e.g. from SortingFactory.argsort
+        *columns: Sequences of length n (lists, tuples or array.array)
+
+    Returns:
+        List with one reordered column per input column: an array of the
+        same typecode for array.array columns, otherwise a list
+
+    Raises:
+        ValueError: If a column's length differs from the permutation's
+    """
+    n = len(order)
+    for column in columns:
+        if len(column) != n:
+            raise ValueError(f"Column length {len(column)} does not match permutation "
+                             f"length {n}")
+    # itemgetter with a single index returns the item, not a tuple
+    gather = itemgetter(*order) if n > 1 else None
+    result = []
+    for column in columns:
+        values = gather(column) if gather is not None else [column[i] for i in order]
+        result.append(array(column.typecode, values) if isinstance(column, array)
+                      else list(values))
+    return result
@@ -2,27 +2,37 @@
 src/quick_sort.py
 Quick Sort implementation
 """
-from typing import List
-from .sorting_base import SortingAlgorithm
+from typing import Callable, List
+from .sorting_base import SortingAlgorithm, working_copy
 
 
 class QuickSort(SortingAlgorithm):
     """Quick Sort implementation"""
-    def sort(self, arr: List[int], ascending: bool = True) -> List[int]:
+    complexity = 'n log n'
+    def sort(self, arr: List[int], ascending: bool = True, inplace: bool = False) -> List[int]:
         """
         Sort array using quick sort algorithm
         
+        Auxiliary memory: O(1) beyond the recursion stack, which is
+        O(log n) on average but O(n) for sorted or duplicate-heavy input.
+        Unless inplace is set, the input is first copied (O(n)).
+        
         Args:
             arr: List of integers to sort
             ascending: If True, sort in ascending order, else descending
+            inplace: If True, sort arr (a list or writable buffer) itself
+                    and return it
             
         Returns:
             Sorted list of integers
         """
-        result = arr.copy()
-        self._quick_sort_helper(result, 0, len(result) - 1, ascending)
+        result = working_copy(arr, inplace)
+        # The direction is resolved once by picking the partition function
+        partition = self._partition_ascending if ascending else self._partition_descending
+        self._quick_sort_helper(result, 0, len(result) - 1, partition)
         return result
-    def _quick_sort_helper(self, arr: List[int], low: int, high: int, ascending: bool) -> None:
+    def _quick_sort_helper(self, arr: List[int], low: int, high: int,
+                           partition: Callable[[List[int], int, int], int]) -> None:
         """
         Helper function for quick sort
         
@@ -30,21 +40,47 @@ class QuickSort(SortingAlgorithm):
             arr: List to sort in-place
             low: Starting index
             high: Ending index
-            ascending: Sort order
+            partition: Partition function for the sort order
         """
         if low < high:
-            pivot_idx = self._partition(arr, low, high, ascending)
-            self._quick_sort_helper(arr, low, pivot_idx - 1, ascending)
-            self._quick_sort_helper(arr, pivot_idx + 1, high, ascending)
-    def _partition(self, arr: List[int], low: int, high: int, ascending: bool) -> int:
+            pivot_idx = partition(arr, low, high)
+            self._quick_sort_helper(arr, low, pivot_idx - 1, partition)
+            self._quick_sort_helper(arr, pivot_idx + 1, high, partition)
+    @staticmethod
+    def _partition_ascending(arr: List[int], low: int, high: int) -> int:
+        """
+        Partition function for ascending quick sort
+        
+        Args:
+            arr: List to partition
+            low: Starting index
+            high: Ending index
+            
+        Returns:
+            Pivot index
+        """
+        pivot = arr[high]
+        i = low - 1
+        
+        for j in range(low, high):
+            value = arr[j]
+            if value <= pivot:
+                i += 1
+                arr[j] = arr[i]
+                arr[i] = value
+        
+        arr[high] = arr[i + 1]
+        arr[i + 1] = pivot
+        return i + 1
+    @staticmethod
+    def _partition_descending(arr: List[int], low: int, high: int) -> int:
         """
-        Partition function for quick sort
+        Partition function for descending quick sort
         
         Args:
             arr: List to partition
             low: Starting index
             high: Ending index
-            ascending: Sort order
             
         Returns:
             Pivot index
@@ -53,16 +89,14 @@ class QuickSort(SortingAlgorithm):
         i = low - 1
         
         for j in range(low, high):
-            if ascending:
-                if arr[j] <= pivot:
-                    i += 1
-                    arr[i], arr[j] = arr[j], arr[i]
-            else:
-                if arr[j] >= pivot:
-                    i += 1
-                    arr[i], arr[j] = arr[j], arr[i]
+            value = arr[j]
+            if value >= pivot:
+                i += 1
+                arr[j] = arr[i]
+                arr[i] = value
         
-        arr[i + 1], arr[high] = arr[high], arr[i + 1]
+        arr[high] = arr[i + 1]
+        arr[i + 1] = pivot
         return i + 1
     def get_name(self) -> str:
         """Return the name of the sorting algorithm"""
@@ -0,0 +1,163 @@
+"""
+src/radix_sort.py
+LSD Radix Sort implementation for INT32 values
+"""
+from array import array
+from functools import partial
+from typing import Any, List, Optional, Tuple
+from .sorting_base import SortingAlgorithm, working_copy, write_back
+from .tim_sort import TimSort
+
+# Bits per digit; 8-bit digits keep bucket setup cheap even for small inputs
+RADIX_BITS = 8
+RADIX = 1 << RADIX_BITS
+# Use counting sort when max - min is below this multiple of the input size
+COUNTING_SPAN_RATIO = 2
+
+
+class RadixSort(SortingAlgorithm):
+    """
+    LSD Radix Sort implementation
+
+    Relies on the factory's INT32 contract: values are distributed into
+    buckets one 8-bit digit at a time, least significant first, so a full
+    sort takes at most four linear passes. Digits above the highest bit in
+    which min and max differ are never visited, and the last pass buckets
+    on the signed remaining high bits so negative values need no biasing.
+    Narrow value ranges are handled by a single counting pass instead.
+    Wider integers (such as the packed keys of sort_by_key) simply take
+    more passes.
+    """
+    complexity = 'n'
+    accepts_bounds = True
+    def __init__(self):
+        """Initialize the algorithm"""
+        # Sorts keys that cannot be radix sorted (cmp_to_key objects,
+        # strings, tuples, ...)
+        self._fallback = TimSort()
+    def sort(self, arr: List[int], ascending: bool = True, inplace: bool = False,
+             bounds: Optional[Tuple[int, int]] = None) -> List[int]:
+        """
+        Sort array using LSD radix sort
+
+        Auxiliary memory: O(n + 2^8) per radix pass for the buckets and
+        the concatenated output, or O(n + max - min) for counting sort.
+        The result is always built in new sequences (int arrays of arr's
+        typecode when arr is an array.array, lists otherwise); with
+        inplace it is then written back into arr.
+
+        Args:
+            arr: List of integers to sort
+            ascending: If True, sort in ascending order, else descending
+            inplace: If True, store the result in arr (a list or writable
+                    buffer) and return it
+            bounds: Optional (min, max) of arr, saving a pass to find them
+
+        Returns:
+            Sorted list of integers
+        """
+        if len(arr) < 2:
+            return working_copy(arr, inplace)
+        low, high = bounds if bounds is not None else (min(arr), max(arr))
+        # Buckets and output match compact input instead of boxing it
+        sequence = partial(array, arr.typecode) if isinstance(arr, array) else list
+        if high - low < COUNTING_SPAN_RATIO * len(arr):
+            result = self._counting_sort(arr, low, high, ascending, sequence)
+        else:
+            result = self._radix_sort(arr, low, high, ascending, sequence)
+        return write_back(arr, result) if inplace else result
+    def _sort_indices(self, keys: List[Any], ascending: bool) -> List[int]:
+        """
+        Return the stable sorting permutation of keys
+
+        Integer keys are packed with their indices (see _argsort_packed)
+        and the packed values radix sorted. Other keys, including those
+        of a cmp comparator, can only be compared, so their (key, index)
+        pairs are sorted by TimSort instead.
+
+        Args:
+            keys: Sort keys, one per item
+            ascending: Sort order
+
+        Returns:
+            Indices of keys in sorted order
+        """
+        if not all(type(k) is int or isinstance(k, int) for k in keys):
+            return self._fallback._sort_indices(keys, ascending)
+        return self._argsort_packed(keys, ascending)
+    @staticmethod
+    def _counting_sort(arr: List[int], low: int, high: int, ascending: bool,
+                       sequence=list) -> List[int]:
+        """
+        Counting sort for inputs whose value range is small
+
+        Args:
+            arr: List of integers to sort
+            low: Minimum value in arr
+            high: Maximum value in arr
+            ascending: Sort order
+            sequence: Constructor of the output (list or an array
+                     typecode partial)
+
+        Returns:
+            Sorted list of integers (sequence instance)
+        """
+        counts = [0] * (high - low + 1)
+        for value in arr:
+            counts[value - low] += 1
+        result = sequence()
+        offsets = range(len(counts)) if ascending else range(len(counts) - 1, -1, -1)
+        for offset in offsets:
+            count = counts[offset]
+            if count:
+                result.extend(sequence([offset + low]) * count)
+        return result
+    @staticmethod
+    def _radix_sort(arr: List[int], low: int, high: int, ascending: bool,
+                    sequence=list) -> List[int]:
+        """
+        Stable LSD radix sort over 8-bit digits
+
+        Every pass concatenates its buckets in the requested direction, so
+        descending output needs no final reversal and stays stable.
+
+        Args:
+            arr: List of integers to sort
+            low: Minimum value in arr
+            high: Maximum value in arr
+            ascending: Sort order
+            sequence: Constructor of the buckets and output (list or an
+                     array typecode partial)
+
+        Returns:
+            Sorted list of integers (sequence instance)
+        """
+        result = arr
+        shift = 0
+        while True:
+            last_pass = (high >> shift) - (low >> shift) < RADIX
+            if last_pass:
+                # The shifted values span fewer than RADIX buckets, so the
+                # shifted value itself (signed) selects the bucket
+                base = low >> shift
+                buckets = [sequence() for _ in range((high >> shift) - base + 1)]
+                appenders = [bucket.append for bucket in buckets]
+                for value in result:
+                    appenders[(value >> shift) - base](value)
+            else:
+                mask = RADIX - 1
+                buckets = [sequence() for _ in range(RADIX)]
+                appenders = [bucket.append for bucket in buckets]
+                for value in result:
+                    appenders[(value >> shift) & mask](value)
+            if not ascending:
+                buckets.reverse()
+            result = sequence()
+            for bucket in buckets:
+                result += bucket
+            if last_pass:
+                return result
+            shift += RADIX_BITS
+    def get_name(self) -> str:
+        """Return the name of the sorting algorithm"""
+        return "Radix Sort"
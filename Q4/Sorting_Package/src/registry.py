@@ -0,0 +1,119 @@
+"""
+src/registry.py
+Lazy registry of sorting algorithms with plugin discovery
+"""
+from collections.abc import Mapping
+from importlib import import_module
+from typing import Dict, List, Tuple
+from .sorting_base import SortingAlgorithm
+
+# Entry point group scanned for third-party algorithms; each entry point
+# names a SortingAlgorithm subclass, e.g. in pyproject.toml:
+# [project.entry-points."sorting_package.algorithms"]
+# gnome = "my_package.gnome:GnomeSort"
+ENTRY_POINT_GROUP = 'sorting_package.algorithms'
+
+# Built-in algorithms as (module, class name), imported on first use
+BUILTIN_ALGORITHMS: Dict[str, Tuple[str, str]] = {
+    'bubble': ('.bubble_sort', 'BubbleSort'),
+    'selection': ('.selection_sort', 'SelectionSort'),
+    'quick': ('.quick_sort', 'QuickSort'),
+    'merge': ('.merge_sort', 'MergeSort'),
+    'bottom_up_merge': ('.bottom_up_merge_sort', 'BottomUpMergeSort'),
+    'block_merge': ('.block_merge_sort', 'BlockMergeSort'),
+    'shell': ('.shell_sort', 'ShellSort'),
+    'intro': ('.intro_sort', 'IntroSort'),
+    'tim': ('.tim_sort', 'TimSort'),
+    'radix': ('.radix_sort', 'RadixSort'),
+    'parallel_merge': ('.parallel_merge_sort', 'ParallelMergeSort'),
+}
+
+# Classes registered with the register_algorithm decorator
+_registered: Dict[str, type] = {}
+
+
+def register_algorithm(name: str):
+    """
+    Class decorator registering a SortingAlgorithm subclass under name
+
+    Every SortingFactory created afterwards accepts the name. Example:
+
+        @register_algorithm('gnome')
+        class GnomeSort(SortingAlgorithm):
+            ...
+
+    Args:
+        name: Algorithm name (case-insensitive)
+
+    Returns:
+        Decorator returning the class unchanged
+
+    Raises:
+        TypeError: If the decorated object is not a SortingAlgorithm
+                  subclass
+        ValueError: If name is already taken by another algorithm
+    """
+    name = name.lower()
+    def decorator(cls):
+        if not (isinstance(cls, type) and issubclass(cls, SortingAlgorithm)):
+            raise TypeError(f"{cls!r} is not a SortingAlgorithm subclass")
+        if name in BUILTIN_ALGORITHMS or _registered.get(name, cls) is not cls:
+            raise ValueError(f"Algorithm name already registered: {name}")
+        _registered[name] = cls
+        return cls
+    return decorator
+
+
+class AlgorithmRegistry(Mapping):
+    """
+    Read-only mapping from algorithm name to a shared instance
+
+    Names resolve to built-in algorithms, then decorator-registered
+    classes, then entry points in ENTRY_POINT_GROUP. A module is imported
+    and its algorithm instantiated only when the name is first looked up,
+    and entry points are scanned only once a name is not found otherwise
+    or the full list of names is needed.
+    """
+    def __init__(self):
+        """Initialize an empty registry; nothing is imported yet"""
+        self._instances: Dict[str, SortingAlgorithm] = {}
+        self._plugins = None
+    def _entry_points(self) -> dict:
+        """Return the installed entry points by name, scanning once"""
+        if self._plugins is None:
+            # importlib.metadata is only loaded when plugins are looked for
+            from importlib.metadata import entry_points
+            self._plugins = {entry_point.name.lower(): entry_point
+                             for entry_point in entry_points(group=ENTRY_POINT_GROUP)}
+        return self._plugins
+    def _load(self, name: str) -> type:
+        """
+        Import the class registered under name
+
+        Raises:
+            KeyError: If no algorithm has that name
+        """
+        if name in BUILTIN_ALGORITHMS:
+            module, class_name = BUILTIN_ALGORITHMS[name]
+            return getattr(import_module(module, __package__), class_name)
+        if name in _registered:
+            return _registered[name]
+        if name in self._entry_points():
+            return self._entry_points()[name].load()
+        raise KeyError(name)
+    def names(self) -> List[str]:
+        """Return every available name: built-ins, registered, then plugins"""
+        names = list(BUILTIN_ALGORITHMS) + list(_registered)
+        return names + [name for name in self._entry_points() if name not in names]
+    def __getitem__(self, name: str) -> SortingAlgorithm:
+        algorithm = self._instances.get(name)
+        if algorithm is None:
+            algorithm = self._instances[name] = self._load(name)()
+        return algorithm
+    def __contains__(self, name) -> bool:
+        return (name in self._instances or name in BUILTIN_ALGORITHMS
+                or name in _registered or name in self._entry_points())
+    def __iter__(self):
+        return iter(self.names())
+    def __len__(self) -> int:
+        return len(self.names())
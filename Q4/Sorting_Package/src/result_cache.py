@@ -0,0 +1,138 @@
+"""
+src/result_cache.py
+Content-addressed LRU cache of sort results
+"""
+import hashlib
+import sys
+from array import array
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+from .validation import MAX_INPUT_SIZE, is_int32_buffer
+
+# Digest length in bytes: 128 bits makes accidental collisions negligible
+DIGEST_SIZE = 16
+
+
+class ResultCache:
+    """
+    Least-recently-used cache of sorted outputs, bounded by memory
+
+    Entries are keyed by a BLAKE2b digest of the input packed as int32
+    together with its length and the sort direction, so equal inputs hit
+    the same entry whatever list object holds them. Results are stored as
+    compact int32 arrays and every hit returns a new list, so callers can
+    never modify a cached result.
+    """
+    def __init__(self, max_bytes: int):
+        """
+        Initialize the cache
+
+        Args:
+            max_bytes: Upper bound on the memory held by cached results
+
+        Raises:
+            ValueError: If max_bytes is not positive
+        """
+        if max_bytes <= 0:
+            raise ValueError("Cache size must be positive")
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+    def key(self, values, ascending: bool) -> Optional[Tuple[bytes, int, bool]]:
+        """
+        Compute the cache key of an input
+
+        Only int32 buffers and lists of plain ints are keyed: other inputs
+        are rejected by the uncached path, and subclasses such as bool
+        would come back from the cache as ints. Packing a list into array('i') runs in C and also proves
+        every element is an INT32 integer, so a hit needs no separate
+        validation pass.
+
+        Args:
+            values: List of integers or int32 buffer
+            ascending: Sort direction
+
+        Returns:
+            Tuple (digest, length, ascending), or None if values is not a
+            list of ints or an int32 buffer, cannot be packed as int32 (invalid
+            input, left to the normal validation to report) or exceeds
+            the input size limit
+        """
+        if isinstance(values, list):
+            if not set(map(type, values)) <= {int}:
+                return None
+        elif not is_int32_buffer(values):
+            return None
+        if len(values) > MAX_INPUT_SIZE:
+            return None
+        packed = values
+        if not isinstance(values, array):
+            try:
+                packed = array('i', values)
+            except (TypeError, OverflowError):
+                return None
+        # One element per value, never bytes reinterpreted as int32
+        if len(packed) != len(values):
+            return None
+        digest = hashlib.blake2b(packed, digest_size=DIGEST_SIZE).digest()
+        return digest, len(packed), ascending
+    def get(self, key: Tuple[bytes, int, bool]) -> Optional[List[int]]:
+        """
+        Look up a result and mark it most recently used
+
+        Args:
+            key: Key from key()
+
+        Returns:
+            A new list holding the cached result, or None on a miss
+        """
+        packed = self._entries.get(key)
+        if packed is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return packed.tolist()
+    def put(self, key: Tuple[bytes, int, bool], result: List[int]) -> None:
+        """
+        Store a copy of a result, evicting least recently used entries to
+        stay within max_bytes
+
+        Results larger than the whole cache are not stored.
+
+        Args:
+            key: Key from key()
+            result: Sorted list of integers
+        """
+        packed = array('i', result)
+        size = sys.getsizeof(packed)
+        if size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.bytes -= sys.getsizeof(previous)
+        while self.bytes + size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= sys.getsizeof(evicted)
+            self.evictions += 1
+        self._entries[key] = packed
+        self.bytes += size
+    def clear(self) -> None:
+        """Drop every entry; the counters are kept"""
+        self._entries.clear()
+        self.bytes = 0
+    def info(self) -> dict:
+        """Return the counters and current size as a dictionary"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self.bytes,
+            'max_bytes': self.max_bytes,
+        }
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -3,34 +3,52 @@ src/selection_sort.py
 Selection Sort implementation
 """
 from typing import List
-from .sorting_base import SortingAlgorithm
+from .sorting_base import SortingAlgorithm, working_copy
 
 
 class SelectionSort(SortingAlgorithm):
     """Selection Sort implementation"""
-    def sort(self, arr: List[int], ascending: bool = True) -> List[int]:
+    complexity = 'n^2'
+    def sort(self, arr: List[int], ascending: bool = True, inplace: bool = False) -> List[int]:
         """
         Sort array using selection sort algorithm
         
+        Auxiliary memory: O(1); swaps happen within the array being
+        sorted. Unless inplace is set, the input is first copied (O(n)).
+        
         Args:
             arr: List of integers to sort
             ascending: If True, sort in ascending order, else descending
+            inplace: If True, sort arr (a list or writable buffer) itself
+                    and return it
             
         Returns:
             Sorted list of integers
         """
-        result = arr.copy()
+        result = working_copy(arr, inplace)
         n = len(result)
-        for i in range(n):
-            extreme_idx = i
-            for j in range(i + 1, n):
-                if ascending:
-                    if result[j] < result[extreme_idx]:
+        # The direction is resolved once; the inner loops also keep the
+        # current extreme in a local instead of re-reading it
+        if ascending:
+            for i in range(n):
+                extreme_idx = i
+                extreme = result[i]
+                for j in range(i + 1, n):
+                    if result[j] < extreme:
                         extreme_idx = j
-                else:
-                    if result[j] > result[extreme_idx]:
+                        extreme = result[j]
+                result[extreme_idx] = result[i]
+                result[i] = extreme
+        else:
+            for i in range(n):
+                extreme_idx = i
+                extreme = result[i]
+                for j in range(i + 1, n):
+                    if result[j] > extreme:
                         extreme_idx = j
-            result[i], result[extreme_idx] = result[extreme_idx], result[i]
+                        extreme = result[j]
+                result[extreme_idx] = result[i]
+                result[i] = extreme
         return result
     def get_name(self) -> str:
         """Return the name of the sorting algorithm"""
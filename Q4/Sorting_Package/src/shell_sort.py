@@ -3,38 +3,57 @@ src/shell_sort.py
 Shell Sort implementation
 """
 from typing import List
-from src.sorting_base import SortingAlgorithm
+from .sorting_base import SortingAlgorithm, working_copy
 
 
 class ShellSort(SortingAlgorithm):
     """Shell Sort implementation"""
-    def sort(self, arr: List[int], ascending: bool = True) -> List[int]:
+    # Shell's halving gaps: about n^1.5 on random input, n^2 at worst
+    complexity = 'n^1.5'
+    def sort(self, arr: List[int], ascending: bool = True, inplace: bool = False) -> List[int]:
         """
         Sort array using shell sort algorithm
         
+        Auxiliary memory: O(1); gapped insertion shifts happen within the
+        array. Unless inplace is set, the input is first copied (O(n)).
+        
         Args:
             arr: List of integers to sort
             ascending: If True, sort in ascending order, else descending
+            inplace: If True, sort arr (a list or writable buffer) itself
+                    and return it
             
         Returns:
             Sorted list of integers
         """
-        result = arr.copy()
+        result = working_copy(arr, inplace)
         n = len(result)
         gap = n // 2
         while gap > 0:
-            for i in range(gap, n):
-                temp = result[i]
-                j = i
-                if ascending:
-                    while j >= gap and result[j - gap] > temp:
-                        result[j] = result[j - gap]
+            # The direction is resolved once per gap, not per comparison, and
+            # each shifted element is read only once
+            if ascending:
+                for i in range(gap, n):
+                    temp = result[i]
+                    j = i
+                    while j >= gap:
+                        prev = result[j - gap]
+                        if prev <= temp:
+                            break
+                        result[j] = prev
                         j -= gap
-                else:
-                    while j >= gap and result[j - gap] < temp:
-                        result[j] = result[j - gap]
+                    result[j] = temp
+            else:
+                for i in range(gap, n):
+                    temp = result[i]
+                    j = i
+                    while j >= gap:
+                        prev = result[j - gap]
+                        if prev >= temp:
+                            break
+                        result[j] = prev
                         j -= gap
-                result[j] = temp
+                    result[j] = temp
             gap //= 2
         return result
     def get_name(self) -> str:
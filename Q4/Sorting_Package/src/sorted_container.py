@@ -0,0 +1,293 @@
+"""
+src/sorted_container.py
+Incrementally maintained sorted container
+"""
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain, islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+from .sorting_factory import SortingFactory
+from .validation import validate_int32_value
+
+# Target chunk length: chunks split above twice this and merge below half
+DEFAULT_LOAD = 1000
+
+
+class SortedContainer:
+    """
+    Sorted collection of INT32 values with logarithmic updates
+
+    Values live in a list of sorted chunks of about DEFAULT_LOAD elements,
+    with the maximum of each chunk kept alongside. An insert or removal
+    bisects the chunk maxima, then the chunk, so it moves at most one
+    chunk's worth of elements instead of re-sorting everything. A Fenwick
+    tree over the chunk lengths turns a position into (chunk, offset) and
+    back in O(log n), which gives indexed access and rank queries.
+    """
+    def __init__(self, values: Optional[Iterable[int]] = None, algorithm_name: str = 'auto',
+                 load: int = DEFAULT_LOAD, factory: Optional[SortingFactory] = None):
+        """
+        Initialize the container
+
+        Args:
+            values: Optional initial values, bulk-loaded with one sort
+            algorithm_name: Registered algorithm used for bulk loads
+            load: Target chunk length
+            factory: SortingFactory used for bulk loads (default: a new one)
+        """
+        self.algorithm_name = algorithm_name
+        self._load = load
+        self._factory = factory or SortingFactory()
+        self._lists = []
+        self._maxes = []
+        self._tree = [0]
+        self._len = 0
+        if values is not None:
+            self.update(values)
+    def _reset(self, ordered: List[int]) -> None:
+        """Replace the contents with an already sorted list"""
+        load = self._load
+        self._lists = [ordered[i:i + load] for i in range(0, len(ordered), load)]
+        self._maxes = [chunk[-1] for chunk in self._lists]
+        self._len = len(ordered)
+        self._build_tree()
+    def _build_tree(self) -> None:
+        """Rebuild the Fenwick tree (1-based) over the chunk lengths in O(m)"""
+        tree = [0] + [len(chunk) for chunk in self._lists]
+        size = len(tree) - 1
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self._tree = tree
+    def _tree_add(self, pos: int, delta: int) -> None:
+        """Add delta to the length of chunk pos"""
+        tree = self._tree
+        i = pos + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+    def _prefix(self, pos: int) -> int:
+        """Return the number of values in chunks before chunk pos"""
+        tree = self._tree
+        total = 0
+        while pos > 0:
+            total += tree[pos]
+            pos -= pos & -pos
+        return total
+    def _locate(self, index: int) -> Tuple[int, int]:
+        """
+        Convert a position into (chunk, offset) by descending the tree
+
+        Args:
+            index: Position, 0 <= index < len(self)
+
+        Returns:
+            Tuple (chunk index, offset within the chunk)
+        """
+        tree = self._tree
+        size = len(tree) - 1
+        pos = 0
+        step = 1 << size.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= size and tree[nxt] <= index:
+                index -= tree[nxt]
+                pos = nxt
+            step >>= 1
+        return pos, index
+    def add(self, value: int) -> None:
+        """
+        Insert a value, keeping the container sorted
+
+        Args:
+            value: INT32 value
+
+        Raises:
+            ValueError: If value is not an INT32 integer
+        """
+        validate_int32_value(value)
+        maxes = self._maxes
+        if not maxes:
+            self._reset([value])
+            return
+        pos = bisect_right(maxes, value)
+        if pos == len(maxes):
+            pos -= 1
+            self._lists[pos].append(value)
+            maxes[pos] = value
+        else:
+            insort(self._lists[pos], value)
+        self._len += 1
+        self._tree_add(pos, 1)
+        chunk = self._lists[pos]
+        if len(chunk) > 2 * self._load:
+            # Split the oversized chunk in two
+            self._lists[pos:pos + 1] = [chunk[:self._load], chunk[self._load:]]
+            maxes[pos:pos + 1] = [chunk[self._load - 1], chunk[-1]]
+            self._build_tree()
+    def update(self, values: Iterable[int]) -> None:
+        """
+        Insert many values at once
+
+        The new values are sorted with the container's algorithm and
+        merged with the current contents in one linear pass.
+
+        Args:
+            values: List of INT32 values (other iterables are copied)
+
+        Raises:
+            ValueError: If a value is not an INT32 integer
+        """
+        values = values if isinstance(values, list) else list(values)
+        if not values:
+            return
+        ordered = self._factory.sort(self.algorithm_name, values)
+        if self._len:
+            ordered = list(heapq.merge(self, ordered))
+        self._reset(ordered)
+    def _delete(self, pos: int, offset: int) -> int:
+        """
+        Remove and return the value at (chunk, offset)
+
+        Chunks shrinking below half the load are merged into a neighbour.
+        """
+        chunk = self._lists[pos]
+        value = chunk.pop(offset)
+        self._len -= 1
+        if not chunk:
+            del self._lists[pos]
+            del self._maxes[pos]
+            self._build_tree()
+            return value
+        self._maxes[pos] = chunk[-1]
+        self._tree_add(pos, -1)
+        if len(chunk) < self._load // 2 and len(self._lists) > 1:
+            left = pos - 1 if pos > 0 else pos
+            merged = self._lists[left] + self._lists[left + 1]
+            if len(merged) > 2 * self._load:
+                half = len(merged) // 2
+                parts = [merged[:half], merged[half:]]
+            else:
+                parts = [merged]
+            self._lists[left:left + 2] = parts
+            self._maxes[left:left + 2] = [part[-1] for part in parts]
+            self._build_tree()
+        return value
+    def remove(self, value: int) -> None:
+        """
+        Remove one occurrence of value
+
+        Raises:
+            ValueError: If value is not in the container
+        """
+        pos = bisect_left(self._maxes, value)
+        if pos < len(self._maxes):
+            offset = bisect_left(self._lists[pos], value)
+            if self._lists[pos][offset] == value:
+                self._delete(pos, offset)
+                return
+        raise ValueError(f"{value} not in container")
+    def discard(self, value: int) -> None:
+        """Remove one occurrence of value if present"""
+        if value in self:
+            self.remove(value)
+    def pop(self, index: int = -1) -> int:
+        """
+        Remove and return the value at a position (default: the largest)
+
+        Raises:
+            IndexError: If the container is empty or index is out of range
+        """
+        return self._delete(*self._locate(self._normalize(index)))
+    def _normalize(self, index: int) -> int:
+        """Resolve a negative position and check its range"""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedContainer index out of range")
+        return index
+    def __getitem__(self, index):
+        """
+        Return the value at a position in O(log n), or a list for a slice
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return list(self._iter_range(start, stop))
+        pos, offset = self._locate(self._normalize(index))
+        return self._lists[pos][offset]
+    def bisect_left(self, value: int) -> int:
+        """Return the position of the first value >= value"""
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._prefix(pos) + bisect_left(self._lists[pos], value)
+    def bisect_right(self, value: int) -> int:
+        """Return the position after the last value <= value"""
+        pos = bisect_right(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._prefix(pos) + bisect_right(self._lists[pos], value)
+    def count(self, value: int) -> int:
+        """Return the number of occurrences of value"""
+        return self.bisect_right(value) - self.bisect_left(value)
+    def index(self, value: int) -> int:
+        """
+        Return the position of the first occurrence of value
+
+        Raises:
+            ValueError: If value is not in the container
+        """
+        position = self.bisect_left(value)
+        if position == self._len or self[position] != value:
+            raise ValueError(f"{value} not in container")
+        return position
+    def irange(self, minimum: Optional[int] = None, maximum: Optional[int] = None,
+               inclusive: Tuple[bool, bool] = (True, True)) -> Iterator[int]:
+        """
+        Iterate over the values between minimum and maximum in order
+
+        Args:
+            minimum: Lower bound (None: unbounded)
+            maximum: Upper bound (None: unbounded)
+            inclusive: Whether each bound itself is included
+
+        Yields:
+            Values in ascending order
+        """
+        if minimum is None:
+            start = 0
+        else:
+            start = self.bisect_left(minimum) if inclusive[0] else self.bisect_right(minimum)
+        if maximum is None:
+            stop = self._len
+        else:
+            stop = self.bisect_right(maximum) if inclusive[1] else self.bisect_left(maximum)
+        return self._iter_range(start, stop)
+    def count_range(self, minimum: int, maximum: int) -> int:
+        """Return the number of values v with minimum <= v <= maximum"""
+        return max(0, self.bisect_right(maximum) - self.bisect_left(minimum))
+    def _iter_range(self, start: int, stop: int) -> Iterator[int]:
+        """Iterate over positions [start, stop) chunk by chunk"""
+        if start >= stop:
+            return iter(())
+        pos, offset = self._locate(start)
+        values = chain(islice(self._lists[pos], offset, None),
+                       chain.from_iterable(self._lists[pos + 1:]))
+        return islice(values, stop - start)
+    def __len__(self) -> int:
+        return self._len
+    def __contains__(self, value) -> bool:
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        chunk = self._lists[pos]
+        return chunk[bisect_left(chunk, value)] == value
+    def __iter__(self) -> Iterator[int]:
+        return chain.from_iterable(self._lists)
+    def __reversed__(self) -> Iterator[int]:
+        return chain.from_iterable(map(reversed, reversed(self._lists)))
+    def __repr__(self) -> str:
+        return f"SortedContainer({list(self)})"
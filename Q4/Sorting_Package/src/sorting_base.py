@@ -3,22 +3,245 @@ src/sorting_base.py
 Abstract base class for sorting algorithms
 """
 from abc import ABC, abstractmethod
-from typing import List
+from array import array
+from functools import cmp_to_key
+from typing import Any, Callable, List, Optional, Tuple
+from .instrumentation import SortStats, instrumented_sort
+
+
+def working_copy(arr, inplace: bool):
+    """
+    Return the sequence an algorithm should sort
+
+    Args:
+        arr: List or writable integer buffer (array.array, bytearray,
+             memoryview)
+        inplace: If True, sort arr itself
+
+    Returns:
+        arr when sorting in place, otherwise a new list of its values
+    """
+    if inplace:
+        return arr
+    if isinstance(arr, list):
+        return arr.copy()
+    return arr.tolist() if hasattr(arr, 'tolist') else list(arr)
+
+
+def copy_range(arr, start: int, stop: int, same_type: bool = False):
+    """
+    Return a copy of arr[start:stop] that later writes to arr cannot change
+
+    Args:
+        arr: List or writable integer buffer
+        start: First index
+        stop: End index (exclusive)
+        same_type: If True, copy memoryview slices into an array of the
+                  view's format, which can be assigned back into a slice
+                  of arr (a list cannot)
+
+    Returns:
+        Slice of arr, or for memoryviews (whose slices are views) a list,
+        or an array when same_type is set
+    """
+    part = arr[start:stop]
+    if isinstance(part, memoryview):
+        return array(part.format, part.tobytes()) if same_type else part.tolist()
+    return part
+
+
+def write_back(arr, values):
+    """
+    Store values into arr, which must have the same length
+
+    Args:
+        arr: List or writable integer buffer
+        values: Sorted values, as a list (or an array of arr's typecode)
+
+    Returns:
+        arr
+    """
+    if isinstance(arr, (list, bytearray)):
+        arr[:] = values
+    elif isinstance(arr, array):
+        if not (isinstance(values, array) and values.typecode == arr.typecode):
+            values = array(arr.typecode, values)
+        arr[:] = values
+    else:
+        for i, value in enumerate(values):
+            arr[i] = value
+    return arr
+
+
+def reverse_in_place(arr) -> None:
+    """
+    Reverse a list or writable buffer in place
+
+    Args:
+        arr: List or writable integer buffer
+    """
+    if hasattr(arr, 'reverse'):
+        arr.reverse()
+    else:
+        # memoryview: the reversed view is copied before being written
+        arr[:] = arr[::-1]
+
+
+def new_buffer_like(arr, size: int):
+    """
+    Allocate a zeroed buffer whose slices can be assigned to and from arr
+
+    Args:
+        arr: List or writable integer buffer
+        size: Number of elements
+
+    Returns:
+        List, array.array, bytearray or memoryview of the same element type
+    """
+    if isinstance(arr, array):
+        return array(arr.typecode, bytes(size * arr.itemsize))
+    if isinstance(arr, bytearray):
+        return bytearray(size)
+    if isinstance(arr, memoryview):
+        return memoryview(bytearray(size * arr.itemsize)).cast(arr.format)
+    return [0] * size
+
 
 class SortingAlgorithm(ABC):
     """Abstract base class for sorting algorithms"""
+    # Set by algorithms whose sort() accepts bounds=(min, max), letting the
+    # factory pass along the bounds found during validation
+    accepts_bounds = False
+    # Advertised growth of the running time on typical input, a key of
+    # src.complexity.COMPLEXITY_CLASSES (None when not stated); the
+    # complexity profiler flags algorithms observed to grow faster
+    complexity: Optional[str] = None
     @abstractmethod
-    def sort(self, arr: List[int], ascending: bool = True) -> List[int]:
+    def sort(self, arr: List[int], ascending: bool = True, inplace: bool = False) -> List[int]:
         """
         Sort the given array
         
         Args:
             arr: List of integers to sort
             ascending: If True, sort in ascending order, else descending
+            inplace: If True, sort arr itself (a list or writable buffer
+                    such as bytearray, array.array or memoryview) and return
+                    it instead of a sorted copy
             
         Returns:
-            Sorted list of integers
+            Sorted list of integers (arr itself when inplace is set)
         """
     @abstractmethod
     def get_name(self) -> str:
         """Return the name of the sorting algorithm"""
+    def sort_by_key(self, arr: List[Any], key: Optional[Callable[[Any], Any]] = None,
+                    ascending: bool = True, inplace: bool = False,
+                    cmp: Optional[Callable[[Any, Any], int]] = None) -> List[Any]:
+        """
+        Sort arbitrary items by a derived key or a comparator
+
+        Keys are computed exactly once per element (decorate-sort-
+        undecorate); the algorithm then sorts (key, index) pairs and never
+        calls key itself. The index breaks ties in favour of the original
+        order, so the result is stable for every algorithm.
+
+        Args:
+            arr: List of items to sort
+            key: Function mapping an item to its sort key
+            ascending: If True, sort in ascending order, else descending
+            inplace: If True, reorder arr itself and return it
+            cmp: Comparator returning a negative, zero or positive number,
+                as for functools.cmp_to_key (instead of key)
+
+        Returns:
+            Sorted list of items (arr itself when inplace is set)
+
+        Raises:
+            ValueError: If both or neither of key and cmp are given
+        """
+        if (key is None) == (cmp is None):
+            raise ValueError("Pass exactly one of key or cmp")
+        if cmp is not None:
+            key = cmp_to_key(cmp)
+        keys = [key(item) for item in arr]
+        order = self._sort_indices(keys, ascending)
+        result = [arr[i] for i in order]
+        return write_back(arr, result) if inplace else result
+    def _sort_indices(self, keys: List[Any], ascending: bool) -> List[int]:
+        """
+        Return the stable sorting permutation of keys
+
+        Descending order decorates with negated indices, so that equal
+        keys still come out in their original order.
+
+        Args:
+            keys: Sort keys, one per item
+            ascending: Sort order
+
+        Returns:
+            Indices of keys in sorted order
+        """
+        if ascending:
+            decorated = [(k, i) for i, k in enumerate(keys)]
+            return [i for _, i in self.sort(decorated, True, inplace=True)]
+        decorated = [(k, -i) for i, k in enumerate(keys)]
+        return [-i for _, i in self.sort(decorated, False, inplace=True)]
+    def argsort(self, arr: List[int], ascending: bool = True) -> List[int]:
+        """
+        Return the permutation that sorts integer values
+
+        Equal values keep their original relative order whatever the
+        algorithm, since each value is sorted together with its index.
+
+        Args:
+            arr: List of integers (or integer buffer)
+            ascending: Sort order
+
+        Returns:
+            Indices of arr in sorted order
+        """
+        return self._argsort_packed(arr, ascending)
+    def _argsort_packed(self, keys: List[int], ascending: bool) -> List[int]:
+        """
+        Stable sorting permutation of integer keys via packed integers
+
+        Each key is packed with its index into one integer, (key - min)
+        shifted above the index bits, so the algorithm sorts plain ints
+        instead of tuples. Descending order packs reversed indices so
+        that equal keys keep their original order.
+
+        Args:
+            keys: Integer sort keys, one per item
+            ascending: Sort order
+
+        Returns:
+            Indices of keys in sorted order
+        """
+        n = len(keys)
+        if n < 2:
+            return list(range(n))
+        low = min(keys)
+        bits = (n - 1).bit_length()
+        mask = (1 << bits) - 1
+        if ascending:
+            packed = [(k - low) << bits | i for i, k in enumerate(keys)]
+            return [p & mask for p in self.sort(packed, True, inplace=True)]
+        last = n - 1
+        packed = [(k - low) << bits | (last - i) for i, k in enumerate(keys)]
+        return [last - (p & mask) for p in self.sort(packed, False, inplace=True)]
+    def sort_instrumented(self, arr: List[int], ascending: bool = True) -> Tuple[List[int], SortStats]:
+        """
+        Sort the given array while counting comparisons, moves,
+        allocations, recursion depth and peak memory
+
+        The counters come from instrumented element and list types, so
+        sort() itself carries no instrumentation overhead.
+
+        Args:
+            arr: List of integers to sort
+            ascending: If True, sort in ascending order, else descending
+
+        Returns:
+            Tuple (sorted list of integers, SortStats)
+        """
+        return instrumented_sort(self, arr, ascending)
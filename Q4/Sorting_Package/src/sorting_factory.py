@@ -2,64 +2,462 @@
 src/sorting_factory.py
 Factory class to invoke different sorting algorithms
 """
-from typing import List
-from .bubble_sort import BubbleSort
-from .selection_sort import SelectionSort
-from .quick_sort import QuickSort
-from .merge_sort import MergeSort
-from .shell_sort import ShellSort
+import os
+import time
+from array import array
+from collections import deque
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+from .instrumentation import SortStats
+from .registry import AlgorithmRegistry
+from .sorting_base import SortingAlgorithm
+from .validation import MAX_INPUT_SIZE, is_int32_buffer, validate_int32, validate_records
+
+# Sorting backends accepted by SortingFactory.sort
+BACKENDS = ['python', 'array', 'numpy']
+# Algorithm name that profiles the input and picks a registered algorithm
+AUTO = 'auto'
+# Jobs sort_many keeps queued per worker ahead of the result it waits for
+PENDING_JOBS_PER_WORKER = 4
+
+# Factory of the current sort_many worker process, created on first use
+_worker_factory = None
+
+
+def _sort_job(job: dict) -> dict:
+    """
+    Worker entry point: run one sort_many job in this process's factory
+
+    Args:
+        job: Job dictionary (see SortingFactory.sort_many)
+
+    Returns:
+        Result dictionary (see SortingFactory.sort_many)
+    """
+    global _worker_factory
+    if _worker_factory is None:
+        _worker_factory = SortingFactory()
+    return _worker_factory._run_job(job)
 
 
 class SortingFactory:
     """Factory class to create and use sorting algorithms"""
-    def __init__(self):
-        """Initialize the factory with available algorithms"""
-        self.algorithms = {
-            'bubble': BubbleSort(),
-            'selection': SelectionSort(),
-            'quick': QuickSort(),
-            'merge': MergeSort(),
-            'shell': ShellSort()
-        }
-    def sort(self, algorithm_name: str, input_list: List[int], ascending: bool = True) -> List[int]:
+    def __init__(self, cache_bytes: int = 0):
+        """
+        Initialize the factory with available algorithms
+
+        Args:
+            cache_bytes: If positive, keep sort results in an LRU cache
+                        holding at most this many bytes (see ResultCache);
+                        repeated inputs are then answered without sorting
+        """
+        self.cache = None
+        if cache_bytes > 0:
+            from .result_cache import ResultCache
+            self.cache = ResultCache(cache_bytes)
+        # Algorithms are imported and instantiated on first use; see
+        # src.registry for registering more
+        self.algorithms = AlgorithmRegistry()
+    def sort(self, algorithm_name: str, input_list: List[int], ascending: bool = True,
+             backend: str = 'python', as_list: bool = False, trusted: bool = False,
+             inplace: bool = False, key: Optional[Callable[[Any], Any]] = None,
+             cmp: Optional[Callable[[Any, Any], int]] = None):
         """
         Sort using the specified algorithm
         
+        With a result cache, copies sorted by the 'python' backend are
+        looked up by content and direction first; the algorithm only runs
+        on a miss, and every call returns a list of its own.
+        
         Args:
-            algorithm_name: Name of algorithm ('bubble', 'selection', 
-                          'quick', 'merge')
-            input_list: List of integers to sort
+            algorithm_name: Name of algorithm ('bubble', 'selection',
+                          'quick', 'merge', 'bottom_up_merge', 'block_merge',
+                          'shell', 'intro', 'tim', 'radix', 'parallel_merge'),
+                          or 'auto' to pick one from a sample of the
+                          input (the choice is logged by src.auto_select)
+            input_list: List of integers to sort. int32 array.array and
+                       memoryview input is accepted without element checks,
+                       and the 'numpy' backend also accepts ndarrays
             ascending: If True, sort ascending, else descending
+            backend: 'python' to run the named algorithm, 'array' to run
+                    it over a compact array.array('i') copy (4 bytes per
+                    element instead of a list slot plus an int object),
+                    or 'numpy' to sort with np.sort using the matching
+                    sort kind
+            as_list: With the 'array' or 'numpy' backend, convert the
+                    result to a list instead of returning an int32
+                    array.array / ndarray
+            trusted: If True, skip validation of input the caller has
+                    already validated
+            inplace: If True, sort input_list itself and return it. Lists
+                    and writable integer buffers (bytearray, array.array,
+                    memoryview) are accepted; see each algorithm for the
+                    auxiliary memory it still needs
+            key: Sort a list of arbitrary items by key(item) instead of
+                by value; each key is computed once and the sort is stable
+            cmp: Comparator (as for functools.cmp_to_key) used instead of
+                key
             
         Returns:
-            Sorted list of integers
+            Sorted list of integers (array.array('i') or int32 ndarray for
+            the 'array' and 'numpy' backends unless as_list is set,
+            input_list itself if inplace is set)
             
         Raises:
-            ValueError: If algorithm name is invalid or list contains 
-                       non-integers
-            TypeError: If input is not a list
+            ValueError: If algorithm name or backend is invalid, list
+                       contains non-integers (without key or cmp) or both
+                       key and cmp are given
+            TypeError: If input is not a list or int32 buffer, or is a
+                      read-only buffer when inplace is set
+            ImportError: If the 'numpy' backend is used without NumPy
         """
-        # Validate input type
-        if not isinstance(input_list, list):
+        if backend in ('array', 'numpy') and (inplace or key is not None or cmp is not None):
+            raise ValueError(f"inplace, key and cmp are not supported by the '{backend}' backend")
+        if backend == 'numpy':
+            return self._sort_numpy(algorithm_name, input_list, ascending, as_list)
+        if backend == 'array':
+            return self._sort_array(algorithm_name, input_list, ascending, as_list, trusted)
+        if backend != 'python':
+            raise ValueError(f"Unknown backend: {backend}. Available: {BACKENDS}")
+        if key is not None or cmp is not None:
+            validate_records(input_list, trusted)
+            algorithm = self._get_algorithm(self._resolve_auto(algorithm_name))
+            return algorithm.sort_by_key(input_list, key, ascending, inplace, cmp)
+        cache_key = None
+        if self.cache is not None and not inplace:
+            cache_key = self.cache.key(input_list, ascending)
+            if cache_key is not None:
+                # Unknown names must fail on a hit just as on a miss
+                if algorithm_name.lower() != AUTO:
+                    self._get_algorithm(algorithm_name)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return cached
+        bounds = validate_int32(input_list, trusted, writable=inplace)
+        algorithm = self._get_algorithm(self._resolve_auto(algorithm_name, input_list, bounds))
+        # Copies are sorted as lists; typed buffers were validated by type
+        if not inplace and is_int32_buffer(input_list):
+            input_list = input_list.tolist()
+        result = self._run(algorithm, input_list, ascending, inplace, bounds)
+        if cache_key is not None:
+            self.cache.put(cache_key, result)
+        return result
+    @staticmethod
+    def _run(algorithm: SortingAlgorithm, values, ascending: bool, inplace: bool,
+             bounds: Optional[Tuple[int, int]]):
+        """Call algorithm.sort, passing bounds to algorithms that accept them"""
+        if algorithm.accepts_bounds:
+            return algorithm.sort(values, ascending, inplace, bounds=bounds)
+        return algorithm.sort(values, ascending, inplace)
+    def _sort_array(self, algorithm_name: str, values, ascending: bool, as_list: bool,
+                    trusted: bool):
+        """
+        Sort with the 'array' backend
+
+        The input is packed once into an array.array('i'), which the
+        algorithm sorts in place; packing runs in C and rejects
+        non-integers and values outside INT32 range, and min/max are
+        then found on the packed copy. Algorithms that need scratch space
+        allocate it as int32 arrays too (see new_buffer_like), so no
+        list exists unless as_list is set.
+
+        Args:
+            algorithm_name: Name of algorithm, or 'auto'
+            values: List of integers or int32 buffer
+            ascending: If True, sort ascending, else descending
+            as_list: If True, return a list instead of an array
+            trusted: If True, skip the checks on the packed copy
+
+        Returns:
+            Sorted array.array('i'), or list if as_list is set
+        """
+        if not (isinstance(values, list) or is_int32_buffer(values)):
             raise TypeError("Input must be a list")
-        # Validate all elements are integers
-        if not all(isinstance(x, int) for x in input_list):
-            raise ValueError("All elements must be integers")
-        # Validate list size
-        if len(input_list) > 2e5:
+        if len(values) > MAX_INPUT_SIZE:
+            raise ValueError("List size exceeds maximum of 2x10^5 elements")
+        try:
+            packed = array('i', values)
+        except (TypeError, OverflowError):
+            # Let the element-wise validation report the offending value
+            validate_int32(values)
+            raise
+        bounds = validate_int32(packed, trusted, writable=True)
+        algorithm = self._get_algorithm(self._resolve_auto(algorithm_name, packed, bounds))
+        self._run(algorithm, packed, ascending, True, bounds)
+        return packed.tolist() if as_list else packed
+    def cache_info(self) -> Optional[dict]:
+        """
+        Return the result cache counters
+
+        Returns:
+            Dictionary with 'hits', 'misses', 'evictions', 'entries',
+            'bytes' and 'max_bytes', or None if caching is disabled
+        """
+        return self.cache.info() if self.cache is not None else None
+    def argsort(self, algorithm_name: str, input_list: List[int], ascending: bool = True,
+                trusted: bool = False) -> List[int]:
+        """
+        Return the permutation that sorts input_list with the named
+        algorithm
+
+        Equal values keep their original order, so the permutation is
+        stable for every algorithm. Pass it to apply_permutation (see
+        src.permutation) to reorder companion columns the same way.
+
+        Args:
+            algorithm_name: Name of algorithm, or 'auto'
+            input_list: List of integers (or int32 buffer)
+            ascending: If True, sort ascending, else descending
+            trusted: If True, skip validation of input the caller has
+                    already validated
+
+        Returns:
+            List of indices i such that [input_list[i] for i in result]
+            equals sort(algorithm_name, input_list, ascending)
+
+        Raises:
+            ValueError: If algorithm name is invalid or list contains
+                       non-integers
+            TypeError: If input is not a list or int32 buffer
+        """
+        bounds = validate_int32(input_list, trusted)
+        algorithm = self._get_algorithm(self._resolve_auto(algorithm_name, input_list, bounds))
+        return algorithm.argsort(input_list, ascending)
+    def select_kth(self, input_list: List[int], k: int, ascending: bool = True) -> int:
+        """
+        Return the k-th value in sorted order without sorting (introselect)
+
+        Args:
+            input_list: List of integers (or int32 buffer)
+            k: 0-based index in sorted order
+            ascending: If False, k counts from the largest value
+
+        Returns:
+            The value sort() would place at index k
+
+        Raises:
+            ValueError: If k is outside [0, len) or the input is invalid
+            TypeError: If input is not a list or int32 buffer
+        """
+        validate_int32(input_list)
+        self._check_k(k, len(input_list) - 1)
+        from .order_statistics import select_kth
+        return select_kth(input_list, k, ascending)
+    def top_k(self, input_list: List[int], k: int, ascending: bool = True) -> List[int]:
+        """
+        Return the k smallest (or largest) values in order (bounded heap)
+
+        Args:
+            input_list: List of integers (or int32 buffer)
+            k: Number of values
+            ascending: If True, the k smallest ascending, else the k
+                      largest descending
+
+        Returns:
+            The first k values of sort(input_list, ascending)
+
+        Raises:
+            ValueError: If k is outside [0, len] or the input is invalid
+            TypeError: If input is not a list or int32 buffer
+        """
+        validate_int32(input_list)
+        self._check_k(k, len(input_list))
+        from .order_statistics import top_k
+        return top_k(input_list, k, ascending)
+    def partial_sort(self, input_list: List[int], k: int, ascending: bool = True) -> List[int]:
+        """
+        Sort only the first k positions (introselect, then introsort)
+
+        Args:
+            input_list: List of integers (or int32 buffer)
+            k: Number of leading positions to sort
+            ascending: Sort order
+
+        Returns:
+            List whose first k values match sort(input_list, ascending),
+            followed by the remaining values in unspecified order
+
+        Raises:
+            ValueError: If k is outside [0, len] or the input is invalid
+            TypeError: If input is not a list or int32 buffer
+        """
+        validate_int32(input_list)
+        self._check_k(k, len(input_list))
+        from .order_statistics import partial_sort
+        return partial_sort(input_list, k, ascending)
+    @staticmethod
+    def _check_k(k: int, limit: int) -> None:
+        """
+        Check that k is an integer in [0, limit]
+
+        Raises:
+            ValueError: If it is not
+        """
+        if not isinstance(k, int) or not 0 <= k <= limit:
+            raise ValueError(f"k must be an integer between 0 and {limit}, got {k}")
+    def sort_many(self, jobs: Iterable[dict], workers: Optional[int] = None) -> List[dict]:
+        """
+        Sort independent inputs, spread over a pool of worker processes
+
+        Args:
+            jobs: Dictionaries with 'algorithm', 'input_list' and optionally
+                 'ascending' (default True) and 'stats' (default False,
+                 True to collect operation counts)
+            workers: Number of worker processes (default: CPU count); with
+                    1 the jobs run in this process
+
+        Returns:
+            One dictionary per job, in job order, with 'job' (the job
+            itself), 'result' (sorted list or None), 'error' (message or
+            None), 'seconds' (sort time measured in the worker) and
+            'stats' (dict or None)
+        """
+        return list(self.iter_sort_many(jobs, workers))
+    def iter_sort_many(self, jobs: Iterable[dict], workers: Optional[int] = None) -> Iterator[dict]:
+        """
+        Streaming form of sort_many: yields each result, in job order, as
+        soon as it and every earlier one are done
+
+        jobs is consumed lazily; at most PENDING_JOBS_PER_WORKER jobs per
+        worker are in flight, so memory stays bounded for long batches.
+
+        Args:
+            jobs: Job dictionaries (see sort_many)
+            workers: Number of worker processes (default: CPU count)
+
+        Yields:
+            Result dictionaries (see sort_many)
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            for job in jobs:
+                yield dict(self._run_job(job), job=job)
+            return
+        # Loading multiprocessing is only worth it when a pool is used
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            for job in jobs:
+                pending.append((job, pool.submit(_sort_job, job)))
+                if len(pending) >= workers * PENDING_JOBS_PER_WORKER:
+                    job, future = pending.popleft()
+                    yield dict(future.result(), job=job)
+            while pending:
+                job, future = pending.popleft()
+                yield dict(future.result(), job=job)
+    def _run_job(self, job: dict) -> dict:
+        """
+        Run one sort_many job, capturing errors and timing
+
+        Args:
+            job: Job dictionary (see sort_many)
+
+        Returns:
+            Result dictionary (see sort_many), without 'job'
+        """
+        result = stats = error = None
+        start = time.perf_counter()
+        try:
+            if job.get('stats'):
+                result, sort_stats = self.sort_instrumented(
+                    job['algorithm'], job['input_list'], job.get('ascending', True))
+                stats = sort_stats.as_dict()
+            else:
+                result = self.sort(job['algorithm'], job['input_list'], job.get('ascending', True))
+        except Exception as e:
+            # One failing case (bad input, RecursionError...) must not end
+            # the batch
+            error = str(e) or type(e).__name__
+        return {'result': result, 'error': error,
+                'seconds': time.perf_counter() - start, 'stats': stats}
+    def sort_instrumented(self, algorithm_name: str, input_list: List[int],
+                          ascending: bool = True) -> Tuple[List[int], SortStats]:
+        """
+        Sort using the specified algorithm and collect operation counts
+
+        Args:
+            algorithm_name: Name of algorithm
+            input_list: List of integers (or int32 buffer) to sort
+            ascending: If True, sort ascending, else descending
+
+        Returns:
+            Tuple (sorted list of integers, SortStats)
+
+        Raises:
+            ValueError: If algorithm name is invalid or list contains
+                       non-integers
+            TypeError: If input is not a list or int32 buffer
+        """
+        bounds = validate_int32(input_list)
+        algorithm = self._get_algorithm(self._resolve_auto(algorithm_name, input_list, bounds))
+        if is_int32_buffer(input_list):
+            input_list = input_list.tolist()
+        return algorithm.sort_instrumented(input_list, ascending)
+    def _sort_numpy(self, algorithm_name: str, values, ascending: bool, as_list: bool):
+        """
+        Sort with the NumPy backend
+
+        Input buffers are wrapped without copying and validated with
+        vectorized min/max checks instead of per-element Python loops.
+
+        Args:
+            algorithm_name: Name of algorithm, mapped onto an np.sort kind
+            values: List, array.array, memoryview or ndarray of integers
+            ascending: If True, sort ascending, else descending
+            as_list: If True, return a list instead of an ndarray
+
+        Returns:
+            Sorted int32 ndarray, or list if as_list is set
+        """
+        # Imported here so NumPy is only loaded when the backend is used
+        from .numpy_backend import sort_array
+        # Validates the name even though the algorithm itself is not run;
+        # 'auto' leaves the choice to np.sort's default kind
+        if algorithm_name.lower() != AUTO:
+            self._get_algorithm(algorithm_name)
+        if len(values) > MAX_INPUT_SIZE:
             raise ValueError("List size exceeds maximum of 2x10^5 elements")
-        # Validate element range (INT32)
-        for elem in input_list:
-            if elem < -2147483648 or elem > 2147483647:
-                raise ValueError(f"Element {elem} outside INT32 range")
-        # Get algorithm
+        result = sort_array(values, algorithm_name.lower(), ascending)
+        return result.tolist() if as_list else result
+    def _resolve_auto(self, algorithm_name: str, values=None,
+                      bounds: Optional[Tuple[int, int]] = None) -> str:
+        """
+        Replace 'auto' with the algorithm chosen for values
+
+        Args:
+            algorithm_name: Requested algorithm name
+            values: Validated input, or None for key sorts, whose keys are
+                   not known yet
+            bounds: Optional (min, max) found during validation
+
+        Returns:
+            algorithm_name, or the chosen name if it was 'auto'
+        """
+        if algorithm_name.lower() != AUTO:
+            return algorithm_name
+        from .auto_select import logger as auto_logger, select_algorithm
+        if values is None:
+            auto_logger.info("auto: chose tim (stable comparison sort for key sorts)")
+            return 'tim'
+        return select_algorithm(values, bounds)
+    def _get_algorithm(self, algorithm_name: str) -> SortingAlgorithm:
+        """
+        Look up a registered algorithm by name
+
+        Args:
+            algorithm_name: Name of algorithm (case-insensitive)
+
+        Returns:
+            The algorithm instance
+
+        Raises:
+            ValueError: If algorithm name is invalid
+        """
         algorithm_name = algorithm_name.lower()
         if algorithm_name not in self.algorithms:
             raise ValueError(f"Unknown algorithm: {algorithm_name}. "
-                           f"Available: {list(self.algorithms.keys())}")
-        algorithm = self.algorithms[algorithm_name]
-        return algorithm.sort(input_list, ascending)
+                           f"Available: {self.get_available_algorithms()}")
+        return self.algorithms[algorithm_name]
     def get_available_algorithms(self) -> List[str]:
-        """Return list of available algorithm names"""
-        return list(self.algorithms.keys())
+        """Return list of available algorithm names, including 'auto'"""
+        return self.algorithms.names() + [AUTO]
     
\ No newline at end of file
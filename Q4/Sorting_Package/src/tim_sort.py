@@ -0,0 +1,468 @@
+"""
+src/tim_sort.py
+Adaptive natural-run merge sort (Timsort) implementation
+"""
+from bisect import bisect_left, bisect_right
+from typing import List
+from .sorting_base import SortingAlgorithm, new_buffer_like, reverse_in_place, working_copy
+
+# Number of consecutive wins from one run before switching to galloping
+MIN_GALLOP = 7
+
+
+def compute_min_run(n: int) -> int:
+    """
+    Compute the minimum run length for an array of size n
+
+    Args:
+        n: Array size
+
+    Returns:
+        A value in [32, 64] (or n itself when n < 64) such that n / min_run
+        is close to, but no more than, a power of two
+    """
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def gallop_left(key: int, arr: List[int], base: int, length: int, hint: int) -> int:
+    """
+    Locate the leftmost position at which key belongs in arr[base:base+length]
+
+    Searches exponentially outward from base+hint, then bisects the final
+    bracket, so a key close to the hint is found in O(log distance).
+
+    Args:
+        key: Value to locate
+        arr: Sorted list containing the run
+        base: Start index of the run
+        length: Length of the run
+        hint: Offset within the run to start galloping from
+
+    Returns:
+        k in [0, length] such that arr[base+k-1] < key <= arr[base+k]
+    """
+    last_ofs = 0
+    ofs = 1
+    if arr[base + hint] < key:
+        max_ofs = length - hint
+        while ofs < max_ofs and arr[base + hint + ofs] < key:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last_ofs += hint
+        ofs += hint
+    else:
+        max_ofs = hint + 1
+        while ofs < max_ofs and not arr[base + hint - ofs] < key:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last_ofs, ofs = hint - ofs, hint - last_ofs
+    return bisect_left(arr, key, base + last_ofs + 1, base + ofs) - base
+
+
+def gallop_right(key: int, arr: List[int], base: int, length: int, hint: int) -> int:
+    """
+    Locate the rightmost position at which key belongs in arr[base:base+length]
+
+    Args:
+        key: Value to locate
+        arr: Sorted list containing the run
+        base: Start index of the run
+        length: Length of the run
+        hint: Offset within the run to start galloping from
+
+    Returns:
+        k in [0, length] such that arr[base+k-1] <= key < arr[base+k]
+    """
+    last_ofs = 0
+    ofs = 1
+    if key < arr[base + hint]:
+        max_ofs = hint + 1
+        while ofs < max_ofs and key < arr[base + hint - ofs]:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last_ofs, ofs = hint - ofs, hint - last_ofs
+    else:
+        max_ofs = length - hint
+        while ofs < max_ofs and not key < arr[base + hint + ofs]:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last_ofs += hint
+        ofs += hint
+    return bisect_right(arr, key, base + last_ofs + 1, base + ofs) - base
+
+
+class _MergeState:
+    """
+    Per-call Timsort state: the pending run stack, the adaptive galloping
+    threshold and the single auxiliary buffer reused by every merge
+    """
+    def __init__(self, arr: List[int]):
+        self.arr = arr
+        self.runs = []
+        self.min_gallop = MIN_GALLOP
+        self.buffer = None
+    def _buffer_for(self, size: int) -> List[int]:
+        """
+        Return the auxiliary buffer, replacing it with one at least twice
+        as large if it cannot hold size items
+
+        The buffer has the same type as the array so slices can be copied
+        between them, and is never larger than n // 2 elements.
+        """
+        if self.buffer is None or len(self.buffer) < size:
+            capacity = max(size, 2 * len(self.buffer)) if self.buffer is not None else size
+            self.buffer = new_buffer_like(self.arr, min(capacity, len(self.arr) // 2))
+        return self.buffer
+    def push_run(self, base: int, length: int) -> None:
+        """Push a run and merge until the stack invariants hold again"""
+        self.runs.append((base, length))
+        self.merge_collapse()
+    def merge_collapse(self) -> None:
+        """
+        Merge adjacent runs until, for the top runs A, B, C, D:
+        |B| > |C| + |D|, |A| > |B| + |C| and |C| > |D|
+        """
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if ((n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or
+                    (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1])):
+                if runs[n - 1][1] < runs[n + 1][1]:
+                    n -= 1
+            elif runs[n][1] > runs[n + 1][1]:
+                break
+            self.merge_at(n)
+    def merge_force_collapse(self) -> None:
+        """Merge all remaining runs into one"""
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+            self.merge_at(n)
+    def merge_at(self, i: int) -> None:
+        """
+        Merge the runs at stack positions i and i + 1
+
+        Args:
+            i: Stack index of the left run
+        """
+        arr = self.arr
+        base1, len1 = self.runs[i]
+        base2, len2 = self.runs[i + 1]
+        self.runs[i] = (base1, len1 + len2)
+        del self.runs[i + 1]
+
+        # Elements of run 1 already in place need not take part in the merge
+        k = gallop_right(arr[base2], arr, base1, len1, 0)
+        base1 += k
+        len1 -= k
+        if len1 == 0:
+            return
+        # Likewise for the tail of run 2
+        len2 = gallop_left(arr[base1 + len1 - 1], arr, base2, len2, len2 - 1)
+        if len2 == 0:
+            return
+
+        if len1 <= len2:
+            self.merge_lo(base1, len1, base2, len2)
+        else:
+            self.merge_hi(base1, len1, base2, len2)
+    def merge_lo(self, base1: int, len1: int, base2: int, len2: int) -> None:
+        """
+        Merge adjacent runs left to right, buffering the shorter left run
+
+        Requires arr[base2] < arr[base1] and that the last element of run 1
+        is greater than every element of run 2.
+        """
+        arr = self.arr
+        tmp = self._buffer_for(len1)
+        tmp[0:len1] = arr[base1:base1 + len1]
+        cursor1 = 0
+        cursor2 = base2
+        dest = base1
+
+        arr[dest] = arr[cursor2]
+        dest += 1
+        cursor2 += 1
+        len2 -= 1
+        min_gallop = self.min_gallop
+        while len2 > 0 and len1 > 1:
+            count1 = count2 = 0
+            # One pair at a time until a run starts winning consistently
+            while True:
+                if arr[cursor2] < tmp[cursor1]:
+                    arr[dest] = arr[cursor2]
+                    dest += 1
+                    cursor2 += 1
+                    len2 -= 1
+                    count2 += 1
+                    count1 = 0
+                    if len2 == 0:
+                        break
+                else:
+                    arr[dest] = tmp[cursor1]
+                    dest += 1
+                    cursor1 += 1
+                    len1 -= 1
+                    count1 += 1
+                    count2 = 0
+                    if len1 == 1:
+                        break
+                if count1 >= min_gallop or count2 >= min_gallop:
+                    break
+            if len2 == 0 or len1 == 1:
+                break
+
+            # Galloping mode: copy whole stretches found by exponential search
+            min_gallop += 1
+            while True:
+                min_gallop -= min_gallop > 1
+                count1 = gallop_right(arr[cursor2], tmp, cursor1, len1, 0)
+                if count1:
+                    arr[dest:dest + count1] = tmp[cursor1:cursor1 + count1]
+                    dest += count1
+                    cursor1 += count1
+                    len1 -= count1
+                    if len1 <= 1:
+                        break
+                arr[dest] = arr[cursor2]
+                dest += 1
+                cursor2 += 1
+                len2 -= 1
+                if len2 == 0:
+                    break
+                count2 = gallop_left(tmp[cursor1], arr, cursor2, len2, 0)
+                if count2:
+                    arr[dest:dest + count2] = arr[cursor2:cursor2 + count2]
+                    dest += count2
+                    cursor2 += count2
+                    len2 -= count2
+                    if len2 == 0:
+                        break
+                arr[dest] = tmp[cursor1]
+                dest += 1
+                cursor1 += 1
+                len1 -= 1
+                if len1 == 1:
+                    break
+                if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                    break
+            if len2 == 0 or len1 <= 1:
+                break
+            # Penalize leaving galloping mode
+            min_gallop += 1
+        self.min_gallop = max(1, min_gallop)
+
+        if len2 == 0:
+            arr[dest:dest + len1] = tmp[cursor1:cursor1 + len1]
+        else:
+            # Only the last (largest) element of run 1 remains
+            arr[dest:dest + len2] = arr[cursor2:cursor2 + len2]
+            arr[dest + len2] = tmp[cursor1]
+    def merge_hi(self, base1: int, len1: int, base2: int, len2: int) -> None:
+        """
+        Merge adjacent runs right to left, buffering the shorter right run
+
+        Requires arr[base2] < arr[base1] and that the last element of run 1
+        is greater than every element of run 2.
+        """
+        arr = self.arr
+        tmp = self._buffer_for(len2)
+        tmp[0:len2] = arr[base2:base2 + len2]
+        cursor1 = base1 + len1 - 1
+        cursor2 = len2 - 1
+        dest = base2 + len2 - 1
+
+        arr[dest] = arr[cursor1]
+        dest -= 1
+        cursor1 -= 1
+        len1 -= 1
+        min_gallop = self.min_gallop
+        while len1 > 0 and len2 > 1:
+            count1 = count2 = 0
+            while True:
+                if tmp[cursor2] < arr[cursor1]:
+                    arr[dest] = arr[cursor1]
+                    dest -= 1
+                    cursor1 -= 1
+                    len1 -= 1
+                    count1 += 1
+                    count2 = 0
+                    if len1 == 0:
+                        break
+                else:
+                    arr[dest] = tmp[cursor2]
+                    dest -= 1
+                    cursor2 -= 1
+                    len2 -= 1
+                    count2 += 1
+                    count1 = 0
+                    if len2 == 1:
+                        break
+                if count1 >= min_gallop or count2 >= min_gallop:
+                    break
+            if len1 == 0 or len2 == 1:
+                break
+
+            min_gallop += 1
+            while True:
+                min_gallop -= min_gallop > 1
+                count1 = len1 - gallop_right(tmp[cursor2], arr, base1, len1, len1 - 1)
+                if count1:
+                    dest -= count1
+                    cursor1 -= count1
+                    len1 -= count1
+                    arr[dest + 1:dest + 1 + count1] = arr[cursor1 + 1:cursor1 + 1 + count1]
+                    if len1 == 0:
+                        break
+                arr[dest] = tmp[cursor2]
+                dest -= 1
+                cursor2 -= 1
+                len2 -= 1
+                if len2 == 1:
+                    break
+                count2 = len2 - gallop_left(arr[cursor1], tmp, 0, len2, len2 - 1)
+                if count2:
+                    dest -= count2
+                    cursor2 -= count2
+                    len2 -= count2
+                    arr[dest + 1:dest + 1 + count2] = tmp[cursor2 + 1:cursor2 + 1 + count2]
+                    if len2 <= 1:
+                        break
+                arr[dest] = arr[cursor1]
+                dest -= 1
+                cursor1 -= 1
+                len1 -= 1
+                if len1 == 0:
+                    break
+                if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                    break
+            if len1 == 0 or len2 <= 1:
+                break
+            min_gallop += 1
+        self.min_gallop = max(1, min_gallop)
+
+        if len1 == 0:
+            arr[dest - len2 + 1:dest + 1] = tmp[0:len2]
+        else:
+            # Only the first (smallest) element of run 2 remains
+            dest -= len1
+            cursor1 -= len1
+            arr[dest + 1:dest + 1 + len1] = arr[cursor1 + 1:cursor1 + 1 + len1]
+            arr[dest] = tmp[cursor2]
+
+
+class TimSort(SortingAlgorithm):
+    """
+    Timsort implementation
+
+    Detects natural ascending and strictly descending runs, extends short
+    runs to a minimum length with binary insertion sort and merges them on a
+    run stack with galloping. Already sorted input finishes in O(n).
+    """
+    complexity = 'n log n'
+    def sort(self, arr: List[int], ascending: bool = True, inplace: bool = False) -> List[int]:
+        """
+        Sort array using timsort
+
+        Auxiliary memory: O(n / 2) at most, in a single merge buffer that
+        is allocated on the first merge (so sorted input needs none) and
+        grown geometrically. Unless inplace is set, the input is first
+        copied (O(n)).
+
+        Args:
+            arr: List of integers to sort
+            ascending: If True, sort in ascending order, else descending
+            inplace: If True, sort arr (a list or writable buffer) itself
+                    and return it
+
+        Returns:
+            Sorted list of integers
+        """
+        result = working_copy(arr, inplace)
+        # Reversing before and after an ascending stable sort yields a
+        # stable descending sort
+        if not ascending:
+            reverse_in_place(result)
+        self._tim_sort(result)
+        if not ascending:
+            reverse_in_place(result)
+        return result
+    def _tim_sort(self, arr: List[int]) -> None:
+        """
+        Sort arr in ascending order in-place
+
+        Args:
+            arr: List to sort in-place
+        """
+        n = len(arr)
+        if n < 2:
+            return
+        state = _MergeState(arr)
+        min_run = compute_min_run(n)
+        low = 0
+        while low < n:
+            run_len = self._count_run_and_make_ascending(arr, low, n)
+            if run_len < min_run:
+                forced = min(n - low, min_run)
+                self._binary_insertion_sort(arr, low, low + forced, low + run_len)
+                run_len = forced
+            state.push_run(low, run_len)
+            low += run_len
+        state.merge_force_collapse()
+    @staticmethod
+    def _count_run_and_make_ascending(arr: List[int], low: int, high: int) -> int:
+        """
+        Find the length of the run starting at low, reversing it if it is
+        strictly descending (strictness keeps the sort stable)
+
+        Args:
+            arr: List being sorted
+            low: Start index of the run
+            high: End of the array (exclusive)
+
+        Returns:
+            Length of the run
+        """
+        run_high = low + 1
+        if run_high == high:
+            return 1
+        if arr[run_high] < arr[low]:
+            run_high += 1
+            while run_high < high and arr[run_high] < arr[run_high - 1]:
+                run_high += 1
+            arr[low:run_high] = arr[low:run_high][::-1]
+        else:
+            run_high += 1
+            while run_high < high and not arr[run_high] < arr[run_high - 1]:
+                run_high += 1
+        return run_high - low
+    @staticmethod
+    def _binary_insertion_sort(arr: List[int], low: int, high: int, start: int) -> None:
+        """
+        Sort arr[low:high] given that arr[low:start] is already sorted
+
+        Args:
+            arr: List to sort in-place
+            low: Starting index
+            high: Ending index (exclusive)
+            start: First index not known to be in order
+        """
+        for i in range(start, high):
+            pivot = arr[i]
+            pos = bisect_right(arr, pivot, low, i)
+            if pos != i:
+                arr[pos + 1:i + 1] = arr[pos:i]
+                arr[pos] = pivot
+    def get_name(self) -> str:
+        """Return the name of the sorting algorithm"""
+        return "Tim Sort"
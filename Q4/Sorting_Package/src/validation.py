@@ -0,0 +1,146 @@
+"""
+src/validation.py
+Input validation shared by the sorting factory
+"""
+from array import array
+from typing import Optional, Tuple
+
+INT32_MIN = -2147483648
+INT32_MAX = 2147483647
+MAX_INPUT_SIZE = 200000
+# array.array typecodes (and memoryview formats) holding integers
+INTEGER_TYPECODES = 'bBhHiIlLqQ'
+
+
+def is_int32_buffer(values) -> bool:
+    """
+    Check whether values is a typed buffer that can only hold INT32 values
+
+    Args:
+        values: Object to check
+
+    Returns:
+        True for array.array('i') and one-dimensional memoryviews of
+        format 'i' with 4-byte items
+    """
+    if isinstance(values, array):
+        return values.typecode == 'i' and values.itemsize == 4
+    if isinstance(values, memoryview):
+        return values.format == 'i' and values.itemsize == 4 and values.ndim == 1
+    return False
+
+
+def is_int_buffer(values) -> bool:
+    """
+    Check whether values is a one-dimensional buffer of integers
+
+    Args:
+        values: Object to check
+
+    Returns:
+        True for bytearray, integer array.array and one-dimensional
+        memoryviews with an integer format
+    """
+    if isinstance(values, bytearray):
+        return True
+    if isinstance(values, array):
+        return values.typecode in INTEGER_TYPECODES
+    if isinstance(values, memoryview):
+        return values.format in INTEGER_TYPECODES and values.ndim == 1
+    return False
+
+
+def validate_int32(values, trusted: bool = False,
+                   writable: bool = False) -> Optional[Tuple[int, int]]:
+    """
+    Validate sorting input and return its bounds
+
+    Lists are checked in one pass that verifies element types while
+    tracking min and max; the INT32 range check is then made on the two
+    bounds alone. Typed integer buffers skip the element checks, and
+    trusted input skips validation entirely.
+
+    Args:
+        values: List of integers, or an int32 array.array / memoryview
+        trusted: If True, the caller guarantees values is already valid
+        writable: If True, values will be sorted in place: any writable
+                 integer buffer (bytearray, array.array, memoryview) is
+                 accepted, with its bounds range-checked
+
+    Returns:
+        Tuple (min, max), or None for empty or trusted input
+
+    Raises:
+        TypeError: If values is neither a list nor an int32 buffer, or
+                  is a read-only buffer when writable is set
+        ValueError: If list contains non-integers, exceeds the size limit
+                   or holds elements outside INT32 range
+    """
+    if writable and isinstance(values, memoryview) and values.readonly:
+        raise TypeError("Input buffer is read-only")
+    if trusted:
+        return None
+    typed = is_int32_buffer(values)
+    buffer = typed or (writable and is_int_buffer(values))
+    if not buffer and not isinstance(values, list):
+        raise TypeError("Input must be a list")
+    if len(values) > MAX_INPUT_SIZE:
+        raise ValueError("List size exceeds maximum of 2x10^5 elements")
+    if len(values) == 0:
+        return None
+
+    if buffer:
+        low, high = min(values), max(values)
+    else:
+        low = high = values[0]
+        for value in values:
+            # Exact type test first; isinstance only for int subclasses (bool)
+            if type(value) is not int and not isinstance(value, int):
+                raise ValueError("All elements must be integers")
+            if value < low:
+                low = value
+            elif value > high:
+                high = value
+    if low < INT32_MIN:
+        raise ValueError(f"Element {low} outside INT32 range")
+    if high > INT32_MAX:
+        raise ValueError(f"Element {high} outside INT32 range")
+    return low, high
+
+
+def validate_int32_value(value) -> None:
+    """
+    Validate a single element under the same rules as validate_int32
+
+    Args:
+        value: Element to check
+
+    Raises:
+        ValueError: If value is not an integer or is outside INT32 range
+    """
+    if type(value) is not int and not isinstance(value, int):
+        raise ValueError("All elements must be integers")
+    if not INT32_MIN <= value <= INT32_MAX:
+        raise ValueError(f"Element {value} outside INT32 range")
+
+
+def validate_records(values, trusted: bool = False) -> None:
+    """
+    Validate input that is sorted by key rather than by value
+
+    Items may be of any type, so only the container and size are checked.
+
+    Args:
+        values: List of items
+        trusted: If True, the caller guarantees values is already valid
+
+    Raises:
+        TypeError: If values is not a list
+        ValueError: If values exceeds the size limit
+    """
+    if trusted:
+        return
+    if not isinstance(values, list):
+        raise TypeError("Input must be a list")
+    if len(values) > MAX_INPUT_SIZE:
+        raise ValueError("List size exceeds maximum of 2x10^5 elements")
@@ -10,7 +10,13 @@ from src.bubble_sort import BubbleSort
 from src.selection_sort import SelectionSort
 from src.quick_sort import QuickSort
 from src.merge_sort import MergeSort
+from src.bottom_up_merge_sort import BottomUpMergeSort
+from src.block_merge_sort import BlockMergeSort
 from src.shell_sort import ShellSort
+from src.intro_sort import IntroSort
+from src.tim_sort import TimSort
+from src.radix_sort import RadixSort
+from src.parallel_merge_sort import ParallelMergeSort
 from src.sorting_factory import SortingFactory
 
 
@@ -24,7 +30,13 @@ class TestSortingAlgorithms:
             SelectionSort(),
             QuickSort(),
             MergeSort(),
-            ShellSort()
+            BottomUpMergeSort(),
+            BlockMergeSort(),
+            ShellSort(),
+            IntroSort(),
+            TimSort(),
+            RadixSort(),
+            ParallelMergeSort(workers=2, threshold=1)
         ]
         self.test_cases = self._generate_test_cases()
         self.total_passed = 0
@@ -107,7 +119,8 @@ class TestSortingAlgorithms:
         print("\nTesting Factory Pattern:")
         
         factory = SortingFactory()
-        algorithms = ['bubble', 'selection', 'quick', 'merge']
+        algorithms = ['bubble', 'selection', 'quick', 'merge', 'intro', 'tim', 'radix',
+                      'parallel_merge']
         
         for algo_name in algorithms:
             passed = 0
@@ -126,13 +139,789 @@ class TestSortingAlgorithms:
             self.total_passed += passed
             self.total_failed += failed
     
+    def test_large_inputs(self):
+        """Test worst-case shaped inputs at the factory's size cap"""
+        print("\nTesting Large Inputs:")
+
+        factory = SortingFactory()
+        n = 200000
+        cases = {
+            'sorted': list(range(n)),
+            'reversed': list(range(n, 0, -1)),
+            'all equal': [7] * n,
+            'organ pipe': list(range(n // 2)) + list(range(n // 2, 0, -1)),
+        }
+
+        for algo_name in ['intro', 'tim', 'radix']:
+            for case_name, input_arr in cases.items():
+                expected = sorted(input_arr)
+                try:
+                    ok = (factory.sort(algo_name, input_arr, ascending=True) == expected and
+                          factory.sort(algo_name, input_arr, ascending=False) == expected[::-1])
+                except RecursionError:
+                    ok = False
+                status = "✓ PASS" if ok else "✗ FAIL"
+                print(f"  {algo_name:<6} {case_name:<13} {status}")
+                self.total_passed += int(ok)
+                self.total_failed += int(not ok)
+
+    def test_distributions(self):
+        """Test every algorithm on every benchmark input distribution"""
+        print("\nTesting Benchmark Distributions:")
+
+        from src.distributions import DISTRIBUTIONS, generate
+        inputs = [generate(name, 300, seed=1) for name in DISTRIBUTIONS]
+
+        for algo in self.algorithms:
+            passed = sum(int(algo.sort(values) == sorted(values)) for values in inputs)
+            status = "✓ PASS" if passed == len(inputs) else "✗ FAIL"
+            print(f"  {algo.get_name():<20} {passed}/{len(inputs)} {status}")
+            self.total_passed += passed
+            self.total_failed += len(inputs) - passed
+
+    def test_instrumentation(self):
+        """Test operation counters reported by instrumented sorts"""
+        print("\nTesting Instrumentation:")
+
+        factory = SortingFactory()
+        passed = 0
+        total = 0
+        for algo in self.algorithms:
+            for input_arr, expected in self.test_cases:
+                total += 1
+                result, stats = algo.sort_instrumented(input_arr, ascending=True)
+                passed += int(result == expected and all(type(x) is int for x in result))
+
+        # Bubble sort on sorted input makes exactly n - 1 comparisons and no moves
+        _, stats = factory.sort_instrumented('bubble', list(range(100)))
+        total += 1
+        passed += int(stats.comparisons == 99 and stats.moves == 0)
+        # Merge sort recursion depth grows with log2(n)
+        _, small = factory.sort_instrumented('merge', list(range(64)))
+        _, large = factory.sort_instrumented('merge', list(range(4096)))
+        total += 1
+        passed += int(large.max_depth == small.max_depth + 6)
+
+        status = "✓ PASS" if passed == total else "✗ FAIL"
+        print(f"  {'instrumented':<20} {passed}/{total} {status}")
+        self.total_passed += passed
+        self.total_failed += total - passed
+
+    def test_numpy_backend(self):
+        """Test the NumPy sorting backend"""
+        print("\nTesting NumPy Backend:")
+
+        try:
+            import numpy as np
+        except ImportError:
+            print("  NumPy not installed: skipped")
+            return
+
+        from array import array
+        factory = SortingFactory()
+        passed = 0
+        total = 0
+        for input_arr, expected in self.test_cases:
+            for values in (input_arr, array('i', input_arr), np.array(input_arr, dtype=np.int32)):
+                total += 2
+                result = factory.sort('merge', values, ascending=True, backend='numpy')
+                passed += int(isinstance(result, np.ndarray) and result.tolist() == expected)
+                result = factory.sort('quick', values, ascending=False, backend='numpy', as_list=True)
+                passed += int(result == expected[::-1])
+
+        status = "✓ PASS" if passed == total else "✗ FAIL"
+        print(f"  {'numpy':<20} {passed}/{total} {status}")
+        self.total_passed += passed
+        self.total_failed += total - passed
+
+    def test_validation(self):
+        """Test validation fast paths for typed buffers and trusted input"""
+        print("\nTesting Validation:")
+
+        from array import array
+        factory = SortingFactory()
+        passed = 0
+        total = 0
+        for input_arr, expected in self.test_cases:
+            for values, trusted in ((array('i', input_arr), False),
+                                    (memoryview(array('i', input_arr)), False),
+                                    (input_arr, True)):
+                total += 1
+                passed += int(factory.sort('radix', values, trusted=trusted) == expected)
+
+        status = "✓ PASS" if passed == total else "✗ FAIL"
+        print(f"  {'typed/trusted':<20} {passed}/{total} {status}")
+        self.total_passed += passed
+        self.total_failed += total - passed
+
+    def test_external_sort(self):
+        """Test external sorting through run files and multi-pass merging"""
+        print("\nTesting External Sort:")
+
+        import random
+        import tempfile
+        from src.external_sort import ExternalSorter
+
+        values = [random.randint(-2147483648, 2147483647) for _ in range(20000)]
+        passed = 0
+        total = 0
+        with tempfile.TemporaryDirectory() as work_dir:
+            input_file = os.path.join(work_dir, 'input.txt')
+            output_file = os.path.join(work_dir, 'output.txt')
+            with open(input_file, 'w', encoding='utf-8') as f:
+                f.write(',\n'.join(map(str, values)))
+            # About 1000-element runs and a fan-in of 3 force several merge
+            # passes
+            sorter = ExternalSorter(memory_budget=160000, fan_in=3)
+            for ascending in (True, False):
+                total += 1
+                count = sorter.sort_file(input_file, output_file, ascending)
+                with open(output_file, 'r', encoding='utf-8') as f:
+                    result = [int(line) for line in f]
+                passed += int(count == len(values) and
+                              result == sorted(values, reverse=not ascending))
+
+            # Every phase stays within the memory budget
+            import tracemalloc
+            budget = 1 << 20
+            values = [random.randint(-2147483648, 2147483647) for _ in range(60000)]
+            with open(input_file, 'w', encoding='utf-8') as f:
+                f.write(',\n'.join(map(str, values)))
+            sorter = ExternalSorter(memory_budget=budget, fan_in=4)
+            tracemalloc.start()
+            try:
+                count = sorter.sort_file(input_file, output_file)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            with open(output_file, 'r', encoding='utf-8') as f:
+                result = [int(line) for line in f]
+            total += 1
+            passed += int(peak < budget and count == len(values) and result == sorted(values))
+
+        status = "✓ PASS" if passed == total else "✗ FAIL"
+        print(f"  {'external':<20} {passed}/{total} {status}")
+        self.total_passed += passed
+        self.total_failed += total - passed
+
+    def test_inplace(self):
+        """Test in-place sorting of lists and writable buffers"""
+        print("\nTesting In-place Sort:")
+
+        from array import array
+        factory = SortingFactory()
+        for algorithm in factory.get_available_algorithms():
+            passed = 0
+            total = 0
+            for input_arr, expected in self.test_cases:
+                for ascending in (True, False):
+                    for values in (list(input_arr),
+                                   array('i', input_arr),
+                                   memoryview(array('i', input_arr)),
+                                   array('q', input_arr)):
+                        total += 1
+                        result = factory.sort(algorithm, values, ascending, inplace=True)
+                        passed += int(result is values and
+                                      list(result) == expected[::1 if ascending else -1])
+            # bytearray holds unsigned bytes only
+            for ascending in (True, False):
+                total += 1
+                values = bytearray([200, 3, 77, 3, 0, 255, 18])
+                result = factory.sort(algorithm, values, ascending, inplace=True)
+                passed += int(result is values and
+                              list(result) == sorted(result, reverse=not ascending))
+
+            status = "✓ PASS" if passed == total else "✗ FAIL"
+            print(f"  {algorithm:<20} {passed}/{total} {status}")
+            self.total_passed += passed
+            self.total_failed += total - passed
+
+        # Worker processes copy byte buffers one value per element
+        import random
+        rng = random.Random(10)
+        raw = bytes(rng.randrange(256) for _ in range(3000))
+        passed = 0
+        total = 0
+        for ascending in (True, False):
+            for values in (bytearray(raw), memoryview(bytearray(raw))):
+                total += 1
+                result = ParallelMergeSort(workers=2, threshold=1).sort(values, ascending,
+                                                                        inplace=True)
+                passed += int(result is values and
+                              list(values) == sorted(raw, reverse=not ascending))
+        status = "✓ PASS" if passed == total else "✗ FAIL"
+        print(f"  {'parallel bytes':<20} {passed}/{total} {status}")
+        self.total_passed += passed
+        self.total_failed += total - passed
+
+        # Read-only buffers cannot be sorted in place
+        try:
+            factory.sort('tim', memoryview(bytes([3, 1, 2])), inplace=True)
+            print("  Read-only buffer: ✗ FAIL")
+            self.total_failed += 1
+        except TypeError:
+            print("  Read-only buffer: ✓ PASS")
+            self.total_passed += 1
+
+    def test_key_sort(self):
+        """Test key and comparator sorting: keys computed once, stable order"""
+        print("\nTesting Key Sort:")
+
+        import random
+        rng = random.Random(7)
+        # Few distinct scores, so stability is visible in the output
+        records = [(f"item{i}", rng.randint(-3, 3)) for i in range(300)]
+        factory = SortingFactory()
+        for algorithm in factory.get_available_algorithms():
+            passed = 0
+            total = 0
+            for ascending in (True, False):
+                expected = sorted(records, key=lambda r: r[1], reverse=not ascending)
+                calls = []
+
+                def score(record):
+                    calls.append(record)
+                    return record[1]
+                total += 2
+                result = factory.sort(algorithm, records, ascending, key=score)
+                passed += int(result == expected and len(calls) == len(records))
+                values = list(records)
+                result = factory.sort(algorithm, values, ascending, inplace=True,
+                                      cmp=lambda a, b: a[1] - b[1])
+                passed += int(result is values and values == expected)
+                # Keys that are not integers sort on every algorithm
+                total += 1
+                result = factory.sort(algorithm, records, ascending,
+                                      key=lambda r: (str(r[1]), r[0]))
+                passed += int(result == sorted(records, key=lambda r: (str(r[1]), r[0]),
+                                               reverse=not ascending))
+
+            status = "✓ PASS" if passed == total else "✗ FAIL"
+            print(f"  {algorithm:<20} {passed}/{total} {status}")
+            self.total_passed += passed
+            self.total_failed += total - passed
+
+    def test_auto_selection(self):
+        """Test that 'auto' picks the expected algorithm for each distribution"""
+        print("\nTesting Auto Selection:")
+
+        from src.auto_select import select_algorithm
+        from src.distributions import generate
+        expected = {
+            'random': 'radix',
+            'sorted': 'tim',
+            'reversed': 'tim',
+            'few_unique': 'intro',
+            'organ_pipe': 'tim',
+            'sawtooth': 'radix',
+            'nearly_sorted': 'tim',
+        }
+        factory = SortingFactory()
+        passed = 0
+        total = 0
+        for distribution, name in expected.items():
+            values = generate(distribution, 100000, seed=3)
+            total += 2
+            passed += int(select_algorithm(values) == name)
+            passed += int(factory.sort('auto', values) == sorted(values))
+        # Narrow value ranges go to radix sort's counting path; small
+        # unordered inputs to introsort
+        total += 2
+        narrow = [(i * 7919) % 1000 for i in range(10000)]
+        passed += int(select_algorithm(narrow) == 'radix')
+        passed += int(select_algorithm(generate('random', 200, seed=3)) == 'intro')
+
+        status = "✓ PASS" if passed == total else "✗ FAIL"
+        print(f"  {'auto':<20} {passed}/{total} {status}")
+        self.total_passed += passed
+        self.total_failed += total - passed
+
+    def test_batch_io(self):
+        """Test the streaming case reader and the per-case report writer"""
+        print("\nTesting Batch I/O:")
+
+        import tempfile
+        from src.batch_io import ReportWriter, iter_test_cases, parse_int_list
+
+        passed = 0
+        total = 4
+        passed += int(parse_int_list(" 3, -1,2 ") == [3, -1, 2] and parse_int_list("") == [])
+        with tempfile.TemporaryDirectory() as work_dir:
+            input_file = os.path.join(work_dir, 'input.txt')
+            with open(input_file, 'w', encoding='utf-8') as f:
+                f.write("Quick\nascending\n3,1,2\n\nmerge\nDESCENDING\n5, 9, -1\nbubble\n")
+            cases = list(iter_test_cases(input_file))
+            passed += int(cases == [
+                {'algorithm': 'quick', 'ascending': True, 'input_list': [3, 1, 2]},
+                {'algorithm': 'merge', 'ascending': False, 'input_list': [5, 9, -1]},
+            ])
+
+            writer = ReportWriter(os.path.join(work_dir, 'reports'))
+            values = list(range(10000, 0, -1))
+            path = writer.write_case(1, 'tim', True, values, sorted(values))
+            with open(path, 'r', encoding='utf-8') as f:
+                report = f.read()
+            passed += int(f"  Output: {sorted(values)}\n" in report and "✓ SUCCESS" in report)
+            path = writer.write_case(2, 'nope', True, [1], error="Unknown algorithm")
+            with open(path, 'r', encoding='utf-8') as f:
+                passed += int("Error: Unknown algorithm" in f.read())
+
+        status = "✓ PASS" if passed == total else "✗ FAIL"
+        print(f"  {'batch_io':<20} {passed}/{total} {status}")
+        self.total_passed += passed
+        self.total_failed += total - passed
+
+    def test_sort_many(self):
+        """Test batch sorting in-process and across a worker pool"""
+        print("\nTesting Batch Sorting:")
+
+        factory = SortingFactory()
+        jobs = [{'algorithm': name, 'input_list': input_arr, 'ascending': i % 2 == 0}
+                for i, (name, (input_arr, _)) in enumerate(
+                    zip(['quick', 'merge', 'tim', 'radix', 'auto', 'intro'] * 2, self.test_cases))]
+        jobs.append({'algorithm': 'invalid', 'input_list': [1, 2]})
+        jobs.append({'algorithm': 'shell', 'input_list': [3, 1, 2], 'stats': True})
+        for workers in (1, 2):
+            results = factory.sort_many(jobs, workers=workers)
+            passed = int(len(results) == len(jobs))
+            total = len(jobs) + 1
+            for job, outcome in zip(jobs, results):
+                if job['algorithm'] == 'invalid':
+                    passed += int(outcome['result'] is None and "Unknown algorithm" in outcome['error'])
+                    continue
+                expected = sorted(job['input_list'], reverse=not job.get('ascending', True))
+                passed += int(outcome['job'] is job and outcome['result'] == expected and
+                              outcome['error'] is None and outcome['seconds'] >= 0 and
+                              (outcome['stats'] is not None) == job.get('stats', False))
+
+            status = "✓ PASS" if passed == total else "✗ FAIL"
+            print(f"  {f'workers={workers}':<20} {passed}/{total} {status}")
+            self.total_passed += passed
+            self.total_failed += total - passed
+
+        # main.py rejects negative worker counts while parsing arguments
+        import contextlib
+        import io
+        import main
+        ok = main.parse_args(['input.txt', '--jobs', '0']).jobs == 0
+        for jobs in ('-1', 'x'):
+            try:
+                with contextlib.redirect_stderr(io.StringIO()):
+                    main.parse_args(['input.txt', '--jobs', jobs])
+                ok = False
+            except SystemExit:
+                pass
+        print(f"  --jobs validation: {'✓ PASS' if ok else '✗ FAIL'}")
+        self.total_passed += int(ok)
+        self.total_failed += int(not ok)
+
+    def test_order_statistics(self):
+        """Test select_kth, top_k and partial_sort in both directions"""
+        print("\nTesting Order Statistics:")
+
+        import random
+        from src.distributions import DISTRIBUTIONS, generate
+        factory = SortingFactory()
+        rng = random.Random(5)
+        passed = 0
+        total = 0
+        inputs = [input_arr for input_arr, _ in self.test_cases if input_arr]
+        inputs += [generate(name, 5000, seed=5) for name in DISTRIBUTIONS]
+        for values in inputs:
+            n = len(values)
+            for ascending in (True, False):
+                expected = sorted(values, reverse=not ascending)
+                k = rng.randrange(n)
+                total += 3
+                passed += int(factory.select_kth(values, k, ascending) == expected[k])
+                k = rng.randint(0, n)
+                passed += int(factory.top_k(values, k, ascending) == expected[:k])
+                result = factory.partial_sort(values, k, ascending)
+                passed += int(result[:k] == expected[:k] and sorted(result) == sorted(values))
+
+        status = "✓ PASS" if passed == total else "✗ FAIL"
+        print(f"  {'select/top_k/partial':<20} {passed}/{total} {status}")
+        self.total_passed += passed
+        self.total_failed += total - passed
+
+        # Out-of-range k is rejected like invalid input
+        try:
+            factory.select_kth([1, 2, 3], 3)
+            print("  Invalid k: ✗ FAIL")
+            self.total_failed += 1
+        except ValueError:
+            print("  Invalid k: ✓ PASS")
+            self.total_passed += 1
+
+    def test_sorted_container(self):
+        """Test SortedContainer against a plain sorted list under random updates"""
+        print("\nTesting SortedContainer:")
+
+        import bisect
+        import random
+        from src.sorted_container import SortedContainer
+        rng = random.Random(17)
+        passed = 0
+        total = 0
+        # A small load forces many chunk splits and merges
+        for load in (4, 1000):
+            container = SortedContainer([rng.randint(-50, 50) for _ in range(100)], load=load)
+            model = sorted(container)
+            for _ in range(3000):
+                op = rng.random()
+                value = rng.randint(-60, 60)
+                if op < 0.45:
+                    container.add(value)
+                    bisect.insort(model, value)
+                elif op < 0.7 and model:
+                    value = rng.choice(model)
+                    container.remove(value)
+                    model.remove(value)
+                elif op < 0.8 and model:
+                    index = rng.randrange(-len(model), len(model))
+                    total += 1
+                    passed += int(container.pop(index) == model.pop(index))
+                elif op < 0.85:
+                    container.update([rng.randint(-60, 60) for _ in range(20)])
+                    model = sorted(container)
+                else:
+                    high = value + rng.randint(0, 30)
+                    total += 1
+                    passed += int(list(container.irange(value, high))
+                                  == [v for v in model if value <= v <= high]
+                                  and container.bisect_left(value)
+                                  == bisect.bisect_left(model, value)
+                                  and container.count(value) == model.count(value))
+                if model:
+                    index = rng.randrange(len(model))
+                    total += 1
+                    passed += int(container[index] == model[index] and len(container) == len(model))
+            total += 1
+            passed += int(list(container) == model and container[5:50] == model[5:50]
+                          and list(reversed(container)) == model[::-1])
+
+        status = "✓ PASS" if passed == total else "✗ FAIL"
+        print(f"  {'random operations':<20} {passed}/{total} {status}")
+        self.total_passed += passed
+        self.total_failed += total - passed
+
+        # Missing values and non-INT32 values are rejected
+        container = SortedContainer([3, 1, 2])
+        for action in (lambda: container.remove(7), lambda: container.add(2 ** 31),
+                       lambda: container.add("x")):
+            try:
+                action()
+                print("  Invalid operation: ✗ FAIL")
+                self.total_failed += 1
+            except ValueError:
+                print("  Invalid operation: ✓ PASS")
+                self.total_passed += 1
+
+    def test_result_cache(self):
+        """Test that cached results are correct, isolated and bounded"""
+        print("\nTesting Result Cache:")
+
+        from array import array
+        factory = SortingFactory(cache_bytes=1 << 20)
+        passed = 0
+        total = 0
+        for name in ['quick', 'tim', 'radix', 'auto']:
+            for input_arr, expected in self.test_cases:
+                for ascending in (True, False):
+                    want = expected if ascending else expected[::-1]
+                    first = factory.sort(name, list(input_arr), ascending)
+                    # Corrupting a returned list must not leak into the cache
+                    first.append(0)
+                    second = factory.sort(name, list(input_arr), ascending)
+                    total += 1
+                    passed += int(second == want)
+        # Buffers with the same contents share the list's entry
+        factory.sort('tim', [3, 1, 2])
+        hits = factory.cache_info()['hits']
+        total += 1
+        passed += int(factory.sort('tim', array('i', [3, 1, 2])) == [1, 2, 3]
+                      and factory.cache_info()['hits'] == hits + 1)
+        # Inputs the uncached path rejects are rejected on a warm cache too
+        factory.sort('tim', [3])
+        for values in ((3, 1, 2), array('q', [3, 1, 2]), b'\x03\x00\x00\x00',
+                       bytearray(b'\x03\x00\x00\x00')):
+            total += 1
+            try:
+                factory.sort('tim', values)
+            except TypeError:
+                passed += 1
+        # A hit returns exactly what the miss did, bools included
+        first = factory.sort('tim', [True, False, 3])
+        second = factory.sort('tim', [True, False, 3])
+        total += 1
+        passed += int(first == second and list(map(type, second)) == [bool, bool, int])
+        # Instrumented sorts bypass the cache, so main.py refuses both flags
+        import contextlib
+        import io
+        import main
+        total += 1
+        try:
+            with contextlib.redirect_stderr(io.StringIO()):
+                main.parse_args(['input.txt', '--stats', '--cache-mb', '1'])
+        except SystemExit:
+            passed += 1
+
+        status = "✓ PASS" if passed == total else "✗ FAIL"
+        print(f"  {'cached results':<20} {passed}/{total} {status}")
+        self.total_passed += passed
+        self.total_failed += total - passed
+
+        # The memory bound evicts least recently used entries
+        factory = SortingFactory(cache_bytes=20000)
+        for i in range(10):
+            factory.sort('tim', list(range(1000 + i, 0, -1)))
+        info = factory.cache_info()
+        ok = info['bytes'] <= 20000 and info['evictions'] > 0 and info['misses'] == 10
+        factory.sort('tim', list(range(1009, 0, -1)))
+        ok = ok and factory.cache_info()['hits'] == 1
+        print(f"  LRU eviction: {'✓ PASS' if ok else '✗ FAIL'}")
+        self.total_passed += int(ok)
+        self.total_failed += int(not ok)
+
+        # Invalid input and names still raise with a warm cache
+        for args in ((['x', 1],), ([2 ** 31],)):
+            try:
+                factory.sort('tim', *args)
+                print("  Invalid cached input: ✗ FAIL")
+                self.total_failed += 1
+            except ValueError:
+                print("  Invalid cached input: ✓ PASS")
+                self.total_passed += 1
+        try:
+            factory.sort('nope', list(range(1009, 0, -1)))
+            print("  Invalid cached name: ✗ FAIL")
+            self.total_failed += 1
+        except ValueError:
+            print("  Invalid cached name: ✓ PASS")
+            self.total_passed += 1
+
+    def test_registry(self):
+        """Test lazy loading, plugin registration and the package exports"""
+        print("\nTesting Algorithm Registry:")
+
+        import subprocess
+        from importlib.metadata import EntryPoint
+        import src
+        from src.registry import ENTRY_POINT_GROUP, _registered, register_algorithm
+        from src.sorting_base import SortingAlgorithm
+
+        # Creating a factory imports no algorithm until one is used
+        code = ("import sys; from src.sorting_factory import SortingFactory; "
+                "f = SortingFactory(); before = 'src.bubble_sort' in sys.modules; "
+                "f.sort('bubble', [2, 1]); "
+                "print(before, 'src.bubble_sort' in sys.modules, 'src.tim_sort' in sys.modules)")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run([sys.executable, '-c', code], cwd=root,
+                                capture_output=True, text=True).stdout.split()
+        checks = [('lazy import', output == ['False', 'True', 'False'])]
+
+        factory = SortingFactory()
+        plugins = factory.algorithms._plugins
+        try:
+            @register_algorithm('test_reversed_builtin')
+            class BuiltinSort(SortingAlgorithm):
+                def get_name(self):
+                    return "Built-in Sort"
+                def sort(self, arr, ascending=True, inplace=False):
+                    result = sorted(arr, reverse=not ascending)
+                    if inplace:
+                        arr[:] = result
+                        return arr
+                    return result
+
+            checks.append(('decorator plugin',
+                           factory.sort('test_reversed_builtin', [3, 1, 2], False) == [3, 2, 1]
+                           and 'test_reversed_builtin' in factory.get_available_algorithms()))
+            try:
+                register_algorithm('tim')(BuiltinSort)
+                checks.append(('duplicate name', False))
+            except ValueError:
+                checks.append(('duplicate name', True))
+
+            # Entry points are discovered by name from the plugin group
+            entry_point = EntryPoint(name='test_entry_point', value='src.shell_sort:ShellSort',
+                                     group=ENTRY_POINT_GROUP)
+            factory.algorithms._plugins = {'test_entry_point': entry_point}
+            checks.append(('entry point plugin',
+                           factory.sort('test_entry_point', [5, -1, 3]) == [-1, 3, 5]))
+        finally:
+            # Later tests must not see the test algorithms
+            _registered.pop('test_reversed_builtin', None)
+            factory.algorithms._plugins = plugins
+        checks.append(('plugins removed', not {'test_reversed_builtin', 'test_entry_point'}
+                       & set(SortingFactory().get_available_algorithms())))
+
+        # Every name in __all__ resolves
+        checks.append(('package exports', all(hasattr(src, name) for name in src.__all__)
+                       and 'ShellSort' in src.__all__))
+
+        for name, ok in checks:
+            print(f"  {name:<20} {'✓ PASS' if ok else '✗ FAIL'}")
+            self.total_passed += int(ok)
+            self.total_failed += int(not ok)
+
+    def test_array_backend(self):
+        """Test the compact array.array('i') backend"""
+        print("\nTesting Array Backend:")
+
+        from array import array
+        from src.distributions import generate
+        from src.registry import BUILTIN_ALGORITHMS
+        factory = SortingFactory()
+        inputs = [input_arr for input_arr, _ in self.test_cases]
+        inputs += [generate('random', 3000, seed=21), generate('few_unique', 3000, seed=21)]
+        for name in list(BUILTIN_ALGORITHMS) + ['auto']:
+            passed = 0
+            total = 0
+            for values in inputs:
+                for ascending in (True, False):
+                    expected = sorted(values, reverse=not ascending)
+                    result = factory.sort(name, values, ascending, backend='array')
+                    as_list = factory.sort(name, array('i', values), ascending,
+                                           backend='array', as_list=True)
+                    total += 1
+                    passed += int(isinstance(result, array) and result.typecode == 'i'
+                                  and result.tolist() == expected and as_list == expected)
+            status = "✓ PASS" if passed == total else "✗ FAIL"
+            print(f"  {name:<20} {passed}/{total} {status}")
+            self.total_passed += passed
+            self.total_failed += total - passed
+
+        # Worker processes read their chunks back into int32 arrays, both
+        # on the array backend and when sorting arrays in place
+        from src.registry import _registered, register_algorithm
+
+        @register_algorithm('test_two_worker_merge')
+        class TwoWorkerMergeSort(ParallelMergeSort):
+            def __init__(self):
+                super().__init__(workers=2, threshold=1)
+
+        values = generate('random', 3000, seed=21)
+        passed = 0
+        total = 0
+        try:
+            for ascending in (True, False):
+                expected = sorted(values, reverse=not ascending)
+                packed = array('i', values)
+                result = TwoWorkerMergeSort().sort(packed, ascending, inplace=True)
+                total += 2
+                passed += int(result is packed and packed.tolist() == expected)
+                result = factory.sort('test_two_worker_merge', values, ascending,
+                                      backend='array')
+                passed += int(isinstance(result, array) and result.tolist() == expected)
+        finally:
+            _registered.pop('test_two_worker_merge', None)
+        status = "✓ PASS" if passed == total else "✗ FAIL"
+        print(f"  {'parallel workers':<20} {passed}/{total} {status}")
+        self.total_passed += passed
+        self.total_failed += total - passed
+
+        # Invalid values are reported like on the 'python' backend
+        for values in ([1, 'x'], [1.5], [2 ** 31]):
+            try:
+                factory.sort('tim', values, backend='array')
+                print("  Invalid array input: ✗ FAIL")
+                self.total_failed += 1
+            except ValueError:
+                print("  Invalid array input: ✓ PASS")
+                self.total_passed += 1
+
+    def test_argsort(self):
+        """Test stable argsort for every algorithm and apply_permutation"""
+        print("\nTesting Argsort:")
+
+        from array import array
+        from src.distributions import generate
+        from src.permutation import apply_permutation
+        from src.registry import BUILTIN_ALGORITHMS
+        factory = SortingFactory()
+        inputs = [input_arr for input_arr, _ in self.test_cases]
+        inputs += [generate('few_unique', 2000, seed=22), generate('random', 2000, seed=22)]
+        for name in list(BUILTIN_ALGORITHMS) + ['auto']:
+            passed = 0
+            total = 0
+            for values in inputs:
+                for ascending in (True, False):
+                    # Python's sort is stable, also with reverse=True
+                    expected = sorted(range(len(values)), key=values.__getitem__,
+                                      reverse=not ascending)
+                    total += 1
+                    passed += int(factory.argsort(name, values, ascending) == expected)
+            status = "✓ PASS" if passed == total else "✗ FAIL"
+            print(f"  {name:<20} {passed}/{total} {status}")
+            self.total_passed += passed
+            self.total_failed += total - passed
+
+        # One permutation reorders every column alike
+        ages = [30, 25, 30, 20]
+        names = ['ann', 'bob', 'cy', 'dee']
+        ids = array('i', [1, 2, 3, 4])
+        order = factory.argsort('tim', ages)
+        columns = apply_permutation(order, ages, names, ids)
+        ok = (columns == [[20, 25, 30, 30], ['dee', 'bob', 'ann', 'cy'], array('i', [4, 2, 1, 3])]
+              and apply_permutation([0], ['x']) == [['x']])
+        try:
+            apply_permutation(order, [1, 2])
+            ok = False
+        except ValueError:
+            pass
+        print(f"  apply_permutation: {'✓ PASS' if ok else '✗ FAIL'}")
+        self.total_passed += int(ok)
+        self.total_failed += int(not ok)
+
+    def test_merge_sorted(self):
+        """Test the lazy k-way merge on sequences and iterators"""
+        print("\nTesting K-way Merge:")
+
+        import itertools
+        import random
+        from array import array
+        from src.kway_merge import merge_sorted, merge_sorted_list
+        rng = random.Random(23)
+        passed = 0
+        total = 0
+        for _ in range(300):
+            k = rng.randint(0, 6)
+            span = rng.choice([3, 100, 10 ** 6])
+            inputs = [sorted(rng.randint(-span, span) for _ in range(rng.randint(0, 200)))
+                      for _ in range(k)]
+            expected = sorted(itertools.chain(*inputs))
+            # Blocks of consecutive values exercise the galloping path
+            if rng.random() < 0.3:
+                inputs = [list(range(i * 100, (i + 1) * 100)) for i in range(k)]
+                expected = sorted(itertools.chain(*inputs))
+                rng.shuffle(inputs)
+            kinds = [rng.choice([list, tuple, lambda v: array('i', v)]) for _ in inputs]
+            sequences = [kind(v) for kind, v in zip(kinds, inputs)]
+            descending = [kind(v[::-1]) for kind, v in zip(kinds, inputs)]
+            total += 1
+            passed += int(list(merge_sorted(*sequences)) == expected
+                          and merge_sorted_list(*descending, ascending=False) == expected[::-1]
+                          and list(merge_sorted(*map(iter, descending), ascending=False))
+                          == expected[::-1])
+
+        # Iterators are consumed lazily, so unbounded inputs can be merged
+        total += 1
+        passed += int(list(itertools.islice(merge_sorted(itertools.count(0, 2), [1, 3, 5]), 6))
+                      == [0, 1, 2, 3, 4, 5])
+
+        status = "✓ PASS" if passed == total else "✗ FAIL"
+        print(f"  {'merge_sorted':<20} {passed}/{total} {status}")
+        self.total_passed += passed
+        self.total_failed += total - passed
+
     def test_error_handling(self):
         """Test error handling"""
         print("\nTesting Error Handling:")
         
         factory = SortingFactory()
         tests_passed = 0
-        tests_total = 3
+        tests_total = 6
         
         # Test invalid algorithm
         try:
@@ -158,9 +947,155 @@ class TestSortingAlgorithms:
             print("  Non-list input: ✓ PASS")
             tests_passed += 1
         
+        # Test invalid backend
+        try:
+            factory.sort('bubble', [1, 2, 3], backend='invalid')
+            print("  Invalid backend: ✗ FAIL")
+        except ValueError:
+            print("  Invalid backend: ✓ PASS")
+            tests_passed += 1
+        
+        # Test out-of-range elements
+        try:
+            factory.sort('radix', [1, 2147483648, 3])
+            print("  INT32 overflow: ✗ FAIL")
+        except ValueError:
+            print("  INT32 overflow: ✓ PASS")
+            tests_passed += 1
+        
+        # Test oversized input
+        try:
+            factory.sort('radix', [0] * 200001)
+            print("  Oversized input: ✗ FAIL")
+        except ValueError:
+            print("  Oversized input: ✓ PASS")
+            tests_passed += 1
+        
         self.total_passed += tests_passed
         self.total_failed += (tests_total - tests_passed)
     
+    def test_block_merge(self):
+        """Test the in-place block merge sort: stability and bounded memory"""
+        print("\nTesting Block Merge Sort:")
+
+        import random
+        import tracemalloc
+        from array import array
+        from src.block_merge_sort import CACHE_SIZE
+
+        class Record:
+            """Value compared by key only, remembering its input position"""
+            def __init__(self, key, position):
+                self.key = key
+                self.position = position
+            def __lt__(self, other):
+                return self.key < other.key
+            def __le__(self, other):
+                return self.key <= other.key
+            def __gt__(self, other):
+                return self.key > other.key
+            def __ge__(self, other):
+                return self.key >= other.key
+
+        algorithm = BlockMergeSort()
+        rng = random.Random(24)
+        passed = 0
+        total = 0
+        # Sizes around and well past the cache exercise the SymMerge splits
+        for n in (CACHE_SIZE - 1, CACHE_SIZE + 1, 3 * CACHE_SIZE + 7, 20000):
+            for span in (5, 10 ** 6):
+                values = [rng.randint(-span, span) for _ in range(n)]
+                for ascending in (True, False):
+                    expected = sorted(values, reverse=not ascending)
+                    buffer = memoryview(array('i', values))
+                    total += 2
+                    passed += int(algorithm.sort(values, ascending) == expected)
+                    passed += int(algorithm.sort(buffer, ascending, inplace=True).tolist()
+                                  == expected)
+                records = [Record(value, i) for i, value in enumerate(values)]
+                for ascending in (True, False):
+                    expected = sorted(records, key=lambda r: r.key, reverse=not ascending)
+                    result = algorithm.sort(records, ascending)
+                    total += 1
+                    passed += int([r.position for r in result]
+                                  == [r.position for r in expected])
+
+        # Sorting in place allocates a few cache-sized temporaries, not O(n)
+        values = array('i', (rng.randint(-10 ** 6, 10 ** 6) for _ in range(50000)))
+        tracemalloc.start()
+        algorithm.sort(values, inplace=True)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        total += 1
+        passed += int(peak < 8 * CACHE_SIZE * values.itemsize + 16384
+                      and values.tolist() == sorted(values))
+
+        status = "✓ PASS" if passed == total else "✗ FAIL"
+        print(f"  {'block_merge':<20} {passed}/{total} {status}")
+        self.total_passed += passed
+        self.total_failed += total - passed
+
+    def test_complexity(self):
+        """Test exponent fitting, the antiqsort adversary and flagging"""
+        print("\nTesting Complexity Profiler:")
+
+        from src.adversarial import antiqsort
+        from src.complexity import (expected_exponent, fit_exponent, geometric_sizes,
+                                    profile_algorithm, profile_complexity)
+        from src.instrumentation import instrumented_sort
+        passed = 0
+        total = 0
+
+        sizes = geometric_sizes(64, 2, 4)
+        total += 4
+        passed += int(sizes == [64, 128, 256, 512])
+        passed += int(abs(fit_exponent(sizes, [3 * n ** 2 for n in sizes]) - 2) < 1e-9)
+        passed += int(abs(expected_exponent('n', sizes) - 1) < 1e-9)
+        passed += int(1 < expected_exponent('n log n', sizes) < 1.25)
+
+        # The adversary's input is a permutation that drives Lomuto
+        # quicksort quadratic but leaves merge sort alone
+        n = 256
+        total += 2
+        killer = antiqsort(QuickSort(), n)
+        passed += int(sorted(killer) == list(range(n)))
+        passed += int(instrumented_sort(QuickSort(), killer)[1].comparisons >= n * (n - 1) // 2 - n
+                      and instrumented_sort(MergeSort(), antiqsort(MergeSort(), n))[1].comparisons
+                      < n * 10)
+
+        # Comparison counts are deterministic, so the verdicts are stable
+        flags = [(QuickSort(), 'sorted', True), (QuickSort(), 'antiqsort', True),
+                 (QuickSort(), 'random', False), (MergeSort(), 'antiqsort', False),
+                 (BubbleSort(), 'random', False)]
+        for algorithm, input_name, expected in flags:
+            result = profile_algorithm(algorithm, input_name, sizes, metric='comparisons')
+            total += 1
+            passed += int(result['flagged'] == expected and len(result['sizes']) >= 2)
+        total += 1
+        result = profile_algorithm(RadixSort(), 'antiqsort', sizes, metric='comparisons')
+        passed += int(result['error'] == 'not applicable' and not result['flagged'])
+        total += 1
+        results = profile_complexity(['tim', 'quick'], ['sorted'], sizes, metric='comparisons')
+        passed += int([(r['name'], r['flagged']) for r in results]
+                      == [('tim', False), ('quick', True)])
+
+        for call in (lambda: geometric_sizes(64, 1, 4),
+                     lambda: fit_exponent([10], [1.0]),
+                     lambda: expected_exponent('n!', sizes),
+                     lambda: profile_algorithm(QuickSort(), 'unknown', sizes),
+                     lambda: profile_algorithm(QuickSort(), 'random', sizes, metric='bytes'),
+                     lambda: profile_complexity(['unknown'], ['random'], sizes)):
+            total += 1
+            try:
+                call()
+            except ValueError:
+                passed += 1
+
+        status = "✓ PASS" if passed == total else "✗ FAIL"
+        print(f"  {'complexity':<20} {passed}/{total} {status}")
+        self.total_passed += passed
+        self.total_failed += total - passed
+
     def run_all_tests(self):
         """Run all test suites"""
         print("=" * 60)
@@ -170,6 +1105,26 @@ class TestSortingAlgorithms:
         self.test_ascending_order()
         self.test_descending_order()
         self.test_factory()
+        self.test_large_inputs()
+        self.test_distributions()
+        self.test_instrumentation()
+        self.test_numpy_backend()
+        self.test_validation()
+        self.test_external_sort()
+        self.test_inplace()
+        self.test_key_sort()
+        self.test_auto_selection()
+        self.test_batch_io()
+        self.test_sort_many()
+        self.test_order_statistics()
+        self.test_sorted_container()
+        self.test_result_cache()
+        self.test_registry()
+        self.test_array_backend()
+        self.test_argsort()
+        self.test_merge_sorted()
+        self.test_block_merge()
+        self.test_complexity()
         self.test_error_handling()
         
         print("\n" + "=" * 60)